@@ -1,10 +1,12 @@
 from os import stat
-from beautifultable import BeautifulTable
 from termcolor import colored, cprint
 import pandas as pd
 import os
 import numpy as np
 
+from Edge_Entities.Variate_Buffer import Variate_Buffer
+from Edge_Entities.Random_Streams import Random_Streams
+
 
 class Data_Source:
     # The names of the attributes in this object
@@ -16,6 +18,10 @@ class Data_Source:
         "Burst_Num_Packets",
     ]
 
+    # The number of values drawn each time by the buffers of a flow, a flow draws much fewer values than the
+    # Variate_Buffer.BLOCK_SIZE and there is one buffer for each flow and variate
+    FLOW_BLOCK_SIZE = 256
+
     def __init__(self, name, packet_size, packet_interval, packets_burst_interval, packets_burst_size):
         """
         The data source will define how the packets will be generated to be executed in the SFC.
@@ -34,20 +40,50 @@ class Data_Source:
         self.packets_burst_interval = packets_burst_interval
         self.packets_burst_size = packets_burst_size
 
-    def get_packet_size(self):
-        return np.random.poisson(self.packet_size)
+        # (flow, attr) -> Variate_Buffer, only used if NSS_VARIATE_BUFFERS or NSS_RANDOM_STREAMS is enabled
+        self.variate_buffers = {}
+
+    def get_variate(self, attr, flow):
+        """Return a Poisson value with the mean defined by the attribute
+
+        Each flow (the SFC Request that generates the packets) has its own values, thus the values of a flow do
+        not depend on the other flows of the same data source (e.g. the flows accepted by the placement).
+
+        Args:
+            attr (str): The attribute name, e.g. packet_size
+            flow (str): The name of the SFC Request
+        """
+        if not Variate_Buffer.enabled and not Random_Streams.enabled:
+            return np.random.poisson(getattr(self, attr))
+
+        if (flow, attr) not in self.variate_buffers:
+            key = "sfc_request/{}/{}".format(flow, attr)
+            stream = Random_Streams.PACKET_SIZES if attr == "packet_size" else Random_Streams.ARRIVALS
+            self.variate_buffers[(flow, attr)] = Variate_Buffer(key, getattr(self, attr), block_size=Data_Source.FLOW_BLOCK_SIZE,
+                generator=Random_Streams.generator(stream, key))
+
+        return self.variate_buffers[(flow, attr)].next()
+
+    def close_flow(self, flow):
+        """Remove the buffers of the flow that stopped generating packets"""
+        for attr in ["packet_size", "packet_interval", "packets_burst_interval", "packets_burst_size"]:
+            self.variate_buffers.pop((flow, attr), None)
+
+    def get_packet_size(self, flow):
+        return self.get_variate("packet_size", flow)
 
-    def get_packet_interval(self):
-        return np.random.poisson(self.packet_interval)
+    def get_packet_interval(self, flow):
+        return self.get_variate("packet_interval", flow)
 
-    def get_packets_burst_interval(self):
-        return np.random.poisson(self.packets_burst_interval)
+    def get_packets_burst_interval(self, flow):
+        return self.get_variate("packets_burst_interval", flow)
 
-    def get_packets_burst_size(self):
-        return np.random.poisson(self.packets_burst_size)
+    def get_packets_burst_size(self, flow):
+        return self.get_variate("packets_burst_size", flow)
 
     def show(self):
         cprint("Data Source [{}] Details".format(self.name), "blue", attrs=['bold'])
+        from beautifultable import BeautifulTable
         table = BeautifulTable()
         table.rows.append([self.name])
         table.rows.append(["{} IP".format(self.packet_size)])
@@ -93,6 +129,7 @@ class Data_Source:
     @staticmethod
     def list(data_sources):
         print("Data Sources (total: {})".format(len(data_sources)))
+        from beautifultable import BeautifulTable
         table = BeautifulTable()
 
         table.columns.header = Data_Source.attr_names
@@ -1,8 +1,8 @@
-from beautifultable import BeautifulTable
 from termcolor import cprint
 import pandas as pd
 import os
-import random
+
+from Edge_Entities.Random_Streams import Random_Streams
 
 
 class Link:
@@ -85,6 +85,7 @@ class Link:
 
     def show(self):
         cprint("Link [{}] Details".format(self.name), "blue", attrs=['bold'])
+        from beautifultable import BeautifulTable
         table = BeautifulTable()
         table.rows.append([self.name])
         # table.rows.append([self.latency])
@@ -189,13 +190,14 @@ class Link:
 
         link_name = ''
         if len(links_between_nodes) > 0:
-            link_selected = random.choice(links_between_nodes)
+            link_selected = Random_Streams.choice(Random_Streams.PLACEMENT, links_between_nodes)
             link_name = link_selected.name
         return link_name
 
     @staticmethod
     def list(links):
         print("Links (total: {})".format(len(links)))
+        from beautifultable import BeautifulTable
         table = BeautifulTable(150)
         table.columns.header = Link.attr_names
 
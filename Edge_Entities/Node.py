@@ -1,4 +1,3 @@
-from beautifultable import BeautifulTable
 from termcolor import colored, cprint
 import pandas as pd
 import os
@@ -90,6 +89,7 @@ class Node:
 
     def show(self):
         cprint("Node [{}] Details".format(self.name), "blue", attrs=['bold'])
+        from beautifultable import BeautifulTable
         table = BeautifulTable()
         table.rows.append([self.name])
         table.rows.append([self.group])
@@ -144,6 +144,7 @@ class Node:
     @staticmethod
     def list(nodes):
         print("Nodes (total: {})".format(len(nodes)))
+        from beautifultable import BeautifulTable
         table = BeautifulTable(150)
         table.columns.header = Node.attr_names
 
@@ -0,0 +1,167 @@
+import os
+import random
+import zlib
+
+import numpy as np
+
+
+class Random_Streams:
+    """
+    Independent random streams for the sources of randomness of the simulation, thus two simulations with the same
+    seed and different placement or scaling algorithms see the same workload (common random numbers).
+
+    The streams are only used when the environment variable NSS_RANDOM_STREAMS is 1 (see configure), otherwise the
+    global random and np.random are used. The SeedSequence of the simulation seed is spawned in one SeedSequence per
+    stream (STREAMS, always in the same order) and each entity has its own Generator in the stream, seeded with
+    the spawn_key of the stream plus crc32(key), e.g. the arrivals of "sfc_request/sfc_request_1/packet_interval". Thus the
+    values of an entity do not depend on the values drawn by the other entities or the other streams. The draws of a
+    packet (keyed_random and keyed_poisson) do not have a Generator, each value is derived from the key itself, e.g.
+    (sfc_request, packet_id, vnf), thus it does not depend on the order in which the packets are processed.
+    """
+
+    ARRIVALS = "arrivals"
+    PACKET_SIZES = "packet_sizes"
+    REMOTE_DATA = "remote_data"
+    PLACEMENT = "placement"
+    MOBILITY = "mobility"
+
+    STREAMS = [ARRIVALS, PACKET_SIZES, REMOTE_DATA, PLACEMENT, MOBILITY]
+
+    # Defined by configure()
+    enabled = False
+    streams = {}
+
+    # (stream, key) -> Generator
+    generators = {}
+
+    @staticmethod
+    def int_seed(random_seed):
+        """
+        Return the int seed used by numpy. The seed of the simulation can be any value accepted by random.seed,
+        the numbers (int or numeric str) are used as they are and the other values are converted by crc32
+
+        Args:
+            random_seed (str|int): The random seed of the simulation
+        """
+        try:
+            return int(random_seed)
+        except ValueError:
+            return zlib.crc32(str(random_seed).encode())
+
+    @staticmethod
+    def configure(random_seed):
+        """Enable the streams if NSS_RANDOM_STREAMS is 1 and spawn them from the seed
+
+        Args:
+            random_seed (str|int): The random seed of the simulation (of the round)
+        """
+        Random_Streams.enabled = False
+        try:
+            if os.environ["NSS_RANDOM_STREAMS"] == "1":
+                Random_Streams.enabled = True
+        except KeyError as ke:
+            pass
+
+        seed_sequences = np.random.SeedSequence(Random_Streams.int_seed(random_seed)).spawn(len(Random_Streams.STREAMS))
+        Random_Streams.streams = dict(zip(Random_Streams.STREAMS, seed_sequences))
+        Random_Streams.generators = {}
+
+    @staticmethod
+    def generator(stream, key=""):
+        """
+        Return the Generator of the entity in the stream, or None if the streams are not enabled
+
+        Args:
+            stream (str): One of the STREAMS
+            key (str, optional): Identifies the entity, e.g. the VNF name. Defaults to "".
+        """
+        if not Random_Streams.enabled:
+            return None
+
+        if (stream, key) not in Random_Streams.generators:
+            seed_sequence = Random_Streams.streams[stream]
+            Random_Streams.generators[(stream, key)] = np.random.Generator(np.random.PCG64(np.random.SeedSequence(
+                entropy=seed_sequence.entropy,
+                spawn_key=seed_sequence.spawn_key + (zlib.crc32(key.encode()),)
+            )))
+
+        return Random_Streams.generators[(stream, key)]
+
+    @staticmethod
+    def key_words(key):
+        """Return the words of the key used in the spawn_key, the int parts are used as they are and the others by crc32
+
+        Args:
+            key (tuple): The parts of the key, e.g. ("sfc_request_1", 10, "vnf_1")
+        """
+        return tuple(part if isinstance(part, int) and part >= 0 else zlib.crc32(str(part).encode()) for part in key)
+
+    @staticmethod
+    def keyed_random(stream, key):
+        """
+        Return a float in [0, 1) that only depends on the stream and the key, like random.random(). The same key
+        always returns the same value, thus each draw must have its own key
+
+        Args:
+            stream (str): One of the STREAMS
+            key (tuple): Identifies the draw, e.g. (sfc_request, packet_id, vnf, "remote_data_access")
+        """
+        if not Random_Streams.enabled:
+            return random.random()
+
+        seed_sequence = Random_Streams.streams[stream]
+        state = np.random.SeedSequence(
+            entropy=seed_sequence.entropy,
+            spawn_key=seed_sequence.spawn_key + Random_Streams.key_words(key)
+        ).generate_state(1, np.uint64)[0]
+
+        # 53 bits, like the random() of the Generators
+        return int(state >> np.uint64(11)) * (1.0 / 9007199254740992.0)
+
+    @staticmethod
+    def keyed_poisson(stream, lam, key):
+        """
+        Return a Poisson value with mean lam that only depends on the stream and the key (see keyed_random), by the
+        inversion of the cumulative distribution, which is fast for the small means of the packets
+
+        Args:
+            stream (str): One of the STREAMS
+            lam (float): The mean
+            key (tuple): Identifies the draw, e.g. (sfc_request, packet_id, vnf, "remote_data_access_prob")
+        """
+        if not Random_Streams.enabled:
+            return np.random.poisson(lam)
+
+        if lam > 30:
+            seed_sequence = Random_Streams.streams[stream]
+            return int(np.random.Generator(np.random.PCG64(np.random.SeedSequence(
+                entropy=seed_sequence.entropy,
+                spawn_key=seed_sequence.spawn_key + Random_Streams.key_words(key)
+            ))).poisson(lam))
+
+        u = Random_Streams.keyed_random(stream, key)
+        k = 0
+        p = np.exp(-lam)
+        cdf = p
+        while u > cdf:
+            k += 1
+            p = p * lam / k
+            cdf += p
+
+        return k
+
+    @staticmethod
+    def random(stream, key=""):
+        """Return a float in [0, 1) from the stream, like random.random()"""
+        if not Random_Streams.enabled:
+            return random.random()
+
+        return float(Random_Streams.generator(stream, key).random())
+
+    @staticmethod
+    def choice(stream, seq, key=""):
+        """Return a random element of the non empty sequence from the stream, like random.choice()"""
+        if not Random_Streams.enabled:
+            return random.choice(seq)
+
+        return seq[int(Random_Streams.generator(stream, key).integers(len(seq)))]
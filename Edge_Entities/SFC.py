@@ -1,4 +1,3 @@
-from beautifultable import BeautifulTable
 from termcolor import colored, cprint
 import pandas as pd
 import os
@@ -38,6 +37,7 @@ class SFC:
 
     def show(self):
         cprint("SFC [{}] Details".format(self.name), "blue", attrs=['bold'])
+        from beautifultable import BeautifulTable
         table = BeautifulTable()
         table.rows.append([self.name])
         table.rows.append(["{} ms".format(self.max_latency)])
@@ -82,6 +82,7 @@ class SFC:
     @staticmethod
     def list(sfcs):
         print("SFC Types (total: {})".format(len(sfcs)))
+        from beautifultable import BeautifulTable
         table = BeautifulTable(150)
         table.columns.header = SFC.attr_names
         for sfc in sfcs:
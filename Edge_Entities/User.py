@@ -1,4 +1,3 @@
-from beautifultable import BeautifulTable
 from termcolor import colored, cprint
 import pandas as pd
 import os
@@ -67,6 +66,7 @@ class User:
 
     def show(self):
         cprint("User [{}] Details".format(self.name), "blue", attrs=['bold'])
+        from beautifultable import BeautifulTable
         table = BeautifulTable()
         table.rows.append([self.name])
         table.rows.append([self.node.name])
@@ -119,6 +119,7 @@ class User:
     @staticmethod
     def list(users):
         print("Users (total: {})".format(len(users)))
+        from beautifultable import BeautifulTable
         table = BeautifulTable(150)
         table.columns.header = User.attr_names
 
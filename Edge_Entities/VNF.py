@@ -1,7 +1,10 @@
-from beautifultable import BeautifulTable
 from termcolor import colored, cprint
 import pandas as pd
 import os
+import numpy as np
+
+from Edge_Entities.Variate_Buffer import Variate_Buffer
+from Edge_Entities.Random_Streams import Random_Streams
 
 
 class VNF:
@@ -62,11 +65,37 @@ class VNF:
         self.max_packet_queue = max_packet_queue
         self.resource_intensive = resource_intensive
 
+        # Only used if NSS_VARIATE_BUFFERS or NSS_RANDOM_STREAMS is enabled
+        self.remote_data_access_buffer = None
+
+    def get_remote_data_access(self, packet_key=None):
+        """
+        Return a Poisson value with mean remote_data_access_prob, used to define if the packet accesses the remote data
+
+        Args:
+            packet_key (tuple, optional): Identifies the packet, (sfc_request, packet_id), with NSS_RANDOM_STREAMS the
+                value of each packet in the VNF only depends on it. Defaults to None.
+        """
+        if not Variate_Buffer.enabled and not Random_Streams.enabled:
+            return np.random.poisson(self.remote_data_access_prob)
+
+        if Random_Streams.enabled and packet_key is not None:
+            return Random_Streams.keyed_poisson(Random_Streams.REMOTE_DATA, self.remote_data_access_prob,
+                packet_key + (self.name, "remote_data_access_prob"))
+
+        if self.remote_data_access_buffer is None:
+            key = "vnf/{}/remote_data_access_prob".format(self.name)
+            self.remote_data_access_buffer = Variate_Buffer(key, self.remote_data_access_prob,
+                generator=Random_Streams.generator(Random_Streams.REMOTE_DATA, key))
+
+        return self.remote_data_access_buffer.next()
+
     def __str__(self):
         return str(self.__class__) + ": " + str(self.__dict__)
 
     def show(self):
         cprint("VNF [{}] Details".format(self.name), "blue", attrs=['bold'])
+        from beautifultable import BeautifulTable
         table = BeautifulTable()
         table.rows.append([self.name])
         table.rows.append(["{} IPT".format(self.cpu)])
@@ -132,6 +161,7 @@ class VNF:
     def list(vnfs):
         print("VNF Types (total: {})".format(len(vnfs)))
 
+        from beautifultable import BeautifulTable
         table = BeautifulTable(150)
 
         table.columns.header = VNF.attr_names
@@ -0,0 +1,74 @@
+import os
+import zlib
+
+import numpy as np
+
+from Edge_Entities.Random_Streams import Random_Streams
+
+
+class Variate_Buffer:
+    """
+    Buffer of Poisson variates drawn in blocks from a dedicated numpy Generator, instead of calling
+    np.random.poisson for a single value each time.
+
+    The buffers are only used when the environment variable NSS_VARIATE_BUFFERS is 1 (see configure). Each
+    buffer has its own Generator seeded with SeedSequence(entropy=random_seed, spawn_key=(crc32(key),)), where
+    random_seed is the seed of the simulation (--random_seed) and key identifies the owner and the variate,
+    e.g. "sfc_request/sfc_request_1/packet_size" or "vnf/v_1/remote_data_access_prob". Thus the values of a buffer do not
+    depend on the order that the buffers are created or used, and the same seed generates the same values.
+    """
+
+    # Number of values drawn each time the buffer is empty
+    BLOCK_SIZE = 4096
+
+    # Defined by configure()
+    enabled = False
+    random_seed = 0
+
+    @staticmethod
+    def configure(random_seed):
+        """Enable the buffers if NSS_VARIATE_BUFFERS is 1 and define the seed used by them
+
+        Args:
+            random_seed (str|int): The random seed of the simulation
+        """
+        Variate_Buffer.random_seed = Random_Streams.int_seed(random_seed)
+        Variate_Buffer.enabled = False
+        try:
+            if os.environ["NSS_VARIATE_BUFFERS"] == "1":
+                Variate_Buffer.enabled = True
+        except KeyError as ke:
+            pass
+
+    def __init__(self, key, lam, block_size=BLOCK_SIZE, generator=None):
+        """
+        Args:
+            key (str): The owner and the variate, used to seed the Generator
+            lam (float): The expected value of the Poisson distribution
+            block_size (int, optional): The number of values drawn each time. Defaults to BLOCK_SIZE.
+            generator (Generator, optional): The Generator of a Random_Streams stream. Defaults to None.
+        """
+        self.key = key
+        self.lam = lam
+        self.block_size = block_size
+
+        self.generator = generator
+        if self.generator is None:
+            seed_sequence = np.random.SeedSequence(
+                entropy=Variate_Buffer.random_seed,
+                spawn_key=(zlib.crc32(key.encode()),)
+            )
+            self.generator = np.random.Generator(np.random.PCG64(seed_sequence))
+
+        self.values = []
+        self.position = 0
+
+    def next(self):
+        """Return the next value, a new block is drawn when the buffer is empty"""
+        if self.position == len(self.values):
+            self.values = self.generator.poisson(self.lam, self.block_size).tolist()
+            self.position = 0
+
+        value = self.values[self.position]
+        self.position += 1
+        return value
@@ -1,10 +1,12 @@
 import random
 import pandas as pd
+import numpy as np
 import os
 import csv
 import json
+import hashlib
+import pickle
 
-from beautifultable import BeautifulTable
 from termcolor import cprint
 
 from Edge_Entities.VNF import VNF
@@ -18,6 +20,8 @@ from Simulation_Entities.SFC_Request import SFC_Request
 from Simulation_Entities.SFC_Instance import SFC_Instance
 from Placement.SfcPriority import SfcPriority
 
+import Result_Cache
+
 
 class Edge_Environment:
 
@@ -58,6 +62,9 @@ class Edge_Environment:
 
         self.sfc_requests_waiting_replacement = {}
         self.replacement_schedule = {}
+
+        # Function called with the time when a SFC Request is scheduled for replacement
+        self.replacement_listener = None
         self.max_replacement_retries = max_replacement_retries
         self.replacement_backoff_slot_size = replacement_backoff_slot_size
 
@@ -67,6 +74,66 @@ class Edge_Environment:
         # The number total os sfc_instances that were created
         self.sfc_instances_counter = 0
 
+    @staticmethod
+    def cached(cache_path, name, specs, random_seed, total_time, time_window, max_replacement_retries, replacement_backoff_slot_size):
+        """
+        Load the Edge Environment from a pickle file in the cache_path, or create it and save it in the cache
+
+        The file is keyed by the hash of all the parameters (the specs content and the random seed with its type,
+        random.seed generates different values for "1" and 1) and the code version (see Result_Cache). The states
+        of the random and numpy random generators after the creation are saved with the environment and restored
+        by the load, thus the simulation that follows is identical to the one with a new environment.
+
+        Args:
+            cache_path (str): The folder of the cache
+            name, specs, random_seed, total_time, time_window, max_replacement_retries,
+            replacement_backoff_slot_size: The same parameters of the Edge_Environment
+
+        Returns:
+            Edge_Environment: The edge environment
+        """
+        params = {
+            "name": name,
+            "specs": specs,
+            "random_seed": Result_Cache.seed_key(random_seed),
+            "total_time": total_time,
+            "time_window": time_window,
+            "max_replacement_retries": max_replacement_retries,
+            "replacement_backoff_slot_size": replacement_backoff_slot_size,
+            "code": Result_Cache.code_version()
+        }
+        key = hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()
+        file_name = os.path.join(cache_path, "{}.pickle".format(key))
+
+        try:
+            with open(file_name, "rb") as file:
+                edge_environment, random_state, np_random_state = pickle.load(file)
+
+            random.setstate(random_state)
+            np.random.set_state(np_random_state)
+            return edge_environment
+        except (OSError, EOFError, pickle.UnpicklingError):
+            pass
+
+        edge_environment = Edge_Environment(
+            name=name,
+            specs=specs,
+            random_seed=random_seed,
+            total_time=total_time,
+            time_window=time_window,
+            max_replacement_retries=max_replacement_retries,
+            replacement_backoff_slot_size=replacement_backoff_slot_size
+        )
+
+        # Write in a temporary file first, the rounds running in parallel can create the same environment
+        os.makedirs(cache_path, exist_ok=True)
+        file_name_tmp = "{}.{}.tmp".format(file_name, os.getpid())
+        with open(file_name_tmp, "wb") as file:
+            pickle.dump((edge_environment, random.getstate(), np.random.get_state()), file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(file_name_tmp, file_name)
+
+        return edge_environment
+
     def calc_bw_available_link(self, link_name):
         """
         Calculate how much of the total link bandwidth is available in the link
@@ -129,6 +196,9 @@ class Edge_Environment:
         else:
             self.replacement_schedule[time_now] = [sfc_request]
 
+        if self.replacement_listener:
+            self.replacement_listener(time_now)
+
     def is_waiting_placement(self, sfc_request_name):
         return sfc_request_name in self.sfc_requests_waiting_replacement
 
@@ -190,6 +260,7 @@ class Edge_Environment:
     def sfc_similarity_matrix(self):
         """Print a matrix with the similarity between the SFCs
         """
+        from beautifultable import BeautifulTable
         table = BeautifulTable(180)
 
         column_name = [" "]
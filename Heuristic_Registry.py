@@ -0,0 +1,214 @@
+import importlib
+import json
+
+# The kinds of heuristic, each one is a block of the simulation parameters file and a package
+PLACEMENT = "Placement"
+SCALING = "Scaling"
+
+
+class Parameter:
+    """The schema of a heuristic parameter, used to validate and convert the value of the simulation parameters file"""
+
+    def __init__(self, type):
+        """
+        Args:
+            type (type): int, float, str or dict
+        """
+        self.type = type
+
+    def convert(self, value):
+        """
+        Convert the value to the parameter type
+
+        Returns:
+            tuple: (value, error), the error is None if the value is valid
+        """
+        if self.type == dict:
+            if isinstance(value, str):
+                try:
+                    value = json.loads(value.replace("'", "\""))
+                except ValueError:
+                    pass
+            if isinstance(value, dict):
+                return value, None
+            return None, "expected an object, got {!r}".format(value)
+
+        if isinstance(value, (dict, list, bool)) or value is None:
+            return None, "expected {}, got {!r}".format(self.type.__name__, value)
+
+        if self.type == str:
+            return str(value), None
+
+        try:
+            if self.type == int and isinstance(value, float):
+                if not value.is_integer():
+                    raise ValueError()
+                return int(value), None
+            return self.type(value), None
+        except ValueError:
+            return None, "expected {}, got {!r}".format(self.type.__name__, value)
+
+
+# The heuristics of each kind, the module is only imported by get_class (the first lookup)
+# "parameters" is the schema of the parameters block in the simulation parameters file, all of them are required
+HEURISTICS = {
+    PLACEMENT: {},
+    SCALING: {}
+}
+
+# Cache of the classes already imported
+classes = {}
+
+
+def register(kind, name, module, parameters=None):
+    """
+    Register a heuristic, the class must have the same name of the heuristic
+
+    Args:
+        kind (str): PLACEMENT or SCALING
+        name (str): The name used in the "heuristic" of the simulation parameters file
+        module (str): The module of the class, e.g. Placement.SmartPlacement
+        parameters (dict, optional): Parameter name -> Parameter. Defaults to None.
+    """
+    HEURISTICS[kind][name] = {
+        "module": module,
+        "parameters": parameters or {}
+    }
+
+
+def validate(kind, config):
+    """
+    Validate a heuristic block of the simulation parameters file ({"heuristic": ..., "parameters": {...}})
+
+    Args:
+        kind (str): PLACEMENT or SCALING
+        config (dict): The heuristic block
+
+    Returns:
+        tuple: (name, parameters, errors), the parameters converted to their types and the list of errors
+    """
+    name = config.get("heuristic", "")
+    if name not in HEURISTICS[kind]:
+        return name, {}, ["Unknown {} heuristic {!r}, the options are: {}".format(
+            kind.lower(), name, ", ".join(sorted(HEURISTICS[kind])))]
+
+    schema = HEURISTICS[kind][name]["parameters"]
+    values = config.get("parameters", {}) or {}
+
+    errors = []
+    parameters = {}
+    for key, value in values.items():
+        if key not in schema:
+            errors.append("{}: unknown parameter {!r}".format(name, key))
+            continue
+
+        parameters[key], error = schema[key].convert(value)
+        if error is not None:
+            errors.append("{}: parameter {!r} {}".format(name, key, error))
+
+    for key in schema:
+        if key not in values:
+            errors.append("{}: missing parameter {!r}".format(name, key))
+
+    return name, parameters, errors
+
+
+def get_class(kind, name):
+    """Return the class of the heuristic, its module is imported in the first lookup"""
+    if (kind, name) not in classes:
+        module = importlib.import_module(HEURISTICS[kind][name]["module"])
+        classes[(kind, name)] = getattr(module, name)
+
+    return classes[(kind, name)]
+
+
+def create(kind, name, parameters, **kwargs):
+    """
+    Create the heuristic object
+
+    Args:
+        kind (str): PLACEMENT or SCALING
+        name (str): The heuristic name
+        parameters (dict): The parameters returned by validate
+        kwargs: The objects of the simulation passed to the heuristic (e.g. env, edge_environment and sd)
+    """
+    return get_class(kind, name)(**kwargs, **parameters)
+
+
+# Placement heuristics, they receive the edge environment and sfc_instance_sharable
+register(PLACEMENT, "SmartPlacement", "Placement.SmartPlacement")
+register(PLACEMENT, "GreedyPlacement", "Placement.GreedyPlacement")
+register(PLACEMENT, "RandomPlacement", "Placement.RandomPlacement")
+
+# Scaling heuristics, they receive env, edge_environment and sd
+register(SCALING, "BasicCPUScaling", "Scaling.BasicCPUScaling", {
+    "cpu_load_max": Parameter(float),
+    "cpu_load_min": Parameter(float),
+    "resource_increment": Parameter(float),
+    "resource_decrement": Parameter(float),
+    "monitor_interval": Parameter(int),
+    "waiting_time_between_scalings_ups": Parameter(int)
+})
+
+register(SCALING, "SmartVerticalScalingUp", "Scaling.SmartVerticalScalingUp", {
+    "resource_increment": Parameter(float),
+    "monitor_interval": Parameter(int),
+    "monitor_window_size": Parameter(int),
+    "cpu_node_available_importance": Parameter(float),
+    "mem_node_available_importance": Parameter(float),
+    "prioritize_nodes_with_more_resource_available": Parameter(int),
+    "cpu_vnf_load_importance": Parameter(float),
+    "mem_vnf_load_importance": Parameter(float),
+    "load_vnf_instance_limit": Parameter(float),
+    "acceptable_sla_violation_rate": Parameter(dict),
+    "waiting_time_between_scaling_ups": Parameter(int)
+})
+
+register(SCALING, "TCPInspiredVerticalScalingUp", "Scaling.TCPInspiredVerticalScalingUp", {
+    "resource_increment": Parameter(float),
+    "monitor_interval": Parameter(int),
+    "monitor_window_size": Parameter(int),
+    "cpu_node_available_importance": Parameter(float),
+    "mem_node_available_importance": Parameter(float),
+    "prioritize_nodes_with_more_resource_available": Parameter(int),
+    "cpu_vnf_load_importance": Parameter(float),
+    "mem_vnf_load_importance": Parameter(float),
+    "load_vnf_instance_limit": Parameter(float),
+    "acceptable_sla_violation_rate": Parameter(dict),
+    "waiting_time_between_scaling_ups": Parameter(int),
+    "threshold": Parameter(float)
+})
+
+register(SCALING, "SmartVerticalScalingDown", "Scaling.SmartVerticalScalingDown", {
+    "resource_decrement": Parameter(float),
+    "monitor_interval": Parameter(int),
+    "monitor_window_size": Parameter(int),
+    "cpu_node_available_importance": Parameter(float),
+    "mem_node_available_importance": Parameter(float),
+    "prioritize_nodes_with_more_resource_available": Parameter(int),
+    "cpu_vnf_load_importance": Parameter(float),
+    "mem_vnf_load_importance": Parameter(float),
+    "load_vnf_instance_limit": Parameter(float),
+    "load_metric_importance": Parameter(float),
+    "process_contribution_importance": Parameter(float),
+    "resource_available_importance": Parameter(float),
+    "waiting_time_between_scaling_ups": Parameter(int)
+})
+
+register(SCALING, "SmartQueueScaling", "Scaling.SmartQueueScaling", {
+    "resource_increment": Parameter(float),
+    "resource_decrement": Parameter(float),
+    "monitor_interval": Parameter(int),
+    "monitor_window_size": Parameter(int),
+    "acceptable_sla_violation_rate": Parameter(dict),
+    "waiting_time_between_scalings_ups": Parameter(int),
+    "scaling_up_threshold": Parameter(float),
+    "scaling_down_threshold": Parameter(float),
+    "node_cpu_threshold": Parameter(float),
+    "resource_increase_type": Parameter(str),
+    "monitor_control_strategy_type": Parameter(str),
+    "monitor_vnf_cpu_load_threshold": Parameter(float),
+    "monitor_max_window_size": Parameter(int),
+    "resource_decrement_delta": Parameter(float),
+    "scaling_threshold_delta": Parameter(float)
+})
@@ -1,10 +1,9 @@
 import os
 import sys
-import random
 
-from beautifultable import BeautifulTable
 
 from Placement.Placement import Placement
+from Edge_Entities.Random_Streams import Random_Streams
 from Simulation_Entities.VNF_Instance import VNF_Instance
 from Edge_Environment import  Edge_Environment
 
@@ -47,7 +46,7 @@ class GreedyPlacement(Placement):
                 'link_data': link_data
             })
 
-        return random.choice(aux)
+        return Random_Streams.choice(Random_Streams.PLACEMENT, aux)
 
     def execute(self, sfc_requests, sd, time, file_path=""):
         """ Execute the placement for the Greedy heuristic. The node selected will be the
@@ -285,6 +284,7 @@ class GreedyPlacement(Placement):
 
     def show(self):
         print("Greedy Placement Plan")
+        from beautifultable import BeautifulTable
         table = BeautifulTable()
         table.columns.header = ["VNF Instance", "CPU", "Memory", "Node", "SFCs"]
         for aux in self.vnf_instances:
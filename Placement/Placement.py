@@ -1,11 +1,9 @@
-from networkx.classes.function import nodes
 from Simulation_Entities.VNF_Instance import VNF_Instance
 from Edge_Entities.Link import Link
 from collections import defaultdict
 from Edge_Entities.Node import Node
 from Edge_Entities.Link import Link
 import networkx as nx
-import matplotlib.pyplot as plt
 import os
 
 
@@ -227,6 +225,9 @@ class Placement(object):
             pos.update(p)
 
         if file_path:
+            # matplotlib is only imported when the images are saved (NSS_SAVE_IMAGE_PLACEMENT)
+            import matplotlib.pyplot as plt
+
             # create folder if not exist
             if not os.path.exists(file_path):
                 os.makedirs(file_path)
@@ -282,6 +283,7 @@ class Placement(object):
             sfc_instance (SFC Instance): The sfc instance
             file_path (str): The path where the file will be saved
         """
+        import matplotlib.pyplot as plt
 
         if not os.path.exists(file_path):
             os.makedirs(file_path)
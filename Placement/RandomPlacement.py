@@ -1,10 +1,9 @@
 import os
 import sys
-import random
 
-from beautifultable import BeautifulTable
 
 from Placement.Placement import Placement
+from Edge_Entities.Random_Streams import Random_Streams
 from Simulation_Entities.VNF_Instance import VNF_Instance
 from Edge_Environment import  Edge_Environment
 
@@ -46,7 +45,7 @@ class RandomPlacement(Placement):
                 'link_data': link_data
             })
 
-        return random.choice(aux)
+        return Random_Streams.choice(Random_Streams.PLACEMENT, aux)
 
     def execute(self, sfc_requests, sd, time, file_path=""):
         """ Execute the placement for the Greedy heuristic. The node selected will be the
@@ -104,7 +103,7 @@ class RandomPlacement(Placement):
 
                     checked_node.append(node_name)
 
-                selected_node_name = random.choice(checked_node)
+                selected_node_name = Random_Streams.choice(Random_Streams.PLACEMENT, checked_node)
 
                 node_selected = self.environment.nodes[selected_node_name]
 
@@ -253,6 +252,7 @@ class RandomPlacement(Placement):
 
     def show(self):
         print("Greedy Placement Plan")
+        from beautifultable import BeautifulTable
         table = BeautifulTable()
         table.columns.header = ["VNF Instance", "CPU", "Memory", "Node", "SFCs"]
         for aux in self.vnf_instances:
@@ -1,9 +1,8 @@
-import random
 import operator
 
 from Edge_Entities.Link import Link
+from Edge_Entities.Random_Streams import Random_Streams
 from Simulation_Entities.VNF_Instance import VNF_Instance
-from beautifultable import BeautifulTable
 from collections import defaultdict
 
 from Placement.SfcPriority import SfcPriority
@@ -210,7 +209,7 @@ class SmartPlacement(Placement):
                                 (hightest_capacity_instances_among_shortest_latency,
                                  previous_vnf_instance, packet_size, node_source)
                         if len(hightest_energy_instances_among_hightest_capacity) >= 1:
-                            vnf_instance = random.choice(hightest_energy_instances_among_hightest_capacity)
+                            vnf_instance = Random_Streams.choice(Random_Streams.PLACEMENT, hightest_energy_instances_among_hightest_capacity)
                             result = self.map_vnf_instance(vnf_instance, current_vnf, sfc_request, sfc_instance, node_source, previous_vnf_instance)
                 else:
                     # SFC Priority: latency > energy > capacity
@@ -228,7 +227,7 @@ class SmartPlacement(Placement):
                             self.get_available_instances_with_highest_capacity \
                                 (hightest_energy_instances_among_shortest_latency)
                         if len(hightest_capacity_instances_among_hightest_energy) >= 1:
-                            vnf_instance = random.choice(hightest_capacity_instances_among_hightest_energy)
+                            vnf_instance = Random_Streams.choice(Random_Streams.PLACEMENT, hightest_capacity_instances_among_hightest_energy)
                             result = self.map_vnf_instance(vnf_instance, current_vnf, sfc_request, sfc_instance, node_source, previous_vnf_instance)
 
         elif priorities_order[0] == SfcPriority.capacity:
@@ -257,7 +256,7 @@ class SmartPlacement(Placement):
                                 (shortest_latency_instances_among_hightest_capacity,
                                  previous_vnf_instance, packet_size, node_source)
                         if len(shortest_latency_instances_among_hightest_capacity) >= 1:
-                            vnf_instance = random.choice(shortest_latency_instances_among_hightest_capacity)
+                            vnf_instance = Random_Streams.choice(Random_Streams.PLACEMENT, shortest_latency_instances_among_hightest_capacity)
                             result = self.map_vnf_instance(vnf_instance, current_vnf, sfc_request, sfc_instance, node_source, previous_vnf_instance)
 
                 else:
@@ -276,7 +275,7 @@ class SmartPlacement(Placement):
                             self.get_available_instances_with_shortest_latency \
                                 (hightest_energy_instances_among_hightest_capacity, node_source, packet_size)
                         if len(shortest_latency_instances_among_hightest_energy) >= 1:
-                            vnf_instance = random.choice(shortest_latency_instances_among_hightest_energy)
+                            vnf_instance = Random_Streams.choice(Random_Streams.PLACEMENT, shortest_latency_instances_among_hightest_energy)
                             result = self.map_vnf_instance(vnf_instance, current_vnf, sfc_request, sfc_instance, node_source, previous_vnf_instance)
 
         elif priorities_order[0] == SfcPriority.energy:
@@ -306,7 +305,7 @@ class SmartPlacement(Placement):
                             self.get_available_instances_with_highest_capacity \
                                 (shortest_latency_instances_among_hightest_energy)
                         if len(hightest_capacity_instances_among_shortest_latency) >= 1:
-                            vnf_instance = random.choice(hightest_capacity_instances_among_shortest_latency)
+                            vnf_instance = Random_Streams.choice(Random_Streams.PLACEMENT, hightest_capacity_instances_among_shortest_latency)
                             result = self.map_vnf_instance(vnf_instance, current_vnf, sfc_request, sfc_instance, node_source, previous_vnf_instance)
 
                 else:
@@ -324,7 +323,7 @@ class SmartPlacement(Placement):
                                 (hightest_capacity_instances_among_hightest_energy,
                                  node_source, packet_size)
                         if len(shortest_latency_instances_among_hightest_capacity) >= 1:
-                            vnf_instance = random.choice(shortest_latency_instances_among_hightest_capacity)
+                            vnf_instance = Random_Streams.choice(Random_Streams.PLACEMENT, shortest_latency_instances_among_hightest_capacity)
                             result = self.map_vnf_instance(vnf_instance, current_vnf, sfc_request, sfc_instance, node_source, previous_vnf_instance)
 
         return result
@@ -387,7 +386,7 @@ class SmartPlacement(Placement):
                                 (hightest_capacity_nodes_among_shortest_latency,
                                  node_source, packet_size, current_vnf)
                         if len(hightest_energy_nodes_among_hightest_capacity) >= 1:
-                            node_selected = random.choice(hightest_energy_nodes_among_hightest_capacity)
+                            node_selected = Random_Streams.choice(Random_Streams.PLACEMENT, hightest_energy_nodes_among_hightest_capacity)
                             placement_result, vnf_instance = self.create_new_vnf_instance(current_vnf, sfc_request, sfc_instance, node_selected, node_source, previous_vnf_instance)
 
                 else:
@@ -404,7 +403,7 @@ class SmartPlacement(Placement):
                             self.get_nodes_with_highest_capacity \
                                 (hightest_energy_nodes_among_shortest_latency)
                         if len(hightest_capacity_nodes_among_hightest_energy) >= 1:
-                            node_selected = random.choice(hightest_capacity_nodes_among_hightest_energy)
+                            node_selected = Random_Streams.choice(Random_Streams.PLACEMENT, hightest_capacity_nodes_among_hightest_energy)
                             placement_result, vnf_instance = self.create_new_vnf_instance(current_vnf, sfc_request, sfc_instance, node_selected, node_source, previous_vnf_instance)
                         else:
                             print("1")
@@ -441,7 +440,7 @@ class SmartPlacement(Placement):
                                 (shortest_latency_nodes_among_hightest_capacity,
                                  node_source, packet_size, current_vnf)
                         if len(shortest_latency_nodes_among_hightest_capacity) >= 1:
-                            node_selected = random.choice(shortest_latency_nodes_among_hightest_capacity)
+                            node_selected = Random_Streams.choice(Random_Streams.PLACEMENT, shortest_latency_nodes_among_hightest_capacity)
                             placement_result, vnf_instance = self.create_new_vnf_instance(current_vnf, sfc_request, sfc_instance, node_selected, node_source, previous_vnf_instance)
 
                 else:
@@ -459,7 +458,7 @@ class SmartPlacement(Placement):
                             self.get_nodes_with_shortest_latency \
                                 (hightest_energy_nodes_among_hightest_capacity, node_source, packet_size)
                         if len(shortest_latency_nodes_among_hightest_energy) >= 1:
-                            node_selected = random.choice(shortest_latency_nodes_among_hightest_energy)
+                            node_selected = Random_Streams.choice(Random_Streams.PLACEMENT, shortest_latency_nodes_among_hightest_energy)
                             placement_result, vnf_instance = self.create_new_vnf_instance(current_vnf, sfc_request, sfc_instance, node_selected, node_source, previous_vnf_instance)
 
         elif priorities_order[0] == SfcPriority.energy:
@@ -485,7 +484,7 @@ class SmartPlacement(Placement):
                             self.get_nodes_with_highest_capacity \
                                 (shortest_latency_nodes_among_hightest_energy)
                         if len(hightest_capacity_nodes_among_shortest_latency) >= 1:
-                            node_selected = random.choice(hightest_capacity_nodes_among_shortest_latency)
+                            node_selected = Random_Streams.choice(Random_Streams.PLACEMENT, hightest_capacity_nodes_among_shortest_latency)
                             placement_result, vnf_instance = self.create_new_vnf_instance(current_vnf, sfc_request, sfc_instance, node_selected, node_source, previous_vnf_instance)
 
                 else:
@@ -502,7 +501,7 @@ class SmartPlacement(Placement):
                             self.get_nodes_with_shortest_latency \
                                 (hightest_capacity_nodes_among_hightest_energy, node_source, packet_size)
                         if len(shortest_latency_nodes_among_hightest_capacity) >= 1:
-                            node_selected = random.choice(shortest_latency_nodes_among_hightest_capacity)
+                            node_selected = Random_Streams.choice(Random_Streams.PLACEMENT, shortest_latency_nodes_among_hightest_capacity)
                             placement_result, vnf_instance = self.create_new_vnf_instance(current_vnf, sfc_request, sfc_instance, node_selected, node_source, previous_vnf_instance)
 
         # print(current_vnf, sfc_request, sfc_instance)
@@ -819,6 +818,7 @@ class SmartPlacement(Placement):
 
     def show(self):
         print("Placement Plan")
+        from beautifultable import BeautifulTable
         table = BeautifulTable()
         table.columns.header = ["Instance", "CPU", "Memory", "Node", "SFCs"]
         for aux in self.vnf_instances:
@@ -0,0 +1,156 @@
+import datetime
+import fnmatch
+import hashlib
+import json
+import os
+import shutil
+
+# The file written in the path_result_files when all the rounds of the simulation finished
+MARKER = ".complete.json"
+
+# Folders that do not have source code used by the simulation
+IGNORED_FOLDERS = [".git", "venv", "Experiment", "Results", "__pycache__", "tests"]
+
+# Python files that are not used by the simulation (the sweep runner, the cost estimate and the benchmarks)
+IGNORED_FILES = ["run_sweep.py", "Simulation_Estimator.py", "benchmark_*.py"]
+
+# Environment variables that do not change the results, including the instrumentation of the rounds
+IGNORED_ENVIRONMENT = [
+    "NSS_DEBUG", "NSS_ERROR_PATH", "NSS_SAVE_IMAGE_PLACEMENT", "NSS_ENVIRONMENT_CACHE",
+    "NSS_PERF", "NSS_COUNTERS", "NSS_COUNTERS_INTERVAL", "NSS_MEMORY_REPORT", "NSS_MEMORY_REPORT_TIMES"
+]
+
+code_digest = None
+
+
+def file_digest(file_path):
+    """Return the sha256 of the file content or None if there is no file
+
+    Args:
+        file_path (str): The file path
+    """
+    if not file_path or not os.path.isfile(file_path):
+        return None
+
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+
+    return digest.hexdigest()
+
+
+def code_version():
+    """Return the sha256 of the python files of the simulator (except the IGNORED_FOLDERS and IGNORED_FILES),
+    computed once for each process"""
+    global code_digest
+
+    if code_digest is None:
+        path_program = os.path.dirname(os.path.abspath(__file__))
+        digest = hashlib.sha256()
+        for root, folders, files in os.walk(path_program):
+            folders[:] = sorted(aux for aux in folders if aux not in IGNORED_FOLDERS)
+            for name in sorted(files):
+                if name.endswith(".py") and not any(fnmatch.fnmatch(name, pattern) for pattern in IGNORED_FILES):
+                    file_path = os.path.join(root, name)
+                    digest.update(os.path.relpath(file_path, path_program).encode())
+                    digest.update(file_digest(file_path).encode())
+
+        code_digest = digest.hexdigest()
+
+    return code_digest
+
+
+def seed_key(random_seed):
+    """
+    Return the random seed as it is saved in the keys, with its type because random.seed generates different
+    values for "1" and 1
+
+    Args:
+        random_seed (str|int): The random seed
+    """
+    return [type(random_seed).__name__, str(random_seed)]
+
+
+def result_key(specs, simulation_parameters, random_seed, packet_flow_file="", user_mobility_file="", extra=None):
+    """
+    Return the key of a simulation, the hash of all its inputs: the content of the specs, simulation
+    parameters, packet flow and user mobility files, the random seed, the simulation environment variables
+    and the code version
+
+    Args:
+        specs (str): The specs file
+        simulation_parameters (str): The simulation parameters file
+        random_seed (str|int): The random seed
+        packet_flow_file (str, optional): The packet flow file (PATH_PACKET_FLOW_FILE). Defaults to "".
+        user_mobility_file (str, optional): The user mobility file. Defaults to "".
+        extra (dict, optional): Other inputs of the simulation (e.g. the snapshot variants). Defaults to None.
+    Returns:
+        tuple: (key, inputs)
+    """
+    environment = {}
+    for name in sorted(os.environ):
+        if (name.startswith("NSS_") or name == "COMPUTE_LINK_BW_LIMIT") and name not in IGNORED_ENVIRONMENT:
+            environment[name] = os.environ[name]
+
+    inputs = {
+        "specs": file_digest(specs),
+        "simulation_parameters": file_digest(simulation_parameters),
+        "random_seed": seed_key(random_seed),
+        "packet_flow": file_digest(packet_flow_file),
+        "user_mobility": file_digest(user_mobility_file),
+        "environment": environment,
+        "code": code_version()
+    }
+
+    if extra:
+        inputs["extra"] = extra
+
+    key = hashlib.sha256(json.dumps(inputs, sort_keys=True).encode()).hexdigest()
+    return key, inputs
+
+
+def is_complete(path_result_files, key):
+    """Return True if the results in the path were generated by a simulation with the key that finished
+
+    Args:
+        path_result_files (str): The path of the results
+        key (str): The simulation key
+    """
+    try:
+        with open(os.path.join(path_result_files, MARKER)) as file:
+            return json.load(file)["key"] == key
+    except (OSError, ValueError, KeyError):
+        return False
+
+
+def has_partial_results(path_result_files, key):
+    """Return True if there are results in the path that are not complete for the key (e.g. a crashed run)"""
+    return os.path.exists(path_result_files) and not is_complete(path_result_files, key)
+
+
+def remove_results(path_result_files):
+    shutil.rmtree(path_result_files, ignore_errors=True)
+
+
+def mark_complete(path_result_files, key, inputs):
+    """Write the completion marker of the simulation
+
+    Args:
+        path_result_files (str): The path of the results
+        key (str): The simulation key
+        inputs (dict): The inputs used to compute the key
+    """
+    os.makedirs(path_result_files, exist_ok=True)
+
+    marker = {
+        "key": key,
+        "inputs": inputs,
+        "finished_at": datetime.datetime.now().isoformat()
+    }
+
+    # Write in a temporary file first, thus a crash never leaves a marker incomplete
+    file_name = os.path.join(path_result_files, MARKER)
+    with open(file_name + ".tmp", "w") as file:
+        json.dump(marker, file, indent=2)
+    os.replace(file_name + ".tmp", file_name)
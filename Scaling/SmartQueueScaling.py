@@ -3,7 +3,6 @@ from Scaling.RLAgentProcessor import RLAgentProcessor, AgentInstances
 import Edge_Environment
 from Simulation_Data import Simulation_Data
 from Scaling.Scaling import Scaling
-import json
 import pandas as pd
 import numpy as np
 
@@ -50,7 +49,7 @@ class SmartQueueScaling(Scaling):
         self.resource_increment = float(resource_increment)
         self.resource_decrement = float(resource_decrement)
 
-        self.acceptable_sla_violation_rate = json.loads(acceptable_sla_violation_rate.replace("'", "\""))
+        self.acceptable_sla_violation_rate = acceptable_sla_violation_rate
         self.node_cpu_threshold = float(node_cpu_threshold)
 
         self.waiting_time_between_scalings = int(waiting_time_between_scalings_ups)
@@ -2,7 +2,6 @@ import Edge_Environment
 from Simulation_Data import Simulation_Data
 from Scaling.Scaling import Scaling
 from Simulation_Entities.VNF_Instance import VNF_Instance
-import json
 
 class SmartVerticalScalingUp(Scaling):
 
@@ -50,7 +49,7 @@ class SmartVerticalScalingUp(Scaling):
 
         self.load_vnf_instance_limit = float(load_vnf_instance_limit)
 
-        self.acceptable_sla_violation_rate = json.loads(acceptable_sla_violation_rate.replace("'","\""))
+        self.acceptable_sla_violation_rate = acceptable_sla_violation_rate
 
         self.waiting_time_between_scaling_ups = int(waiting_time_between_scaling_ups)
 
@@ -192,7 +191,7 @@ class SmartVerticalScalingUp(Scaling):
                 nodes[node.name] = self.calc_resource_available_metric(node)
 
         rev = True
-        if self.prioritize_nodes_with_more_resource_available == "0":
+        if self.prioritize_nodes_with_more_resource_available == 0:
             rev = False
 
         sorted_nodes = dict(sorted(nodes.items(), key=lambda x: x[1], reverse=rev))
@@ -3,7 +3,6 @@ import Edge_Environment
 from Simulation_Data import Simulation_Data
 from Scaling.Scaling import Scaling
 from Simulation_Entities.VNF_Instance import VNF_Instance
-import json
 
 class TCPInspiredVerticalScalingUp(Scaling):
 
@@ -55,12 +54,12 @@ class TCPInspiredVerticalScalingUp(Scaling):
 
         self.load_vnf_instance_limit = float(load_vnf_instance_limit)
 
-        self.acceptable_sla_violation_rate = json.loads(acceptable_sla_violation_rate.replace("'","\""))
+        self.acceptable_sla_violation_rate = acceptable_sla_violation_rate
 
         self.waiting_time_between_scaling_ups = int(waiting_time_between_scaling_ups)
 
         self.sfc_instance_last_scaling = {} # store the simulation time where the scaling up occurs
-        self.threshold = threshold
+        self.threshold = float(threshold)
 
         # Validation
         if self.monitor_window_size < self.monitor_interval:
@@ -191,7 +190,7 @@ class TCPInspiredVerticalScalingUp(Scaling):
                 nodes[node.name] = self.calc_resource_available_metric(node)
 
         rev = True
-        if self.prioritize_nodes_with_more_resource_available == "0":
+        if self.prioritize_nodes_with_more_resource_available == 0:
             rev = False
 
         sorted_nodes = dict(sorted(nodes.items(), key=lambda x: x[1], reverse=rev))
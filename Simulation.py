@@ -2,23 +2,33 @@ from Simulation_Entities.SFC_Request import SFC_Request
 from Simulation_Entities.VNF_Instance import VNF_Instance
 from Simulation_Entities.SFC_Instance import SFC_Instance
 from Simulation_Entities.Packet import Packet
+from Simulation_Entities.Packet_Archive import Packet_Archive
+from Simulation_Entities.Packet_Table import Packet_Table
 
 from Edge_Entities.SFC import SFC
 from Edge_Entities.Link import Link
 from Edge_Entities.User import User
 from Edge_Entities.Data_Source import Data_Source
+from Edge_Entities.Random_Streams import Random_Streams
 
 import simpy
-import random
 import time
 import os
 import math
+import bisect
+import heapq
+import itertools
 import numpy as np
 import pandas as pd
 
 # from Edge_Environment import Edge_Environment
 # from Placement.Naive import Naive_Placement
 from Simulation_Data import Simulation_Data
+from Simulation_Timer import Simulation_Timer, late_timeout, yield_turn
+from Simulation_Analytic_Queue import Simulation_Analytic_Queue
+from Simulation_Arrival_Scheduler import Simulation_Arrival_Scheduler
+import Simulation_Perf
+import Simulation_Counters
 
 class Simulation:
 
@@ -67,7 +77,73 @@ class Simulation:
 
         self.time_limit_to_packet_generation = time_limit_to_packet_generation
 
-        self.packets = {}
+        # Store the packets in the NumPy Packet_Table instead of Packet objects
+        self.packet_table = False
+        try:
+            if os.environ["NSS_PACKET_TABLE"] == "1":
+                self.packet_table = True
+        except KeyError as ke:
+            pass
+
+        # Compute the single server queues (VNF Instances with max_share == 1 and links) in closed form
+        self.analytic_queue = False
+        try:
+            if os.environ["NSS_ANALYTIC_QUEUE"] == "1":
+                self.analytic_queue = True
+        except KeyError as ke:
+            pass
+
+        # VNF Instance name -> Simulation_Analytic_Queue and link name -> Simulation_Analytic_Queue
+        self.analytic_queues_vnf_instances = {}
+        self.analytic_queues_links = {}
+
+        # The packets being processed, when the packets leave the simulation they are moved to the archive
+        if self.packet_table:
+            self.packets = Packet_Table()
+            self.packets_archive = None
+        else:
+            self.packets = {}
+            self.packets_archive = Packet_Archive()
+
+        # Heap with the tick where each packet violates the SLA (deadline, creation order, key)
+        self.packets_deadline = []
+        self.packets_seq = itertools.count()
+
+        # The countdowns of the SFC Instances and VNF Instances are handled as deadlines
+        self.timer = Simulation_Timer(edge_environment)
+
+        # Number of flow generators and packets being processed, while there are some of them the
+        # simulation loop runs every 1ms, otherwise it jumps to the next time where something must be done
+        self.running_processes = 0
+        self.process = None
+        self.waiting_tick = None
+
+        # The optional Simulation_Convergence_Monitor, Simulation_Round_Summary and Simulation_Heartbeat
+        self.convergence_monitor = None
+        self.round_summary = None
+        self.heartbeat = None
+
+        # Objects with an observe_packet(packet) method, called when a packet leaves the simulation and for the
+        # packets still in the simulation when it finishes, and an observe_deadline(packet) method, called when the
+        # SLA of a packet still active is violated
+        self.packet_observers = []
+
+        # The flow generators of all the SFC Requests run in a single arrival scheduler
+        self.arrival_scheduler = Simulation_Arrival_Scheduler(env, on_finish=self.finish_flow_generator)
+
+        # Number of SFC Requests active and placed, computed again when some SFC Request changes
+        self.num_sfc_requests_active = None
+
+        # The simulation loop wakes up when a SFC Request is scheduled for replacement
+        self.edge_environment.replacement_listener = self.wake_up
+
+        # Log the total of resources used every 1ms
+        self.log_total_resources = False
+        try:
+            if os.environ["NSS_LOG_TOTAL_RESOURCES"] == "1":
+                self.log_total_resources = True
+        except KeyError as ke:
+            pass
 
         # only process the user mobility if the simulation provide the attr to process the file
         if user_mobility_file and execute_user_mobility:
@@ -75,6 +151,8 @@ class Simulation:
         else:
             self.user_mobility = {}
 
+        self.user_mobility_times = sorted(self.user_mobility)
+
         # Load packets from file
         self.packets_flow = {}
         try:
@@ -83,6 +161,23 @@ class Simulation:
         except KeyError as ke:
             pass
 
+        # Wall time of the phases (NSS_PERF), the packet processes are measured each time they are resumed
+        Simulation_Perf.instrument(self.placement, "execute", "placement.execute")
+        Simulation_Perf.instrument(self, "change_users_location", "tick.change_users_location")
+        Simulation_Perf.instrument(self, "expire_packets_deadline", "tick.expire_packets_deadline")
+        Simulation_Perf.instrument(self, "expire_timers", "tick.expire_timers")
+        Simulation_Perf.instrument(self, "handle_sfc_replacement", "tick.handle_sfc_replacement")
+        Simulation_Perf.instrument(self, "process_packet", "packet.process_packet")
+        Simulation_Perf.instrument(self, "vnf_process", "packet.vnf_process")
+        Simulation_Perf.instrument(self, "link_process", "packet.link_process")
+        Simulation_Perf.instrument(self.sd, "flush_events", "data.flush_events")
+        Simulation_Perf.instrument(self.sd, "save_events_csv", "data.save_events_csv")
+
+        # Live processes of each kind (NSS_COUNTERS)
+        Simulation_Counters.instrument(self, "process_sfc_request", "process_sfc_request")
+        Simulation_Counters.instrument(self, "vnf_process", "vnf_process")
+        Simulation_Counters.instrument(self, "link_process", "link_process")
+
     def load_packets_flow(self, file_name):
         """
         Load the packet flow from the file
@@ -131,14 +226,18 @@ class Simulation:
 
         return user_mobility
 
-    def run(self):
-        """Run the simulation
+    def run(self, until=None):
+        """Run the simulation, it can be called again to continue from the time where it stopped
+
+    Args:
+        until (int, optional): The simulation time where the execution stops. Defaults to the total time.
     """
         # add the events that the simulation will perform
-        self.env.process(self.simulation())
+        if self.process is None:
+            self.process = self.env.process(self.simulation())
 
         # Run the simulation model
-        self.env.run(until=self.total_time_simulation)
+        self.env.run(until=until if until is not None else self.total_time_simulation)
 
     def simulation(self):
 
@@ -151,40 +250,26 @@ class Simulation:
         while True:
 
             # Compute the total of resources used by the VNF Instances and save it in a file
-            try:
-                if os.environ["NSS_LOG_TOTAL_RESOURCES"] == "1":
-                    resource_usage = self.edge_environment.calc_resources_usage()
-                    self.sd.add_resource_usage_event(
-                        self.sd.EVENT_RESOURCE_CPU_USAGE,
-                        self.env.now,
-                        resource_usage['cpu_allocated'],
-                    )
-            except KeyError as ke:
-                print(ke)
-                pass
+            if self.log_total_resources:
+                resource_usage = self.edge_environment.calc_resources_usage()
+                self.sd.add_resource_usage_event(
+                    self.sd.EVENT_RESOURCE_CPU_USAGE,
+                    self.env.now,
+                    resource_usage['cpu_allocated'],
+                )
 
-            # Wait for 1ms
-            yield self.env.timeout(1)
+            # Wait for 1ms, or until the next time where something must be done
+            yield from self.wait_next_tick(first_placement)
 
             # Verify if some user change its position, if so, move from actual node to the new node
             self.change_users_location()
 
-            # Increment the delay for all the packets that are not processed yet
-            self.increase_packet_delay()
+            # Mark as SLA violated the packets that reach the max delay in this tick
+            self.expire_packets_deadline()
 
-            # Reduce the timeout of the SFC_Instance
-            self.decrease_sfc_instances_timeout()
-
-            # Reduce the timeout for the VNF Instance without SFC Instances associated
-            self.decrease_timeout_vnf_instance()
-
-            # Reduce the startup for the new VNF Instances, packets only will be processed if the
-            # "Startup Remain Time" for the VNF Instance being zero
-            self.decrease_startup_vnf_instance_time()
-
-            # Reduce the shutdown for the new VNF Instances
-            # "Shutdown Remain Time" for the VNF Instance being zero mean that it already be removed
-            self.decrease_shutdown_vnf_instance_time()
+            # Handle the SFC_Instance timeouts and the VNF Instances timeout, startup and shutdown
+            # that finish in this tick
+            self.expire_timers()
 
             self.handle_sfc_replacement()
 
@@ -234,6 +319,7 @@ class Simulation:
                 self.sd.add_placement_event(Simulation_Data.EVENT_PLACEMENT_STARTED, self.env.now)
 
                 # Run the placement using the environment and the sfc_requested in the time window
+                self.timer.sync(self.env.now)
                 start = time.time()
 
                 exp_path = ""
@@ -257,10 +343,13 @@ class Simulation:
                     time=self.env.now,
                     file_path=exp_path
                 )
+                self.num_sfc_requests_active = None
 
                 end = time.time()
                 total_alg_time = float(end - start) * 1000
 
+                self.timer.track(self.env.now)
+
                 # debug
                 try:
                     if os.environ["NSS_DEBUG"] == "2":
@@ -296,10 +385,10 @@ class Simulation:
                             # if os.environ["PATH_PACKET_FLOW_FILE"]:
                             if "PATH_PACKET_FLOW_FILE" in os.environ and os.environ["PATH_PACKET_FLOW_FILE"]:
                                 # use the packets load from file
-                                self.env.process(self.flow_generator_by_file(sfc_req))
+                                self.start_flow_generator(self.flow_generator_by_file(sfc_req))
                             else:
                                 # generate the packets randomly
-                                self.env.process(self.flow_generator(sfc_req, time_window_end))
+                                self.start_flow_generator(self.flow_generator(sfc_req, time_window_end))
 
                     else:
                         sfc_request_not_placed = sfc_request_not_placed + 1
@@ -327,10 +416,123 @@ class Simulation:
                     total_energy_comsumption
                 )
 
+    def wait_next_tick(self, first_placement):
+        """Wait for the next tick (ms) where the simulation loop has something to do.
+
+        While there are packets being generated or processed the loop runs every 1ms, otherwise the idle time
+        until the next countdown, time window, user movement or replacement is skipped.
+
+        Args:
+            first_placement (bool): The first placement was not executed yet
+        """
+        now = self.env.now
+        next_tick = now + 1
+
+        if not self.log_total_resources and self.running_processes == 0:
+            next_tick = self.next_tick(first_placement)
+
+        self.waiting_tick = next_tick
+
+        try:
+            if next_tick > now + 1:
+                # Return to the 1ms grid in the previous ms, after its events, thus the tick is processed
+                # in the same order, related to the other events of that time, as if no time was skipped
+                yield late_timeout(self.env, next_tick - 1 - now)
+
+            yield self.env.timeout(1)
+        except simpy.Interrupt:
+            # Something was scheduled to the current time
+            pass
+
+        self.waiting_tick = None
+
+    def next_tick(self, first_placement):
+        """Return the next tick where the simulation loop has something to do when there are no packets
+
+        Args:
+            first_placement (bool): The first placement was not executed yet
+        """
+        now = self.env.now
+        ticks = [self.total_time_simulation]
+
+        deadline = self.timer.next_deadline()
+        if deadline is not None:
+            ticks.append(deadline)
+
+        if self.packets_deadline:
+            ticks.append(self.packets_deadline[0][0])
+
+        if self.time_window == 0:
+            if first_placement:
+                ticks.append(now + 1)
+        else:
+            ticks.append((now // self.time_window + 1) * self.time_window)
+
+        i = bisect.bisect_right(self.user_mobility_times, now)
+        if i < len(self.user_mobility_times):
+            ticks.append(self.user_mobility_times[i])
+
+        for replacement_time in self.edge_environment.replacement_schedule:
+            if replacement_time > now:
+                ticks.append(replacement_time)
+
+        return max(min(ticks), now + 1)
+
+    def wake_up(self, time):
+        """Wake up the simulation loop if it skipped the time where something was scheduled
+
+        Args:
+            time (int): The time
+        """
+        if self.process is None or self.waiting_tick is None:
+            return
+
+        if self.timer.tick < time < self.waiting_tick and self.env.now == time:
+            self.process.interrupt()
+
+    def start_flow_generator(self, generator):
+        """Add the flow generator of a SFC Request in the arrival scheduler, it is counted as a running process
+
+        Args:
+            generator (generator): The flow generator
+        """
+        self.running_processes += 1
+        self.arrival_scheduler.add(generator)
+
+    def finish_flow_generator(self):
+        self.running_processes -= 1
+
+    def get_num_sfc_requests_active(self):
+        """Return the number of SFC Requests active and placed, the value is kept until some SFC Request changes"""
+        if self.num_sfc_requests_active is None:
+            self.num_sfc_requests_active = self.edge_environment.get_num_sfc_requests_active()
+
+        return self.num_sfc_requests_active
+
+    def start_process(self, process):
+        """Start a packet process keeping the count of them running.
+        The count is increased before the process starts, thus the simulation loop does not skip the
+        time until the process runs for the first time
+
+        Args:
+            process (generator): The process
+        """
+        self.running_processes += 1
+        return self.env.process(self.count_process(process))
+
+    def count_process(self, process):
+        try:
+            return (yield from process)
+        finally:
+            self.running_processes -= 1
+
     def flow_generator_by_file(self, sfc_request):
         """
         Get the packets defined in a file used as entry during the system startup.
         This file must have the parameters  .... @todo
+
+        Yields:
+            int: The time to wait until the next packet, the generator runs in the arrival scheduler
         """
         # For each SFC starts the packet id with zero
         user_name = sfc_request.user.name
@@ -358,27 +560,28 @@ class Simulation:
 
             packet_time = packet_data['time']
             packet_size = packet_data['packet_size']
-            yield self.env.timeout(packet_time)
+            yield packet_time
             packet_id += 1
-            p = Packet (
+            p = self.new_packet(
                 packet_id=packet_id,
                 created_at=self.env.now,
                 sfc_request=sfc_request,
                 max_delay=sfc_request.sfc.max_latency,
-                total_sfc_requests_active=self.edge_environment.get_num_sfc_requests_active(),
+                total_sfc_requests_active=self.get_num_sfc_requests_active(),
                 size=packet_size
             )
 
-            self.packets[(sfc_request.name, packet_id)] = p
+            self.add_packet(p)
 
             # Start processing the packet in the SFC
-            self.env.process(self.process_sfc_request(packet_id, sfc_request))
+            self.start_process(self.process_packet(packet_id, sfc_request))
 
         # Log the end of packet generation
         self.sd.add_sfc_request_event(Simulation_Data.EVENT_SFC_REQUEST_PACKET_GENERATION_STOPPED, self.env.now, sfc_request)
 
         # Define that this SFC Request will not send more packets
         sfc_request.active = False
+        self.num_sfc_requests_active = None
 
         # Define the duration time based on the first and last packets processed in the SFC Request
         sfc_request.duration = self.env.now - start_time
@@ -392,7 +595,7 @@ class Simulation:
             sfc_request (SFC_Request): The SFC requested
             time_window_end (int): The time where the packets of the sfc_request will start to be created
         Yields:
-            [type]: [description]
+            int: The time to wait until the next step, the generator runs in the arrival scheduler
         """
 
         src = sfc_request.data_source
@@ -412,13 +615,14 @@ class Simulation:
             if sfc_request_duration >= self.env.now:
 
                 # Wait for the time to start a new packet burst
-                yield self.env.timeout(src.get_packets_burst_interval())
+                yield src.get_packets_burst_interval(sfc_request.name)
 
                 # stop the packet creation if the time was above the limit
                 if self.env.now > self.time_limit_to_packet_generation:
+                    src.close_flow(sfc_request.name)
                     return
 
-                for i in range(src.get_packets_burst_size()):
+                for i in range(src.get_packets_burst_size(sfc_request.name)):
                     # If packet is generated we will restart the timeout
                     self.reset_sfc_timeout(sfc_instance)
 
@@ -428,31 +632,45 @@ class Simulation:
                     # Only create the packet IF the simulation remain time were greater than the max_delay for the SFC
                     if self.total_time_simulation > (self.env.now + sfc_request.sfc.max_latency):
                         # Create the entity Packet
-                        packet_size = np.random.poisson(sfc_request.data_source.packet_size)
-                        p = Packet (
+                        packet_size = src.get_packet_size(sfc_request.name)
+                        p = self.new_packet(
                             packet_id=packet_id,
                             created_at=self.env.now,
                             sfc_request=sfc_request,
                             max_delay=sfc_request.sfc.max_latency,
-                            total_sfc_requests_active=self.edge_environment.get_num_sfc_requests_active(),
+                            total_sfc_requests_active=self.get_num_sfc_requests_active(),
                             size=packet_size
                         )
 
-                        self.packets[(sfc_request.name, packet_id)] = p
+                        self.add_packet(p)
 
                         # Time between multiples packets of the same SFC
-                        yield self.env.timeout(src.get_packet_interval())
+                        yield src.get_packet_interval(sfc_request.name)
 
                         # Start processing the packet in the SFC
-                        self.env.process(self.process_sfc_request(packet_id, sfc_request))
+                        self.start_process(self.process_packet(packet_id, sfc_request))
             else:
                 # Log the end of packet generation
                 self.sd.add_sfc_request_event(Simulation_Data.EVENT_SFC_REQUEST_PACKET_GENERATION_STOPPED, self.env.now, sfc_request)
 
                 # Define that this SFC Request will not send more packets
                 sfc_request.active = False
+                self.num_sfc_requests_active = None
+                src.close_flow(sfc_request.name)
                 return True
 
+    def process_packet(self, packet_id, sfc_request):
+        """
+        Process the packet in the SFC and move it to the archive when it leaves the simulation
+
+        Args:
+            packet_id (int): The Packet ID
+            sfc_request (SFC_Request): The SFC_Request that is attended
+        """
+        result = yield from self.process_sfc_request(packet_id, sfc_request)
+        self.retire_packet(sfc_request, packet_id)
+        return result
+
     def process_sfc_request(self, packet_id, sfc_request):
         """
         Process the packets generated for a SFC Request, the packet will travel across all the links
@@ -494,7 +712,7 @@ class Simulation:
             # Orphan packet must be deactivated
             self.packets[(sfc_request.name, packet_id)].orphan = True
 
-            self.packets[(sfc_request.name, packet_id)].active = False
+            self.deactivate_packet(sfc_request, packet_id)
 
             # self.packets[(sfc_request.name, packet_id)].sla_violated = True
             self.mark_packet_as_sla_violated(sfc_request, packet_id)
@@ -512,7 +730,7 @@ class Simulation:
             )
 
             # Select one of the links randomly
-            link = random.choice(links)
+            link = Random_Streams.choice(Random_Streams.MOBILITY, links, sfc_request.name)
 
             total_extra_delay = ((packet_size / link.bandwidth) * 1000) + link.propagation
             total_extra_delay = math.ceil(total_extra_delay) * 2
@@ -537,7 +755,7 @@ class Simulation:
                 if vnf_instance == False:
                     packet_orphan = True
 
-                    self.packets[(sfc_request.name, packet_id)].active = False
+                    self.deactivate_packet(sfc_request, packet_id)
                     self.packets[(sfc_request.name, packet_id)].orphan = True
                     # self.packets[(sfc_request.name, packet_id)].sla_violated = True
                     self.mark_packet_as_sla_violated(sfc_request, packet_id)
@@ -558,11 +776,11 @@ class Simulation:
                         pass
                 else:
                     resource_vnf_instance = self.resource_instances[vnf_instance.name]
-                    result = yield self.env.process(self.vnf_process(packet_id, resource_vnf_instance, vnf_instance, sfc_request))
+                    result = yield from self.sub_process(self.vnf_process(packet_id, resource_vnf_instance, vnf_instance, sfc_request))
                     if result == False:
                         packet_dropped = True
                         self.packets[(sfc_request.name, packet_id)].dropped = True
-                        self.packets[(sfc_request.name, packet_id)].active = False
+                        self.deactivate_packet(sfc_request, packet_id)
                         # self.packets[(sfc_request.name, packet_id)].sla_violated = True
                         self.mark_packet_as_sla_violated(sfc_request, packet_id)
 
@@ -594,7 +812,7 @@ class Simulation:
                     packet_orphan = True
                     # Orphan packet must be deactivated
                     self.packets[(sfc_request.name, packet_id)].orphan = True
-                    self.packets[(sfc_request.name, packet_id)].active = False
+                    self.deactivate_packet(sfc_request, packet_id)
                     # self.packets[(sfc_request.name, packet_id)].sla_violated = True
                     self.mark_packet_as_sla_violated(sfc_request, packet_id)
 
@@ -611,7 +829,7 @@ class Simulation:
                     process_link = False
 
                 if process_link:
-                    link_process_result = yield self.env.process(
+                    link_process_result = yield from self.sub_process(
                         self.link_process(
                             packet_id,
                             packet_size,
@@ -647,9 +865,34 @@ class Simulation:
                 sfc_request
             )
 
-            self.packets[(sfc_request.name, packet_id)].active = False
+            self.deactivate_packet(sfc_request, packet_id)
             self.packets[(sfc_request.name, packet_id)].processed = True
 
+    def sub_process(self, generator):
+        """
+        Run the generator inside the current process (yield from) instead of creating a new simpy Process for it.
+
+        A simpy Process starts with an URGENT event and resumes the parent with a NORMAL event when it finishes,
+        the same turns are only taken here when there are other events waiting for them in the current time,
+        thus the events are processed in the same order without allocating the Process and its events
+
+        Args:
+            generator (generator): The process generator, e.g. vnf_process or link_process
+        Returns:
+            The value returned by the generator
+        """
+        event = yield_turn(self.env, simpy.events.URGENT)
+        if event is not None:
+            yield event
+
+        result = yield from generator
+
+        event = yield_turn(self.env, simpy.events.NORMAL)
+        if event is not None:
+            yield event
+
+        return result
+
     def vnf_process(self, packet_id, resource_vnf_instance, vnf_instance, sfc_request):
         """ The process that occur inside the VNF
 
@@ -670,6 +913,8 @@ class Simulation:
 
         sfc_instance = self.edge_environment.get_active_sfc_instance_by_sfc_request(sfc_request)
 
+        packet_arrival_time = self.env.now
+
         if self.log_vnf_instance_events:
             # log the time arrive at the VNF Instance
             self.sd.add_vnf_instance_packets_event(
@@ -682,14 +927,12 @@ class Simulation:
                 packet_size
             )
 
-            packet_arrival_time = self.env.now
-
         if not vnf_instance.add_packet_in_queue():
             sfc_instance = self.edge_environment.get_active_sfc_instance_by_sfc_request(sfc_request)
 
             if self.log_vnf_instance_events:
                 # Log the info at packet level
-                self.packets[(sfc_request.name, packet_id)].active = False
+                self.deactivate_packet(sfc_request, packet_id)
                 self.packets[(sfc_request.name, packet_id)].dropped = True
                 # self.packets[(sfc_request.name, packet_id)].sla_violated = True
                 self.mark_packet_as_sla_violated(sfc_request, packet_id)
@@ -716,8 +959,21 @@ class Simulation:
 
         # Wait until the VNF Instance became available
         # startup_remain_time must be zero for entering in the process vnf mode
-        if vnf_instance.startup_remain_time > 0:
-            yield self.env.timeout(vnf_instance.startup_remain_time)
+        startup_remain_time = self.timer.remain_time(Simulation_Timer.VNF_INSTANCE_STARTUP, vnf_instance)
+        if startup_remain_time > 0:
+            yield self.env.timeout(startup_remain_time)
+
+        analytic_queue = self.get_vnf_instance_analytic_queue(vnf_instance)
+        if analytic_queue is not None:
+            # The single server queue takes the same turns of the simpy Resource
+            turn = analytic_queue.request()
+            if turn is not None:
+                yield turn
+
+            yield from self.vnf_service(packet_id, vnf_instance, sfc_request, sfc_instance, packet_size, packet_arrival_time)
+
+            analytic_queue.release()
+            return
 
         # Wait for the resource instance
         with resource_vnf_instance.request() as request:
@@ -729,123 +985,175 @@ class Simulation:
                 # If it is the first VNF thus the packet size is getting from the data_souce, ele, by the VNF Itself
                 # if sfc.vnfs[0] == vnf.name:
                 #     packet_size = sfc_request.data_source.packet_size
-                
-                packet_processing_start = self.env.now
 
-                # log the time when the packet enter in the VNF Instance Queue
-                if self.log_vnf_instance_events:
-                    self.sd.add_vnf_instance_packets_event(
-                        Simulation_Data.VNF_INSTANCE_PACKET_PROCESS_STARTED,
-                        self.env.now,
-                        packet_id,
-                        vnf_instance,
-                        sfc_request,
-                        sfc_instance,
-                        packet_size,
-                        packet_processing_start - packet_arrival_time
-                    )
+                yield from self.vnf_service(packet_id, vnf_instance, sfc_request, sfc_instance, packet_size, packet_arrival_time)
 
-                # how much time the packet will be use the CPU * 1000 to became milliseconds
-                # the time for processing a packet is the time for the cpu usage + the time to access remote data
-                # when it happen. This values came from the fields "remote_data_access_cost" and "remote_data_access_prob"
-                # we also use a Poisson distribution to calculate this value
-                remote_data_access_prob = np.random.poisson(vnf.remote_data_access_prob)
+            except simpy.Interrupt:
+                print("Something went very bad")
 
-                # total_vnf_process_time = (packet_size / vnf_instance.cpu) * 1000
-                # total_vnf_process_time = (packet.size / vnf_instance.cpu) * 1000 * (1 + vnf_instance.cpu_load * 0.1)
-                total_vnf_process_time = (packet_size / vnf_instance.cpu) * 1000
+    def vnf_service(self, packet_id, vnf_instance, sfc_request, sfc_instance, packet_size, packet_arrival_time):
+        """ The processing of the packet by the VNF Instance, after the packet got the VNF Instance (simpy Resource
+        or analytic queue)
 
-                # increase the cpu usage because of the packet processing started
-                packet_cpu_usage = packet_size / vnf_instance.cpu
-                vnf_instance.increase_cpu_load(packet_cpu_usage)
+        Args:
+            packet_id (int): The id that define the generated packet
+            vnf_instance (VNF_Instance): Is the VNF instance object
+            sfc_request (SFC_Request): The SFC Request of the packet
+            sfc_instance (SFC_Instance): The SFC Instance of the SFC Request
+            packet_size (float): The packet size multiplied by the packet_cpu_demand of the VNF
+            packet_arrival_time (int): The time when the packet arrived at the VNF Instance
+        """
+        vnf = vnf_instance.vnf
 
-                # increase the mem usage because of the packet processing started
-                packet_mem_usage = (packet_size * vnf.packet_mem_demand) / vnf_instance.mem
-                vnf_instance.increase_mem_load(packet_mem_usage)
+        packet_processing_start = self.env.now
 
-                if self.log_vnf_instance_events:
-                    self.sd.add_vnf_instance_resources_event(
-                        Simulation_Data.EVENT_INSTANCE_RESOURCE_USAGE_INCREASE,
-                        self.env.now,
-                        vnf_instance,
-                        packet_cpu_usage,
-                        packet_mem_usage,
-                        sfc_request,
-                        packet_id
-                    )
+        # log the time when the packet enter in the VNF Instance Queue
+        if self.log_vnf_instance_events:
+            self.sd.add_vnf_instance_packets_event(
+                Simulation_Data.VNF_INSTANCE_PACKET_PROCESS_STARTED,
+                self.env.now,
+                packet_id,
+                vnf_instance,
+                sfc_request,
+                sfc_instance,
+                packet_size,
+                packet_processing_start - packet_arrival_time
+            )
 
-                if (random.random() < remote_data_access_prob):
-                    total_vnf_process_time = total_vnf_process_time + vnf.remote_data_access_cost
-                    # log the remote data access time
-                    if self.log_vnf_instance_events:
-                        self.sd.add_vnf_instance_packets_event(
-                            Simulation_Data.VNF_INSTANCE_REMOTE_DATA_RECEIVED,
-                            self.env.now,
-                            packet_id,
-                            vnf_instance,
-                            sfc_request,
-                            sfc_instance,
-                            packet_size
-                        )
+        # how much time the packet will be use the CPU * 1000 to became milliseconds
+        # the time for processing a packet is the time for the cpu usage + the time to access remote data
+        # when it happen. This values came from the fields "remote_data_access_cost" and "remote_data_access_prob"
+        # we also use a Poisson distribution to calculate this value
+        remote_data_access_prob = vnf.get_remote_data_access((sfc_request.name, packet_id))
 
-                # if the memory usage is higher than 1 we will add the disk_delay time access in the total
-                # process time of the packet
-                if vnf_instance.mem_load > 1:
-                    total_vnf_process_time = total_vnf_process_time + vnf_instance.node.disk_delay
-
-                    # log the disk access by the instance
-                    if self.log_vnf_instance_events:
-                        self.sd.add_vnf_instance_resources_event(
-                            Simulation_Data.EVENT_INSTANCE_RESOURCE_DISK_ACCESS,
-                            self.env.now,
-                            vnf_instance,
-                            vnf_instance.cpu_load,
-                            vnf_instance.mem_load,
-                            sfc_request,
-                            packet_id
-                        )
+        # total_vnf_process_time = (packet_size / vnf_instance.cpu) * 1000
+        # total_vnf_process_time = (packet.size / vnf_instance.cpu) * 1000 * (1 + vnf_instance.cpu_load * 0.1)
+        total_vnf_process_time = (packet_size / vnf_instance.cpu) * 1000
 
-                # if the laod if higher than 1 it means that the VNF Instance is overloaded
-                if vnf_instance.cpu_load > 1:
-                    total_vnf_process_time = total_vnf_process_time * vnf_instance.cpu_load
+        # increase the cpu usage because of the packet processing started
+        packet_cpu_usage = packet_size / vnf_instance.cpu
+        vnf_instance.increase_cpu_load(packet_cpu_usage)
 
-                # Decrement the VNF Instance Packet Queue Count in one packet
-                vnf_instance.dec_packet_in_queue()
-                yield self.env.timeout(int(total_vnf_process_time))
+        # increase the mem usage because of the packet processing started
+        packet_mem_usage = (packet_size * vnf.packet_mem_demand) / vnf_instance.mem
+        vnf_instance.increase_mem_load(packet_mem_usage)
 
-                # reduce the cpu usage because of the packet processing finalization
-                vnf_instance.decrease_cpu_load(packet_cpu_usage)
+        if self.log_vnf_instance_events:
+            self.sd.add_vnf_instance_resources_event(
+                Simulation_Data.EVENT_INSTANCE_RESOURCE_USAGE_INCREASE,
+                self.env.now,
+                vnf_instance,
+                packet_cpu_usage,
+                packet_mem_usage,
+                sfc_request,
+                packet_id
+            )
 
-                # reduce the mem usage because of the packet processing finalization
-                vnf_instance.decrease_mem_load(packet_mem_usage)
+        remote_data_access_key = (sfc_request.name, packet_id, vnf.name, "remote_data_access")
+        if (Random_Streams.keyed_random(Random_Streams.REMOTE_DATA, remote_data_access_key) < remote_data_access_prob):
+            total_vnf_process_time = total_vnf_process_time + vnf.remote_data_access_cost
+            # log the remote data access time
+            if self.log_vnf_instance_events:
+                self.sd.add_vnf_instance_packets_event(
+                    Simulation_Data.VNF_INSTANCE_REMOTE_DATA_RECEIVED,
+                    self.env.now,
+                    packet_id,
+                    vnf_instance,
+                    sfc_request,
+                    sfc_instance,
+                    packet_size
+                )
 
-                if self.log_vnf_instance_events:
-                    self.sd.add_vnf_instance_resources_event(
-                        Simulation_Data.EVENT_INSTANCE_RESOURCE_USAGE_DECREASE,
-                        self.env.now,
-                        vnf_instance,
-                        packet_cpu_usage,
-                        packet_mem_usage,
-                        sfc_request,
-                        packet_id
-                    )
+        # if the memory usage is higher than 1 we will add the disk_delay time access in the total
+        # process time of the packet
+        if vnf_instance.mem_load > 1:
+            total_vnf_process_time = total_vnf_process_time + vnf_instance.node.disk_delay
 
-                    packet_processing_time = self.env.now - packet_processing_start
+            # log the disk access by the instance
+            if self.log_vnf_instance_events:
+                self.sd.add_vnf_instance_resources_event(
+                    Simulation_Data.EVENT_INSTANCE_RESOURCE_DISK_ACCESS,
+                    self.env.now,
+                    vnf_instance,
+                    vnf_instance.cpu_load,
+                    vnf_instance.mem_load,
+                    sfc_request,
+                    packet_id
+                )
 
-                    # log the time when the packet leave VNF Instance Queue
-                    self.sd.add_vnf_instance_packets_event(
-                        Simulation_Data.VNF_INSTANCE_PACKET_PROCESSED,
-                        self.env.now,
-                        packet_id,
-                        vnf_instance,
-                        sfc_request,
-                        sfc_instance,
-                        packet_size,
-                        packet_processing_time
-                    )
+        # if the laod if higher than 1 it means that the VNF Instance is overloaded
+        if vnf_instance.cpu_load > 1:
+            total_vnf_process_time = total_vnf_process_time * vnf_instance.cpu_load
 
-            except simpy.Interrupt:
-                print("Something went very bad")
+        # Decrement the VNF Instance Packet Queue Count in one packet
+        vnf_instance.dec_packet_in_queue()
+        yield self.env.timeout(int(total_vnf_process_time))
+
+        # reduce the cpu usage because of the packet processing finalization
+        vnf_instance.decrease_cpu_load(packet_cpu_usage)
+
+        # reduce the mem usage because of the packet processing finalization
+        vnf_instance.decrease_mem_load(packet_mem_usage)
+
+        if self.log_vnf_instance_events:
+            self.sd.add_vnf_instance_resources_event(
+                Simulation_Data.EVENT_INSTANCE_RESOURCE_USAGE_DECREASE,
+                self.env.now,
+                vnf_instance,
+                packet_cpu_usage,
+                packet_mem_usage,
+                sfc_request,
+                packet_id
+            )
+
+            packet_processing_time = self.env.now - packet_processing_start
+
+            # log the time when the packet leave VNF Instance Queue
+            self.sd.add_vnf_instance_packets_event(
+                Simulation_Data.VNF_INSTANCE_PACKET_PROCESSED,
+                self.env.now,
+                packet_id,
+                vnf_instance,
+                sfc_request,
+                sfc_instance,
+                packet_size,
+                packet_processing_time
+            )
+
+    def get_vnf_instance_analytic_queue(self, vnf_instance):
+        """
+        Return the analytic queue of the VNF Instance or None if the VNF Instance must use the simpy Resource
+
+        Args:
+            vnf_instance (VNF_Instance): The VNF Instance
+        """
+        if not self.analytic_queue or self.log_vnf_instance_events or vnf_instance.vnf.max_share != 1:
+            return None
+
+        analytic_queue = self.analytic_queues_vnf_instances.get(vnf_instance.name)
+        if analytic_queue is None:
+            analytic_queue = Simulation_Analytic_Queue(self.env)
+            self.analytic_queues_vnf_instances[vnf_instance.name] = analytic_queue
+
+        return analytic_queue
+
+    def get_link_analytic_queue(self, link, resource_link):
+        """
+        Return the analytic queue of the link or None if the link must use the simpy Resource
+
+        Args:
+            link (Link): The link entity
+            resource_link (Resource): The simpy resource of the link
+        """
+        if not self.analytic_queue or self.log_link_events or resource_link.capacity != 1:
+            return None
+
+        analytic_queue = self.analytic_queues_links.get(link.name)
+        if analytic_queue is None:
+            analytic_queue = Simulation_Analytic_Queue(self.env)
+            self.analytic_queues_links[link.name] = analytic_queue
+
+        return analytic_queue
 
     def link_process(self, packet_id, packet_size, resource_link, link, sfc_request, vnf_instance_name):
         """Compute the total amount of time consumed to send the data from the node_source to node_target
@@ -889,12 +1197,26 @@ class Simulation:
 
             # Orphan packet must be deactivated
             self.packets[(sfc_request.name, packet_id)].orphan = False
-            self.packets[(sfc_request.name, packet_id)].active = False
+            self.deactivate_packet(sfc_request, packet_id)
             self.packets[(sfc_request.name, packet_id)].dropped = True
             # self.packets[(sfc_request.name, packet_id)].sla_violated = True
             self.mark_packet_as_sla_violated(sfc_request, packet_id)
             return False
 
+        analytic_queue = self.get_link_analytic_queue(link, resource_link)
+        if analytic_queue is not None:
+            # The single server queue takes the same turns of the simpy Resource
+            turn = analytic_queue.request()
+            if turn is not None:
+                yield turn
+
+            transfer_delay = (packet_size / link.bandwidth) * 1000
+            yield self.env.timeout(transfer_delay + link.propagation)
+
+            link.dec_packet_in_queue()
+            analytic_queue.release()
+            return True
+
         with resource_link.request() as request:
             yield request
 
@@ -937,81 +1259,76 @@ class Simulation:
 
         return True
 
-    def decrease_timeout_vnf_instance(self):
+    def expire_timers(self):
         """
-        Decrease the timeout for the VNF Instances that is not attending any SFC Instance
+        Handle the countdowns of the SFC Instances and VNF Instances that finish in the current tick
         """
-        for vnf_instance in self.edge_environment.vnf_instances:
-            if vnf_instance.active:
-                if len(vnf_instance.sfc_instances) > 0:
-                    vnf_instance.timeout = vnf_instance.vnf.timeout
-                    continue
-
-                if vnf_instance.timeout > 0:
-                    vnf_instance.timeout = vnf_instance.timeout - 1
-
-                if vnf_instance.timeout == 0:
-                    vnf_instance.timeout = -1
-                    vnf_instance.accept_sfc_instances = False
-                    self.sd.add_vnf_instance_event(
-                        event=Simulation_Data.EVENT_INSTANCE_SHUTDOWN,
-                        time=self.env.now,
-                        vnf_instance=vnf_instance
-                    )
+        for kind, entity in self.timer.expire(self.env.now):
+            if kind == Simulation_Timer.SFC_INSTANCE_TIMEOUT:
+                self.handle_sfc_instance_timeout(entity)
+            elif kind == Simulation_Timer.VNF_INSTANCE_TIMEOUT:
+                self.handle_vnf_instance_timeout(entity)
+            elif kind == Simulation_Timer.VNF_INSTANCE_STARTUP:
+                self.handle_vnf_instance_startup(entity)
+            elif kind == Simulation_Timer.VNF_INSTANCE_SHUTDOWN:
+                self.handle_vnf_instance_shutdown(entity)
+
+    def handle_vnf_instance_timeout(self, vnf_instance):
+        """
+        The VNF Instance was not attending any SFC Instance during its timeout, it will not accept new SFC Instances
+        and the shutdown is started
+        """
+        vnf_instance.accept_sfc_instances = False
+        self.sd.add_vnf_instance_event(
+            event=Simulation_Data.EVENT_INSTANCE_SHUTDOWN,
+            time=self.env.now,
+            vnf_instance=vnf_instance
+        )
+
+        self.timer.shutdown_vnf_instance(vnf_instance)
 
-    def decrease_shutdown_vnf_instance_time(self):
+    def handle_vnf_instance_shutdown(self, vnf_instance):
         """
-            Decrease the shutdown_remain_time for all the VNF_Instances
+        The shutdown_remain_time of the VNF_Instance reached zero, it means that it was removed
         """
-        for vnf_instance in self.edge_environment.vnf_instances:
-            if vnf_instance.accept_sfc_instances == False and vnf_instance.shutdown_remain_time > 0:
-                vnf_instance.shutdown_remain_time = vnf_instance.shutdown_remain_time - 1
-
-            if vnf_instance.accept_sfc_instances == False and vnf_instance.shutdown_remain_time == 0:
-                vnf_instance.shutdown_remain_time = -1
-                vnf_instance.active = False
-                # log complete startup event
-                self.sd.add_vnf_instance_event(
-                    event=Simulation_Data.EVENT_INSTANCE_DESTROYED,
-                    time=self.env.now,
-                    vnf_instance=vnf_instance
-                )
+        vnf_instance.active = False
+        # log complete startup event
+        self.sd.add_vnf_instance_event(
+            event=Simulation_Data.EVENT_INSTANCE_DESTROYED,
+            time=self.env.now,
+            vnf_instance=vnf_instance
+        )
 
-    def decrease_startup_vnf_instance_time(self):
+    def handle_vnf_instance_startup(self, vnf_instance):
         """
-            Decrease the startup_remain_time for all the VNF_Instances
-            If the packet arrives to a VNF_Instance that the startup_remain_time is greater than 0
-            the packet will wait until this value became zero to be processed
+        The startup_remain_time of the VNF_Instance reached zero.
+        If the packet arrives to a VNF_Instance that the startup_remain_time is greater than 0
+        the packet will wait until this value became zero to be processed
         """
-        for vnf_instance in self.edge_environment.vnf_instances:
-            if vnf_instance.startup_remain_time > 0:
-                vnf_instance.startup_remain_time = vnf_instance.startup_remain_time - 1
-
-            if vnf_instance.startup_remain_time == 0:
-                vnf_instance.startup_remain_time = -1
-                # log complete startup event
-                self.sd.add_vnf_instance_event(
-                    event=Simulation_Data.EVENT_INSTANCE_STARTUP,
-                    time=self.env.now,
-                    vnf_instance=vnf_instance
-                )
+        # log complete startup event
+        self.sd.add_vnf_instance_event(
+            event=Simulation_Data.EVENT_INSTANCE_STARTUP,
+            time=self.env.now,
+            vnf_instance=vnf_instance
+        )
 
-    def decrease_sfc_instances_timeout(self):
+    def handle_sfc_instance_timeout(self, sfc_instance):
         """
-            Decrease the timeout of all the SFC_Instance in execution
+        The SFC_Instance did not receive packets during its timeout and it is destroyed
         """
-        for sfc_instance in self.edge_environment.sfc_instances:
-            if sfc_instance.active:
-                sfc_instance.timeout -= 1
-                if sfc_instance.timeout <= 0:
-                    self.destroy_sfc_instance(sfc_instance)
-
-                    # log destruction event
-                    self.sd.add_sfc_instance_event(
-                        event=Simulation_Data.EVENT_SFC_INSTANCE_DESTROYED,
-                        time=self.env.now,
-                        sfc_instance=sfc_instance
-                    )
+        self.destroy_sfc_instance(sfc_instance)
+
+        # The VNF Instances without SFC Instances start its timeout in this tick
+        for vnf_instance in self.edge_environment.vnf_instances:
+            if vnf_instance.active and len(vnf_instance.sfc_instances) == 0:
+                self.timer.release_vnf_instance(vnf_instance)
+
+        # log destruction event
+        self.sd.add_sfc_instance_event(
+            event=Simulation_Data.EVENT_SFC_INSTANCE_DESTROYED,
+            time=self.env.now,
+            sfc_instance=sfc_instance
+        )
 
     def destroy_sfc_instance(self, sfc_instance):
         """Destroy a SFC_Instance, The resources from VNF_Instances must be released
@@ -1038,17 +1355,77 @@ class Simulation:
     def reset_sfc_timeout(self, sfc_instance):
         sfc_instance.timeout = self.edge_environment.sfcs[sfc_instance.sfc.name].timeout
 
-    def increase_packet_delay(self):
+        # Only the active SFC_Instances have the timeout running
+        if sfc_instance.active:
+            self.timer.reset(Simulation_Timer.SFC_INSTANCE_TIMEOUT, sfc_instance)
+
+    def new_packet(self, packet_id, created_at, sfc_request, max_delay, total_sfc_requests_active, size):
         """
-        Increase the packet delay for all the packets that are not processed yet
+        Create a Packet, or a row in the Packet_Table if NSS_PACKET_TABLE is enabled
         """
-        for aux in self.packets:
-            packet = self.packets[aux]
-            if packet.active:
-                packet.delay += 1
-                if packet.sla_violated == False and packet.max_delay < packet.delay:
-                    # packet.sla_violated = True
-                    self.mark_packet_as_sla_violated(packet.sfc_request, packet.packet_id, (packet.delay - packet.max_delay) / packet.max_delay)
+        if self.packet_table:
+            return self.packets.create(packet_id, created_at, sfc_request, max_delay, total_sfc_requests_active, size)
+
+        return Packet(packet_id, created_at, sfc_request, max_delay, total_sfc_requests_active, size)
+
+    def add_packet(self, packet):
+        """
+        Add a new packet in the simulation and schedule the tick where its SLA will be violated
+        if it is still active. The delay of a packet is the number of ticks processed while it is active,
+        thus the SLA is violated in the first tick where this number is greater than the max delay
+        """
+        packet.created_tick = self.timer.tick
+        if not self.packet_table:
+            packet.index = next(self.packets_seq)
+
+        key = (packet.sfc_request.name, packet.packet_id)
+        self.packets[key] = packet
+
+        deadline = packet.created_tick + math.floor(packet.max_delay) + 1
+        heapq.heappush(self.packets_deadline, (deadline, packet.index, key))
+
+    def deactivate_packet(self, sfc_request, packet_id):
+        """
+        Define the packet as not active, its delay stops being counted
+        """
+        packet = self.packets[(sfc_request.name, packet_id)]
+        if packet.active:
+            packet.delay = self.timer.tick - packet.created_tick
+            packet.active = False
+
+    def retire_packet(self, sfc_request, packet_id):
+        """
+        Move the packet that is not active anymore (processed, dropped or orphan) to the archive
+        """
+        key = (sfc_request.name, packet_id)
+        packet = self.packets[key]
+        if not packet.active:
+            for observer in self.packet_observers:
+                observer.observe_packet(packet)
+
+            # The rows of the Packet_Table are kept after the packet is removed
+            if not self.packet_table:
+                self.packets_archive.append(packet)
+            del self.packets[key]
+
+    def expire_packets_deadline(self):
+        """
+        Mark as SLA violated the active packets where the delay became greater than the max delay in this tick
+        """
+        while self.packets_deadline and self.packets_deadline[0][0] <= self.env.now:
+            deadline, _, key = heapq.heappop(self.packets_deadline)
+            packet = self.packets.get(key)
+
+            # The packet already left the simulation
+            if packet is None:
+                continue
+
+            if packet.active and packet.sla_violated == False:
+                delay = self.env.now - packet.created_tick
+                self.mark_packet_as_sla_violated(packet.sfc_request, packet.packet_id, (delay - packet.max_delay) / packet.max_delay)
+
+                for observer in self.packet_observers:
+                    observer.observe_deadline(packet)
 
     def change_users_location(self):
         """
@@ -1107,6 +1484,7 @@ class Simulation:
                 old_sfc_instances[request.name] = request.sfc_instance
 
             print("Replacement Called!")
+            self.timer.sync(self.env.now)
             vnf_instances = self.placement.execute(
                 sfc_requests=requests_to_replace,
                 sd=self.sd,
@@ -1154,6 +1532,9 @@ class Simulation:
                     self.sd.add_sfc_request_event(Simulation_Data.EVENT_SFC_REQUEST_REPLACEMENT_FAILED, 
                         self.env.now,                       
                         sfc_req)
+
+            self.num_sfc_requests_active = None
+            self.timer.track(self.env.now)
                     
 
     def mark_packet_as_sla_violated(self, sfc_request, packet_id, violation_percentage=1.0):
@@ -1176,15 +1557,39 @@ class Simulation:
                     sfc_request
                 )
 
+    def save_packets_csv(self, file_path="."):
+        """
+        Save all the packets created in the simulation into a CSV file
+        """
+        if self.packet_table:
+            self.packets.save_csv(file_path)
+        else:
+            Packet.save_csv(self.packets, file_path, self.packets_archive)
+
+    def list_packets(self):
+        """
+        Print all the packets created in the simulation
+        """
+        if self.packet_table:
+            Packet.list({}, self.packets)
+        else:
+            Packet.list(self.packets, self.packets_archive)
+
     def finish_simulation(self):
         """
         This method is executed after the Simpy finished the simulation.
         """
 
-        # For all the packets that is not processed but active we will log an event for it disposal
+        # The last tick processed was 1ms before the end of the simulation
+        self.timer.sync(self.env.now - 1)
+
+        # For all the packets that is not processed but active we will log an event for it disposal,
+        # the packets in the archive are not active
         for aux in self.packets:
             packet = self.packets[aux]
             if packet.active:
+                packet.delay = self.env.now - 1 - packet.created_tick
+
                 # Event log, the packet ACTIVE but not processed in the end of the simulation
                 if self.log_vnf_instance_events:
                     self.sd.add_packet_event(
@@ -1193,3 +1598,7 @@ class Simulation:
                         packet.packet_id,
                         packet.sfc_request
                     )
+
+            # The packets still in the simulation are also in packets_entities.csv
+            for observer in self.packet_observers:
+                observer.observe_packet(packet)
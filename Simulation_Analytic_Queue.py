@@ -0,0 +1,70 @@
+import collections
+
+from simpy.events import NORMAL
+
+from Simulation_SimPy import triggered_event
+from Simulation_Timer import yield_turn
+
+
+class Simulation_Analytic_Queue:
+    """
+    Single server FIFO queue used instead of the simpy Resource of the VNF Instances with max_share == 1 and of the
+    links (capacity 1).
+
+    The departure of the packet n is D_n = max(A_n, D_{n-1}) + S_n, where A_n is the arrival time and S_n the
+    service time. The service time is computed by the packet when its service starts, with the state of the VNF
+    Instance at that time (e.g. after a scaling), exactly as the Resource path does.
+
+    The queue takes the same turns of the Request and Release events of the simpy Resource, thus the packets are
+    served in the same order and leave at the same times. The events are only created when they are needed: a
+    packet that arrives when the server is free starts in the current event if no other event of the current time
+    would be processed before its Request, and the release only schedules an event when there are packets waiting.
+    """
+
+    def __init__(self, env):
+        """
+        Args:
+            env (SimPy): The simpy environment
+        """
+        self.env = env
+
+        # True while a packet is using the server
+        self.busy = False
+
+        # The events of the packets waiting for the server, in arrival order
+        self.waiting = collections.deque()
+
+    def __len__(self):
+        """The number of packets waiting for the server"""
+        return len(self.waiting)
+
+    def request(self):
+        """
+        Add a packet arriving now in the queue, as Resource.request(). It returns the event that the packet must
+        wait for before its service starts, or None if the service starts now
+        """
+        # A Request of the Resource grants the server to the packets waiting before the new one
+        self.grant()
+
+        if not self.busy:
+            self.busy = True
+            return yield_turn(self.env, NORMAL)
+
+        turn = self.env.event()
+        self.waiting.append(turn)
+        return turn
+
+    def release(self):
+        """The packet in service leaves the server, as Resource.release()"""
+        self.busy = False
+
+        # The Release event of the Resource grants the server to the next packet when it is processed
+        if self.waiting:
+            event = triggered_event(self.env, NORMAL)
+            event.callbacks.append(lambda event: self.grant())
+
+    def grant(self):
+        """Give the free server to the first packet waiting, its event is processed as the Request of the Resource"""
+        if not self.busy and self.waiting:
+            self.busy = True
+            self.waiting.popleft().succeed()
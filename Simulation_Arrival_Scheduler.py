@@ -0,0 +1,95 @@
+import heapq
+
+from simpy.events import NORMAL, URGENT
+
+from Simulation_SimPy import next_key, reserve_eid, triggered_event_at
+
+
+class Simulation_Arrival_Scheduler:
+    """
+    Run the packet flow generators of all the SFC Requests as a single merged heap instead of one simpy
+    Process per SFC Request.
+
+    A flow generator is a plain generator that yields the time to wait until its next step (instead of a
+    simpy timeout). Each step is stored in the heap with the same key that simpy would use for the timeout,
+    (time, priority, eid), where the eid is reserved from the simpy counter, thus the steps run in the same
+    order that the old processes did. Only the earliest step has an event in the simpy queue, and the steps
+    that are due at the same instant are released in a batch while there is no other simpy event before them.
+    """
+
+    def __init__(self, env, on_finish=None):
+        """
+        Args:
+            env (SimPy): The simpy environment
+            on_finish (function, optional): Called when a flow generator finishes. Defaults to None.
+        """
+        self.env = env
+        self.on_finish = on_finish
+
+        # Heap with (time, priority, eid, generator)
+        self.arrivals = []
+
+        # Keys (time, priority, eid) of the steps with an event in the simpy queue
+        self.wakes = set()
+
+    def __len__(self):
+        return len(self.arrivals)
+
+    def add(self, generator):
+        """Add a flow generator, its first step runs in the current time like a new simpy Process
+
+        Args:
+            generator (generator): The flow generator
+        """
+        self.push(self.env.now, URGENT, generator)
+        self.schedule_wake()
+
+    def push(self, time, priority, generator):
+        heapq.heappush(self.arrivals, (time, priority, reserve_eid(self.env), generator))
+
+    def schedule_wake(self):
+        """Put an event in the simpy queue for the earliest step, if it does not have one"""
+        if not self.arrivals:
+            return
+
+        key = self.arrivals[0][:3]
+        if key in self.wakes:
+            return
+
+        self.wakes.add(key)
+
+        event = triggered_event_at(self.env, key)
+        event.callbacks.append(lambda event: self.release(key))
+
+    def release(self, key):
+        """Run the step with the key and all the steps due now that simpy would process before any other event
+
+        Args:
+            key (tuple): The key (time, priority, eid) of the event processed
+        """
+        self.wakes.discard(key)
+
+        # The step was already released in a batch
+        if not self.arrivals or self.arrivals[0][:3] != key:
+            self.schedule_wake()
+            return
+
+        while self.arrivals and self.arrivals[0][0] == self.env.now:
+            queue_key = next_key(self.env)
+            if queue_key is not None and queue_key < self.arrivals[0][:3]:
+                break
+
+            _, _, _, generator = heapq.heappop(self.arrivals)
+            self.step(generator)
+
+        self.schedule_wake()
+
+    def step(self, generator):
+        try:
+            delay = next(generator)
+        except StopIteration:
+            if self.on_finish is not None:
+                self.on_finish()
+            return
+
+        self.push(self.env.now + delay, NORMAL, generator)
@@ -0,0 +1,254 @@
+import csv
+import json
+import math
+import os
+from statistics import NormalDist
+
+import numpy as np
+from simpy.core import StopSimulation
+from simpy.events import URGENT
+
+from Simulation_Timer import scheduled_event
+
+
+class Simulation_Convergence_Monitor:
+    """
+    Monitor the KPIs reported by the simulation and stop it when they reach the steady state with the
+    required precision.
+
+    Each interval (simulation ms) one observation of each KPI is saved: the SLA violation rate of the packets that
+    left the simulation or violated the SLA while active in the interval, the mean and the p95 delay of the packets
+    processed in the interval and the CPU allocated by the VNF Instances. The packets still in the simulation when
+    it finishes are observed in the last observation, with the delay until the end of the simulation.
+
+    The end of the warm-up of each KPI is detected with MSER-5 and the observations after it are grouped in batches,
+    the simulation stops when the confidence interval of the batch means of all the KPIs is narrower than the
+    relative width configured.
+    """
+
+    KPIS = ["sla_violation_rate", "delay_mean", "delay_p95", "cpu_allocated"]
+
+    # Size of the batches of MSER-5
+    MSER_BATCH_SIZE = 5
+
+    def __init__(self, env, edge_environment, interval, relative_width, confidence=0.95, batches=20, min_time=0, kpis=None):
+        """
+        Args:
+            env (SimPy): The simpy environment
+            edge_environment (Edge_Environment): The edge environment
+            interval (int): The time between the observations
+            relative_width (float): The max half width of the confidence interval relative to the mean
+            confidence (float, optional): The confidence level. Defaults to 0.95.
+            batches (int, optional): The number of batches of the batch means. Defaults to 20.
+            min_time (int, optional): The simulation never stops before this time. Defaults to 0.
+            kpis (list, optional): The KPIs that must converge. Defaults to all the KPIS.
+        """
+        self.env = env
+        self.edge_environment = edge_environment
+        self.interval = int(interval)
+        self.relative_width = float(relative_width)
+        self.confidence = float(confidence)
+        self.batches = int(batches)
+        self.min_time = int(min_time)
+        self.kpis = kpis or self.KPIS
+
+        # Observations: KPI -> list of (time, value)
+        self.observations = {kpi: [] for kpi in self.KPIS}
+
+        # Packets observed in the current interval
+        self.packets_observed = 0
+        self.packets_sla_violated = 0
+        self.delays = []
+
+        # The packets observed when their SLA was violated while active, (sfc_request, packet_id)
+        self.packets_expired = set()
+
+        # The time of the last observation
+        self.last_collect = 0
+
+        # The result of the last check: KPI -> dict with the truncation, mean and half width
+        self.estimates = {}
+        self.stop_reason = "total_time"
+        self.stop_time = None
+
+    def observe_packet(self, packet):
+        """Called by the simulation when a packet leaves the simulation (processed, dropped or orphan) or when the
+        simulation finishes, the packets still active count with the delay until the end of the simulation"""
+        key = (packet.sfc_request.name, packet.packet_id)
+        if key in self.packets_expired:
+            # The SLA violation was observed in the interval of the deadline
+            self.packets_expired.remove(key)
+        else:
+            self.packets_observed += 1
+            if packet.sla_violated:
+                self.packets_sla_violated += 1
+
+        if packet.processed or packet.active:
+            self.delays.append(packet.delay)
+
+    def observe_deadline(self, packet):
+        """Called by the simulation when the SLA of an active packet is violated, the slow packets are observed
+        without waiting for them to leave the simulation"""
+        self.packets_expired.add((packet.sfc_request.name, packet.packet_id))
+        self.packets_observed += 1
+        self.packets_sla_violated += 1
+
+    def run(self):
+        """The monitoring process"""
+        while True:
+            yield self.env.timeout(self.interval)
+
+            self.collect()
+
+            if self.env.now >= self.min_time and self.converged():
+                self.stop("converged")
+                return
+
+    def collect(self):
+        """Save the observations of the interval that finished"""
+        now = self.env.now
+
+        if self.packets_observed > 0:
+            self.observations["sla_violation_rate"].append((now, self.packets_sla_violated / self.packets_observed))
+
+        if self.delays:
+            self.observations["delay_mean"].append((now, float(np.mean(self.delays))))
+            self.observations["delay_p95"].append((now, float(np.percentile(self.delays, 95))))
+
+        self.observations["cpu_allocated"].append((now, self.edge_environment.calc_resources_usage()['cpu_allocated']))
+
+        self.packets_observed = 0
+        self.packets_sla_violated = 0
+        self.delays = []
+        self.last_collect = now
+
+    def converged(self):
+        """Estimate the steady state of each KPI and return True if all of them have the precision required"""
+        converged = True
+        for kpi in self.kpis:
+            estimate = self.estimate([value for _, value in self.observations[kpi]])
+            if estimate is None:
+                self.estimates[kpi] = None
+                converged = False
+                continue
+
+            truncation, mean, half_width = estimate
+            relative_width = half_width / abs(mean) if mean != 0 else (0 if half_width == 0 else math.inf)
+
+            self.estimates[kpi] = {
+                "truncation_time": self.observations[kpi][truncation][0] - self.interval,
+                "observations": len(self.observations[kpi]) - truncation,
+                "mean": mean,
+                "half_width": half_width,
+                "relative_width": relative_width
+            }
+
+            if relative_width > self.relative_width:
+                converged = False
+
+        return converged
+
+    def estimate(self, values):
+        """
+        Return (truncation, mean, half width) of the steady state of the observations, or None if there are not
+        enough observations after the warm-up to compute the batch means
+        """
+        truncation = self.mser5(values)
+        if truncation is None:
+            return None
+
+        steady = values[truncation:]
+        batch_size = len(steady) // self.batches
+        if batch_size < 2:
+            return None
+
+        # The first observations that do not fill a batch are discarded
+        steady = steady[len(steady) - batch_size * self.batches:]
+        batch_means = np.asarray(steady, dtype=float).reshape(self.batches, batch_size).mean(axis=1)
+
+        mean = float(np.mean(steady))
+        half_width = t_quantile((1 + self.confidence) / 2, self.batches - 1) * float(np.std(batch_means, ddof=1)) / math.sqrt(self.batches)
+        return truncation, mean, half_width
+
+    def mser5(self, values):
+        """
+        The truncation point of MSER-5: the observations are grouped in batches of 5 and the truncation d (in
+        batches) minimizes the standard error of the mean of the remaining batches, sum((x - mean)^2) / (n - d)^2.
+        Only the first half of the batches is tested, when the minimum is not there the warm-up did not finish.
+
+        Returns:
+            int: The index of the first observation of the steady state, or None
+        """
+        n = len(values) // self.MSER_BATCH_SIZE
+        if n < 4:
+            return None
+
+        batch_means = np.asarray(values[:n * self.MSER_BATCH_SIZE], dtype=float).reshape(n, self.MSER_BATCH_SIZE).mean(axis=1)
+
+        best = None
+        best_statistic = math.inf
+        for d in range(n - 1):
+            remaining = batch_means[d:]
+            statistic = float(np.sum((remaining - remaining.mean()) ** 2)) / (n - d) ** 2
+            if statistic < best_statistic:
+                best, best_statistic = d, statistic
+
+        if best >= n // 2:
+            return None
+
+        return best * self.MSER_BATCH_SIZE
+
+    def stop(self, reason):
+        """Stop the simulation in the next ms, like the end of the total time"""
+        self.stop_reason = reason
+        self.stop_time = self.env.now + 1
+
+        event = scheduled_event(self.env, URGENT, 1)
+        event.callbacks.append(StopSimulation.callback)
+
+    def save(self, file_path="."):
+        """
+        Save the observations (convergence.csv) and the truncation points, the estimates and the stopping reason
+        (convergence.json)
+        """
+        os.makedirs(file_path, exist_ok=True)
+
+        # The last observation has the interval not collected and the packets still in the simulation, the
+        # estimates of the end of the simulation include it
+        if self.env.now > self.last_collect:
+            self.collect()
+        self.converged()
+
+        summary = {
+            "stop_reason": self.stop_reason,
+            "stop_time": self.stop_time if self.stop_time is not None else self.env.now,
+            "interval": self.interval,
+            "relative_width": self.relative_width,
+            "confidence": self.confidence,
+            "batches": self.batches,
+            "kpis": {kpi: self.estimates.get(kpi) for kpi in self.kpis}
+        }
+        with open(os.path.join(file_path, "convergence.json"), "w") as file:
+            json.dump(summary, file, indent=2)
+
+        with open(os.path.join(file_path, "convergence.csv"), "w", newline="") as file:
+            writer = csv.writer(file, delimiter=";")
+            writer.writerow(["Time", "KPI", "Value"])
+            for kpi in self.KPIS:
+                for time, value in self.observations[kpi]:
+                    writer.writerow([time, kpi, value])
+
+
+def t_quantile(p, df):
+    """The quantile p of the Student t distribution with df degrees of freedom (Cornish-Fisher expansion, the
+    expansion is not accurate for 1 and 2 degrees of freedom, they have a closed form)"""
+    if df == 1:
+        return math.tan(math.pi * (p - 0.5))
+    if df == 2:
+        return (2 * p - 1) / math.sqrt(2 * p * (1 - p))
+
+    z = NormalDist().inv_cdf(p)
+    return (z
+            + (z ** 3 + z) / (4 * df)
+            + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * df ** 2)
+            + (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / (384 * df ** 3))
@@ -0,0 +1,188 @@
+import csv
+import functools
+import os
+import time
+
+from Simulation_SimPy import queue_length
+
+# Counters of the simpy environment: events processed, live processes by kind, the queues of the VNF Instances
+# and Links resources and the size of the simpy heap. Only enabled when the environment variable NSS_COUNTERS is 1,
+# the counters are sampled every NSS_COUNTERS_INTERVAL ms (simulation time) and saved in counters.csv and
+# counters_resources.csv.
+#
+# The samples are taken by the wrapper of env.step when the simulation time reaches the next sample time, thus no
+# event is added to the simpy queue and the results of the simulation are not changed.
+
+DEFAULT_INTERVAL = 100
+
+# The kinds of processes counted, the flow generators are counted by the arrival scheduler
+KINDS = ["flow_generator", "process_sfc_request", "vnf_process", "link_process", "monitor_sfc_instance", "scaling_up", "scaling_down"]
+
+enabled = False
+interval = DEFAULT_INTERVAL
+
+# Kind -> live processes
+live = {}
+
+# Defined by start()
+env = None
+simulation = None
+events = 0
+next_sample = 0
+last_sample = None
+samples = []
+
+# Resource name -> [type, capacity, peak queue, peak users]
+resources = {}
+
+
+def configure():
+    """Enable the counters if NSS_COUNTERS is 1 and reset them, called at the start of each round"""
+    global enabled, interval, env, simulation, events, next_sample, last_sample
+    enabled = False
+    try:
+        if os.environ["NSS_COUNTERS"] == "1":
+            enabled = True
+    except KeyError as ke:
+        pass
+
+    interval = DEFAULT_INTERVAL
+    if "NSS_COUNTERS_INTERVAL" in os.environ and os.environ["NSS_COUNTERS_INTERVAL"]:
+        interval = int(os.environ["NSS_COUNTERS_INTERVAL"])
+
+    live.clear()
+    for kind in KINDS:
+        live[kind] = 0
+
+    env = None
+    simulation = None
+    events = 0
+    next_sample = 0
+    last_sample = None
+    samples.clear()
+    resources.clear()
+
+
+def counted(generator, kind):
+    """Count the generator as a live process of the kind while it runs, returned unchanged if disabled"""
+    if not enabled:
+        return generator
+
+    return _counted(generator, kind)
+
+
+def _counted(generator, kind):
+    live[kind] += 1
+    try:
+        return (yield from generator)
+    finally:
+        live[kind] -= 1
+
+
+def instrument(obj, method, kind):
+    """
+    Replace the generator method of the object by a wrapper that counts the live processes of the kind. Nothing is
+    done if the counters are disabled
+
+    Args:
+        obj (object): The object, e.g. the Simulation
+        method (str): The generator method name
+        kind (str): One of the KINDS
+    """
+    if not enabled:
+        return
+
+    original = getattr(obj, method)
+
+    @functools.wraps(original)
+    def wrapper(*args, **kwargs):
+        return _counted(original(*args, **kwargs), kind)
+
+    setattr(obj, method, wrapper)
+
+
+def start(simpy_env, sm):
+    """
+    Start counting the events processed by the environment
+
+    Args:
+        simpy_env (SimPy): The simpy environment
+        sm (Simulation): The simulation, its resources and arrival scheduler are sampled
+    """
+    global env, simulation, next_sample
+    if not enabled:
+        return
+
+    env = simpy_env
+    simulation = sm
+    next_sample = env.now
+
+    step = env.step
+
+    def counting_step():
+        global events
+        step()
+        events += 1
+        if env.now >= next_sample:
+            sample()
+
+    env.step = counting_step
+
+
+def sample():
+    """Save a sample of the counters and update the peaks of the resources"""
+    global next_sample, last_sample
+
+    now = env.now
+    wall_time = time.perf_counter()
+
+    events_per_second = None
+    if last_sample is not None and wall_time > last_sample[1]:
+        events_per_second = (events - last_sample[2]) / (wall_time - last_sample[1])
+
+    queued = {"vnf": 0, "link": 0}
+    for resource_type, resource_dict in [("vnf", simulation.resource_instances), ("link", simulation.resource_links)]:
+        for name, resource in resource_dict.items():
+            queue = len(resource.queue)
+            users = resource.count
+            queued[resource_type] += queue
+
+            if name not in resources:
+                resources[name] = [resource_type, resource.capacity, 0, 0]
+            resources[name][2] = max(resources[name][2], queue)
+            resources[name][3] = max(resources[name][3], users)
+
+    live["flow_generator"] = len(simulation.arrival_scheduler)
+
+    samples.append(
+        [min(next_sample, now), now, events, events_per_second, queue_length(env)]
+        + [live[kind] for kind in KINDS]
+        + [queued["vnf"], queued["link"]]
+    )
+
+    last_sample = (now, wall_time, events)
+    next_sample = (now // interval + 1) * interval
+
+
+def save(file_path="."):
+    """Save the samples (counters.csv) and the peak queue of each resource (counters_resources.csv)"""
+    if not enabled or env is None:
+        return
+
+    # The state at the end of the simulation
+    sample()
+
+    os.makedirs(file_path, exist_ok=True)
+
+    with open(os.path.join(file_path, "counters.csv"), "w", newline="") as file:
+        writer = csv.writer(file, delimiter=";")
+        writer.writerow(["Time", "Event_Time", "Events", "Events_Per_Second", "Heap_Size"]
+                        + ["Processes_{}".format(kind) for kind in KINDS]
+                        + ["Queue_VNF_Instances", "Queue_Links"])
+        writer.writerows(samples)
+
+    with open(os.path.join(file_path, "counters_resources.csv"), "w", newline="") as file:
+        writer = csv.writer(file, delimiter=";")
+        writer.writerow(["Resource", "Type", "Capacity", "Peak_Queue", "Peak_Users"])
+        for name, values in sorted(resources.items()):
+            writer.writerow([name] + values)
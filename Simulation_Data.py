@@ -9,6 +9,8 @@ import pandas as pd
 import os
 import csv
 
+from Simulation_Event_Buffer import Simulation_Event_Buffer
+
 # Object to store the data logs from the simulation
 class Simulation_Data():
 
@@ -159,44 +161,25 @@ class Simulation_Data():
     
     rlagent_columns = ["Event", "Time", "VNF_Instance", "Agent", "Value", "Reward"]
 
-    # sfcs = pd.DataFrame(columns=sfcs_columns)
-    # scaling =  pd.DataFrame(columns=scaling_columns)
-    # resources             = pd.DataFrame(columns=resources_columns)
-    scaling_buffer = []
-    vnf_instance_resources_buffer = []
-    vnf_instance_packets_buffer = []
-    vnf_instance_buffer = []
-    sfc_instance_buffer = []
-    links_buffer = []
-    sfc_request_buffer = []
-    placement_buffer = []
-    time_window_buffer = []
-    packets_buffer = []
-    sfc_instance_vnf_mapping_buffer = []
-    user_mobility_buffer = []
-    migration_buffer = []
-    sfc_instance_resources_buffer = []
-    resource_usage_buffer = []
-    monitor_buffer = []
-    rlagent_buffer = []
-
-    vnf_instance_resources      = pd.DataFrame(columns=vnf_instance_resources_columns)
-    vnf_instance_packets        = pd.DataFrame(columns=vnf_instance_packets_columns)
-    vnf_instance                = pd.DataFrame(columns=vnf_instance_columns)
-    sfc_instance                = pd.DataFrame(columns=sfc_instance_columns)
-    links                       = pd.DataFrame(columns=links_columns)    
-    sfc_request                 = pd.DataFrame(columns=sfc_requests_columns)    
-    placement                   = pd.DataFrame(columns=placement_columns)
-    time_window                 = pd.DataFrame(columns=time_window_columns)
-    packets                     = pd.DataFrame(columns=packets_columns)
-    sfc_instance_vnf_mapping    = pd.DataFrame(columns=sfc_instance_vnf_mapping_columns)
-    user_mobility               = pd.DataFrame(columns=user_mobility_columns)
-    migration                   = pd.DataFrame(columns=migration_columns)
-    scaling                     = pd.DataFrame(columns=scaling_columns)
-    sfc_instance_resources      = pd.DataFrame(columns=sfc_instance_resources_columns)
-    resource_usage              = pd.DataFrame(columns=resource_usage_columns)
-    monitor                     = pd.DataFrame(columns=monitor_columns)
-    rlagent                     = pd.DataFrame(columns=rlagent_columns)
+    def __init__(self):
+        # The append-only buffers with the events of each table, in chronological order
+        self.scaling_buffer                  = Simulation_Event_Buffer(self.scaling_columns)
+        self.vnf_instance_resources_buffer   = Simulation_Event_Buffer(self.vnf_instance_resources_columns)
+        self.vnf_instance_packets_buffer     = Simulation_Event_Buffer(self.vnf_instance_packets_columns)
+        self.vnf_instance_buffer             = Simulation_Event_Buffer(self.vnf_instance_columns)
+        self.sfc_instance_buffer             = Simulation_Event_Buffer(self.sfc_instance_columns)
+        self.links_buffer                    = Simulation_Event_Buffer(self.links_columns)
+        self.sfc_request_buffer              = Simulation_Event_Buffer(self.sfc_requests_columns)
+        self.placement_buffer                = Simulation_Event_Buffer(self.placement_columns)
+        self.time_window_buffer              = Simulation_Event_Buffer(self.time_window_columns)
+        self.packets_buffer                  = Simulation_Event_Buffer(self.packets_columns)
+        self.sfc_instance_vnf_mapping_buffer = Simulation_Event_Buffer(self.sfc_instance_vnf_mapping_columns)
+        self.user_mobility_buffer            = Simulation_Event_Buffer(self.user_mobility_columns)
+        self.migration_buffer                = Simulation_Event_Buffer(self.migration_columns)
+        self.sfc_instance_resources_buffer   = Simulation_Event_Buffer(self.sfc_instance_resources_columns)
+        self.resource_usage_buffer           = Simulation_Event_Buffer(self.resource_usage_columns)
+        self.monitor_buffer                  = Simulation_Event_Buffer(self.monitor_columns)
+        self.rlagent_buffer                  = Simulation_Event_Buffer(self.rlagent_columns)
 
     def add_user_mobility_event(self, event, time, user_name, origin_node_name, destiny_node_name):
         """Add a new SFC Instance event, created or destroyed
@@ -208,17 +191,16 @@ class Simulation_Data():
             origin_node_name (Node): actual node
             destiny_node_name (Node): new node
         """
-        self.user_mobility_buffer.insert(0,[
+        self.user_mobility_buffer.append([
             event,
-            "{:.2f}".format(time),
+            round(time, 2),
             user_name,
             origin_node_name,
             destiny_node_name
         ])
 
     def get_user_mobility_events(self):
-        self.user_mobility = self.flush_events(self.user_mobility, self.user_mobility_buffer)
-        return self.user_mobility
+        return self.flush_events(self.user_mobility_buffer)
 
     def get_num_packets_ingress_sfc_instance(self, sfc_instance, start, end):
         """Return the number of packets that ingress in a SFC_Instance
@@ -229,15 +211,16 @@ class Simulation_Data():
             end (int): The duration time
         """        
         columns_name_sfc_instance = "SFC Instance"
-        df = self.packets
+        df = self.packets_buffer.frame()
         df = df.loc[(df[columns_name_sfc_instance] == sfc_instance.name) & (df['Event'] == self.EVENT_PACKET_CREATED) & (pd.to_numeric(df['Time']) >= start) & (pd.to_numeric(df['Time']) <= end)]
 
         return df.shape[0]
 
     def check_service_delay_above_threshold(self, df_packets, df_vnf_packets, number_of_packets, migration_threshold, sfc_req):
-        df_vnf_packets.Time = pd.to_numeric(df_vnf_packets["Time"])
-        df_vnf_packets = df_vnf_packets.sort_values(by='Time', ascending=False)
-        df_vnf_packets = df_vnf_packets.head(number_of_packets)
+        # The last packets processed, the events are in chronological order and the stable sort keeps it
+        # between the events of the same time
+        df_vnf_packets = df_vnf_packets.sort_values(by='Time', kind='stable')
+        df_vnf_packets = df_vnf_packets.tail(number_of_packets)
         
         packets_to_consider = df_vnf_packets["Packet_ID"].unique()
         df_packets = df_packets.loc[(df_packets["Packet_ID"].isin(packets_to_consider))]
@@ -261,9 +244,8 @@ class Simulation_Data():
             migration_threshold (float): The migration threshold to be compared with average latency
         """   
         above_threshold_services = []
-        df_packets = self.packets
+        df_packets = self.packets_buffer.frame()
         df_vnf_packets = self.get_vnf_instance_packets_events()
-        df_vnf_packets["Time"] = pd.to_numeric(df_vnf_packets["Time"])
         df_packets = df_packets.loc[(df_packets["SFC_Instance"] == sfc_instance.name) & (df_packets['Event'] == self.EVENT_PACKET_CREATED)]
             
         df_vnf_packets = df_vnf_packets.loc[(df_vnf_packets['Event'] == self.VNF_INSTANCE_PACKET_PROCESSED)]
@@ -292,9 +274,10 @@ class Simulation_Data():
         """
         columns_name_sfc_instance = "SFC_Instance"
 
-        df = self.get_packets_events()
+        self.flush_events(self.packets_buffer)
+        df = self.packets_buffer.time_window(start, end, include_end=True)
 
-        df_packet_violated = df.loc[(df[columns_name_sfc_instance] == sfc_instance.name) & (df['Event'] == self.EVENT_PACKET_SLA_VIOLATED) & (pd.to_numeric(df['Time']) >= start) & (pd.to_numeric(df['Time']) <= end)]
+        df_packet_violated = df.loc[(df[columns_name_sfc_instance] == sfc_instance.name) & (df['Event'] == self.EVENT_PACKET_SLA_VIOLATED)]
 
         return df_packet_violated
         # df_processed = df.loc[(df[columns_name_sfc_instance] == sfc_instance.name) & (df['Event'] == self.EVENT_PACKET_PROCESSED) & (pd.to_numeric(df['Time']) >= start) & (pd.to_numeric(df['Time']) <= end)]
@@ -327,9 +310,9 @@ class Simulation_Data():
         for sfc_request in sfc_requests:
             aux_list.append(sfc_request.name)
 
-        self.time_window_buffer.insert(0,[
+        self.time_window_buffer.append([
             event, 
-            "{:.2f}".format(time),
+            round(time, 2),
             window_init,
             window_end,
             sfc_requests_placed,
@@ -345,8 +328,7 @@ class Simulation_Data():
         ])
 
     def get_time_window_events(self):
-        self.time_window = self.flush_events(self.time_window, self.time_window_buffer)
-        return self.time_window
+        return self.flush_events(self.time_window_buffer)
 
     def add_packet_event(self, event, time, packet_id, sfc_request):
         """Add packets events
@@ -363,9 +345,9 @@ class Simulation_Data():
         if sfc_request.sfc_instance:
             sfc_instance_name = sfc_request.sfc_instance.name
 
-        self.packets_buffer.insert(0,[
+        self.packets_buffer.append([
             event, 
-            "{:.2f}".format(time),
+            round(time, 2),
             packet_id,
             sfc_request.name,
             sfc_instance_name,
@@ -375,8 +357,7 @@ class Simulation_Data():
         ])
 
     def get_packets_events(self):
-        self.packets = self.flush_events(self.packets, self.packets_buffer)
-        return self.packets
+        return self.flush_events(self.packets_buffer)
 
     def get_packets_events_from_sfc_instance(self, sfc_instance_name, start_time, end_time):
         """
@@ -386,11 +367,9 @@ class Simulation_Data():
         start_time: Return events with time higher than start_time
         end_time: Return events with time below the end_time
         """
-        self.packets = self.flush_events(self.packets, self.packets_buffer)
-        self.packets["Time"] = pd.to_numeric(self.packets["Time"])
-        # print(start_time, end_time)
-        return self.packets[(self.packets["SFC_Instance"] == sfc_instance_name) & (self.packets["Time"] >= start_time)
-                            & (self.packets["Time"] < end_time)]
+        self.flush_events(self.packets_buffer)
+        events = self.packets_buffer.time_window(start_time, end_time)
+        return events[events["SFC_Instance"] == sfc_instance_name]
 
     def get_packets_events_from_vnf_instance(self, vnf_instance_name, sfc_instance_name, start_time, end_time):
         """
@@ -400,15 +379,10 @@ class Simulation_Data():
         start_time: Return events with time higher than start_time
         end_time: Return events with time below the end_time
         """
-        self.vnf_instance_packets = self.get_vnf_instance_packets_events()
-
-        self.vnf_instance_packets["Time"] = pd.to_numeric(self.vnf_instance_packets["Time"])
+        self.flush_events(self.vnf_instance_packets_buffer)
+        events = self.vnf_instance_packets_buffer.time_window(start_time, end_time)
 
-        return self.vnf_instance_packets[
-            (self.vnf_instance_packets["VNF_Instance"] == vnf_instance_name) &
-            (self.vnf_instance_packets["SFC_Instance"] == sfc_instance_name) &
-            (self.vnf_instance_packets["Time"] >= start_time) & (self.vnf_instance_packets["Time"] < end_time)
-        ]
+        return events[(events["VNF_Instance"] == vnf_instance_name) & (events["SFC_Instance"] == sfc_instance_name)]
 
     def add_placement_event(self, event, time):
         """Add a new VNF event to the log system
@@ -417,14 +391,13 @@ class Simulation_Data():
             event (str): The event type
             time (int): Time simulation
         """
-        self.placement_buffer.insert(0,[
+        self.placement_buffer.append([
             event, 
-            "{:.2f}".format(time)
+            round(time, 2)
         ])
 
     def get_placement_events(self):
-        self.placement = self.flush_events(self.placement, self.placement_buffer)
-        return self.placement
+        return self.flush_events(self.placement_buffer)
 
     def add_migration_event(self, event, time, sfc_request):
         """Add a new migration event to the log system
@@ -435,16 +408,15 @@ class Simulation_Data():
             sfc_request (SFC_Request): The SFC Request
         """
 
-        self.migration_buffer.insert(0,[
+        self.migration_buffer.append([
             event, 
-            "{:.2f}".format(time),
+            round(time, 2),
             sfc_request.name,
             sfc_request.user.name,
         ])
 
     def get_migration_events(self):
-        self.migration = self.flush_events(self.migration, self.migration_buffer)
-        return self.migration
+        return self.flush_events(self.migration_buffer)
 
     def add_sfc_request_event(self, event, time, sfc_request, sfc_request_placement_order = -1):
         """Add a new SFC_Request event to the log system
@@ -460,17 +432,16 @@ class Simulation_Data():
         except:
             sfc_instance_name = ""
 
-        self.sfc_request_buffer.insert(0,[
+        self.sfc_request_buffer.append([
             event, 
-            "{:.2f}".format(time),
+            round(time, 2),
             sfc_request.name,
             sfc_instance_name,
             sfc_request_placement_order
         ])
 
     def get_sfc_request_events(self):
-        self.sfc_request = self.flush_events(self.sfc_request, self.sfc_request_buffer)
-        return self.sfc_request
+        return self.flush_events(self.sfc_request_buffer)
 
     def add_vnf_instance_event(self, event, time, vnf_instance):
         """Add a new VNF Instance event, created or destroyed
@@ -480,9 +451,9 @@ class Simulation_Data():
             time (int): Time simulation
             vnf_instance (VNF_Instance): The VNF_Instance
         """
-        self.vnf_instance_buffer.insert(0,[
+        self.vnf_instance_buffer.append([
             event, 
-            "{:.2f}".format(time),
+            round(time, 2),
             vnf_instance.name,
             vnf_instance.node.name,
             vnf_instance.vnf.name,
@@ -491,8 +462,7 @@ class Simulation_Data():
         ])
     
     def get_vnf_instance_events(self):
-        self.vnf_instance = self.flush_events(self.vnf_instance, self.vnf_instance_buffer)
-        return self.vnf_instance
+        return self.flush_events(self.vnf_instance_buffer)
 
     def add_sfc_instance_event(self, event, time, sfc_instance):
         """Add a new SFC Instance event, created or destroyed
@@ -502,15 +472,14 @@ class Simulation_Data():
             time (int): Time simulation
             sfc_instance (SFC_Instance): The SFC_Instance
         """
-        self.sfc_instance_buffer.insert(0,[
+        self.sfc_instance_buffer.append([
             event, 
-            "{:.2f}".format(time),
+            round(time, 2),
             sfc_instance.name
         ])
 
     def get_sfc_instance_events(self):
-        self.sfc_instance = self.flush_events(self.sfc_instance, self.sfc_instance_buffer)
-        return self.sfc_instance
+        return self.flush_events(self.sfc_instance_buffer)
 
     def add_sfc_instance_vnf_mapping_event(self, event, time, sfc_instance, vnf_instance):
         """Add a new SFC Instance event, created or destroyed
@@ -521,16 +490,15 @@ class Simulation_Data():
             sfc_instance (SFC_Instance): The SFC_Instance
             vnf_instance (SFC_Instance): The VNF_Instance
         """
-        self.sfc_instance_vnf_mapping_buffer.insert(0,[
+        self.sfc_instance_vnf_mapping_buffer.append([
             event,
-            "{:.2f}".format(time),
+            round(time, 2),
             sfc_instance.name,
             vnf_instance.name,
         ])
 
     def get_sfc_instance_vnf_mapping_events(self):
-        self.sfc_instance_vnf_mapping = self.flush_events(self.sfc_instance_vnf_mapping, self.sfc_instance_vnf_mapping_buffer)
-        return self.sfc_instance_vnf_mapping
+        return self.flush_events(self.sfc_instance_vnf_mapping_buffer)
 
     def add_vnf_instance_packets_event(self, event, time, packet_id, vnf_instance, sfc_request, sfc_instance, packet_size = 0, wait_time=-1):
         """Add packets events in the VNF_Instance
@@ -545,8 +513,8 @@ class Simulation_Data():
             packet_size (int): Total em IPTs consumed by the packet
             wait_time (int): Time in which the packet waited in VNF queue OR waited to be processed by the VNF
         """
-        self.vnf_instance_packets_buffer.insert(0,[event, 
-            "{:.2f}".format(time),
+        self.vnf_instance_packets_buffer.append([event, 
+            round(time, 2),
             packet_id,
             vnf_instance.name,
             sfc_request.name,
@@ -558,14 +526,12 @@ class Simulation_Data():
             wait_time])
 
     def get_vnf_instance_packets_events(self):
-        self.vnf_instance_packets = self.flush_events(self.vnf_instance_packets, self.vnf_instance_packets_buffer)
-        return self.vnf_instance_packets
+        return self.flush_events(self.vnf_instance_packets_buffer)
 
-    def flush_events(self, df, df_buffer):
-        if len(df_buffer) > 0:
-            df = pd.concat([pd.DataFrame(df_buffer,columns=df.columns),df],ignore_index=True)
-            df_buffer.clear()
-        return df
+    def flush_events(self, df_buffer):
+        """Return the DataFrame with all the events of the buffer, in chronological order"""
+        df_buffer.flush()
+        return df_buffer.frame()
 
     def add_link_event(self, event, time, packet_id, link, sfc_request, sfc_instance, vnf_instance_name, packet_size):
         """Add link events
@@ -579,9 +545,9 @@ class Simulation_Data():
             sfc_instance (SFC_Instance): The SFC_Instance
             vnf_instance_name (str): The vnf_instance name
         """
-        self.links_buffer.insert(0,[
+        self.links_buffer.append([
             event, 
-            "{:.2f}".format(time),
+            round(time, 2),
             packet_id,
             link.name,
             sfc_request.name,
@@ -596,8 +562,7 @@ class Simulation_Data():
         ])
 
     def get_link_events(self):
-        self.links = self.flush_events(self.links, self.links_buffer)
-        return self.links
+        return self.flush_events(self.links_buffer)
 
     def add_vnf_instance_resources_event(self, event, time, vnf_instance, cpu_usage, mem_usage, sfc_request, packet_id):
         """Add a new Instance  event to the log system 
@@ -612,9 +577,9 @@ class Simulation_Data():
             sfc_request (SFC_Request): The SFC Request
             packet_id (int): The packet id
         """
-        self.vnf_instance_resources_buffer.insert(0,[
+        self.vnf_instance_resources_buffer.append([
             event,
-            "{:.2f}".format(time),
+            round(time, 2),
             vnf_instance.name,            
             vnf_instance.cpu, 
             "{:.2f}".format(cpu_usage),
@@ -627,8 +592,7 @@ class Simulation_Data():
         ])
     
     def get_vnf_instance_resources_events(self):
-        self.vnf_instance_resources = self.flush_events(self.vnf_instance_resources, self.vnf_instance_resources_buffer)
-        return self.vnf_instance_resources
+        return self.flush_events(self.vnf_instance_resources_buffer)
 
     def get_vnf_instance_resources_events_window(self, vnf_instance_name, start_time, end_time):
         """
@@ -638,10 +602,9 @@ class Simulation_Data():
         start_time: Return events with time higher than start_time
         end_time: Return events with time below the end_time
         """
-        events = self.get_vnf_instance_resources_events()
-        events["Time"] = pd.to_numeric(events["Time"])
-        return events[(events["VNF_Instance"] == vnf_instance_name) & (events["Time"] >= start_time)
-                            & (events["Time"] <= end_time)]
+        self.flush_events(self.vnf_instance_resources_buffer)
+        events = self.vnf_instance_resources_buffer.time_window(start_time, end_time, include_end=True)
+        return events[events["VNF_Instance"] == vnf_instance_name]
 
         # self.packets = self.flush_events(self.packets, self.packets_buffer)
         # self.packets["Time"] = pd.to_numeric(self.packets["Time"])
@@ -659,9 +622,9 @@ class Simulation_Data():
             new (float): New CPU / Mem allocated
         """
 
-        self.scaling_buffer.insert(0,[
+        self.scaling_buffer.append([
             event,
-            "{:.2f}".format(time),
+            round(time, 2),
             vnf_instance.name,
             "{:.2f}".format(old),
             "{:.2f}".format(new)
@@ -678,9 +641,9 @@ class Simulation_Data():
             monitor_interval (int): The new monitor interval
             sfc_instance (SFC_Instance): The SFC_Instance
         """
-        self.monitor_buffer.insert(0, [
+        self.monitor_buffer.append([
             event,
-            "{:.2f}".format(time),
+            round(time, 2),
             sfc_instance.name,
             "{:.2f}".format(window_size),
             "{:.2f}".format(monitor_interval)
@@ -700,9 +663,9 @@ class Simulation_Data():
             new_reward_down (float): The new reward down
         """
         # rlagent_columns = ["Event", "Time", "VNF_Instance", "Agent", "Value", "Reward"]
-        self.rlagent_buffer.insert(0, [
+        self.rlagent_buffer.append([
             event,
-            "{:.2f}".format(time),
+            round(time, 2),
             vnf_instance.name,
             agent,
             "{:.2f}".format(value),
@@ -712,13 +675,12 @@ class Simulation_Data():
         ])
 
     def get_scaling_events(self):
-        self.scaling = self.flush_events(self.scaling, self.scaling_buffer)
-        return self.scaling
+        return self.flush_events(self.scaling_buffer)
 
     def add_sfc_instance_resources_event(self, event, time, sfc_instance, old_cpu, new_cpu, old_mem, new_mem):
-        self.sfc_instance_resources_buffer.insert(0, [
+        self.sfc_instance_resources_buffer.append([
             event,
-            "{:.2f}".format(time),
+            round(time, 2),
             sfc_instance.name,
             "{:.2f}".format(old_cpu),
             "{:.2f}".format(new_cpu),
@@ -727,27 +689,30 @@ class Simulation_Data():
         ])
 
     def get_sfc_instance_resources_events(self):
-        self.sfc_instance_resources = self.flush_events(self.sfc_instance_resources, self.sfc_instance_resources_buffer)
-        return self.sfc_instance_resources
+        return self.flush_events(self.sfc_instance_resources_buffer)
 
     def add_resource_usage_event(self, event, time, value):
-        self.resource_usage_buffer.insert(0, [
+        self.resource_usage_buffer.append([
             event,
-            "{:.2f}".format(time),
+            round(time, 2),
             "{:.2f}".format(value)
         ])
     
     def get_resource_usage_events(self):
-        self.resource_usage = self.flush_events(self.resource_usage, self.resource_usage_buffer)
-        return self.resource_usage
+        return self.flush_events(self.resource_usage_buffer)
 
     def get_monitor_events(self):
-        self.monitor = self.flush_events(self.monitor, self.monitor_buffer)
-        return self.monitor
+        return self.flush_events(self.monitor_buffer)
 
     def get_rlagent_events(self):
-        self.rlagent = self.flush_events(self.rlagent, self.rlagent_buffer)
-        return self.rlagent
+        return self.flush_events(self.rlagent_buffer)
+
+    @staticmethod
+    def events_to_csv(df, file_name):
+        """Save the events into a CSV file, the last events are the first rows and the Time has 2 decimals"""
+        df = df.iloc[::-1]
+        df = df.assign(Time=df["Time"].map("{:.2f}".format))
+        df.to_csv(file_name, sep=';', index=False, quoting=csv.QUOTE_NONE)
 
     def save_events_csv(self, edge_environment, sm, file_path="."):
         """Save the evenst into a CSV file
@@ -780,42 +745,42 @@ class Simulation_Data():
         file_monitor                  = "{}/monitor.csv".format(file_path)
         file_rlagent                  = "{}/rl_agent.csv".format(file_path)
 
-        self.vnf_instance_resources      = self.get_vnf_instance_resources_events()
-        self.vnf_instance_packets        = self.get_vnf_instance_packets_events()
-        self.vnf_instance                = self.get_vnf_instance_events()
-        self.sfc_instance                = self.get_sfc_instance_events()
-        self.links                       = self.get_link_events()
-        self.sfc_request                 = self.get_sfc_request_events()   
-        self.placement                   = self.get_placement_events()
-        self.time_window                 = self.get_time_window_events()
-        self.packets                     = self.get_packets_events()
-        self.sfc_instance_vnf_mapping    = self.get_sfc_instance_vnf_mapping_events()
-        self.user_mobility               = self.get_user_mobility_events()
-        self.migration                   = self.get_migration_events()
-        self.scaling                     = self.get_scaling_events()
-        self.sfc_instance_resources      = self.get_sfc_instance_resources_events()
-        self.resource_usage              = self.get_resource_usage_events()
-        self.monitor                     = self.get_monitor_events()
-        self.rlagent                     = self.get_rlagent_events()
-
-        self.links.to_csv(file_name_links, sep=';', index=False, quoting=csv.QUOTE_NONE)
-        self.placement.to_csv(file_name_placement, sep=';', index=False, quoting=csv.QUOTE_NONE)        
-        self.time_window.to_csv(file_time_window, sep=';', index=False, quoting=csv.QUOTE_NONE)
-        self.packets.to_csv(file_packets, sep=';', index=False, quoting=csv.QUOTE_NONE)
-        self.vnf_instance_packets.to_csv(file_vnf_instance_packets, sep=';', index=False, quoting=csv.QUOTE_NONE)
-        self.vnf_instance_resources.to_csv(file_vnf_instance_resources, sep=';', index=False, quoting=csv.QUOTE_NONE)
-        self.vnf_instance.to_csv(file_vnf_instance, sep=';', index=False, quoting=csv.QUOTE_NONE)
-        self.sfc_instance.to_csv(file_sfc_instance, sep=';', index=False, quoting=csv.QUOTE_NONE)
-        self.sfc_request.to_csv(file_sfc_request, sep=';', index=False, quoting=csv.QUOTE_NONE)
-        self.sfc_instance_vnf_mapping.to_csv(file_sfc_instance_vnf_mapping, sep=';', index=False, quoting=csv.QUOTE_NONE)
-        self.user_mobility.to_csv(file_user_mobility, sep=';', index=False, quoting=csv.QUOTE_NONE)
-        self.migration.to_csv(file_migration, sep=';', index=False, quoting=csv.QUOTE_NONE)
-        self.scaling.to_csv(file_scaling, sep=';', index=False, quoting=csv.QUOTE_NONE)
-        self.sfc_instance_resources.to_csv(file_sfc_instance_resources, sep=';', index=False, quoting=csv.QUOTE_NONE)
-        self.resource_usage.to_csv(file_resource_usage, sep=';', index=False, quoting=csv.QUOTE_NONE)
-        self.monitor.to_csv(file_monitor, sep=';', index=False, quoting=csv.QUOTE_NONE)
-        self.rlagent.to_csv(file_rlagent, sep=';', index=False, quoting=csv.QUOTE_NONE)
+        vnf_instance_resources           = self.get_vnf_instance_resources_events()
+        vnf_instance_packets             = self.get_vnf_instance_packets_events()
+        vnf_instance                     = self.get_vnf_instance_events()
+        sfc_instance                     = self.get_sfc_instance_events()
+        links                            = self.get_link_events()
+        sfc_request                      = self.get_sfc_request_events()
+        placement                        = self.get_placement_events()
+        time_window                      = self.get_time_window_events()
+        packets                          = self.get_packets_events()
+        sfc_instance_vnf_mapping         = self.get_sfc_instance_vnf_mapping_events()
+        user_mobility                    = self.get_user_mobility_events()
+        migration                        = self.get_migration_events()
+        scaling                          = self.get_scaling_events()
+        sfc_instance_resources           = self.get_sfc_instance_resources_events()
+        resource_usage                   = self.get_resource_usage_events()
+        monitor                          = self.get_monitor_events()
+        rlagent                          = self.get_rlagent_events()
+
+        self.events_to_csv(links, file_name_links)
+        self.events_to_csv(placement, file_name_placement)
+        self.events_to_csv(time_window, file_time_window)
+        self.events_to_csv(packets, file_packets)
+        self.events_to_csv(vnf_instance_packets, file_vnf_instance_packets)
+        self.events_to_csv(vnf_instance_resources, file_vnf_instance_resources)
+        self.events_to_csv(vnf_instance, file_vnf_instance)
+        self.events_to_csv(sfc_instance, file_sfc_instance)
+        self.events_to_csv(sfc_request, file_sfc_request)
+        self.events_to_csv(sfc_instance_vnf_mapping, file_sfc_instance_vnf_mapping)
+        self.events_to_csv(user_mobility, file_user_mobility)
+        self.events_to_csv(migration, file_migration)
+        self.events_to_csv(scaling, file_scaling)
+        self.events_to_csv(sfc_instance_resources, file_sfc_instance_resources)
+        self.events_to_csv(resource_usage, file_resource_usage)
+        self.events_to_csv(monitor, file_monitor)
+        self.events_to_csv(rlagent, file_rlagent)
 
         VNF_Instance.save_csv(edge_environment.vnf_instances, file_path)
         SFC_Instance.save_csv(edge_environment.sfc_instances, edge_environment.vnf_instances, file_path)
-        Packet.save_csv(sm.packets, file_path)
+        sm.save_packets_csv(file_path)
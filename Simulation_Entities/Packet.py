@@ -1,9 +1,10 @@
-from beautifultable import BeautifulTable
 from termcolor import colored, cprint
 import pandas as pd
 import os
 import csv
 
+from Simulation_Entities.Packet_Archive import Packet_Archive
+
 
 class Packet:
     # The names of the attributes in the Packet
@@ -40,6 +41,10 @@ class Packet:
         self.sfc_request = sfc_request
         self.max_delay = max_delay
         self.delay = 0
+        # The last tick processed by the simulation when the packet was created, the delay is counted from it
+        self.created_tick = 0
+        # The creation order of the packet in the simulation
+        self.index = 0
         self.mobility_penalty = 0
         self.sla_violated = False
         self.sla_violation_percentage = 0.0
@@ -61,6 +66,7 @@ class Packet:
 
     def show(self):
         cprint("Packet [{}] Details".format(self.packet_id), "blue", attrs=['bold'])
+        from beautifultable import BeautifulTable
         table = BeautifulTable()
         table.rows.append([self.packet_id])
         table.rows.append([self.created_at])
@@ -82,12 +88,13 @@ class Packet:
         print("\n")
 
     @staticmethod
-    def save_csv(packets, file_path="."):
+    def save_csv(packets, file_path=".", archive=None):
         """Save the SFC instances into a CSV file
 
         Args:
             packets: The list os all the packets, the index is a tuple (sfc_request_name, packet_id)
             file_path (str, optional): The path where the file will be stored. Defaults to ".".
+            archive (Packet_Archive, optional): The packets that already left the simulation. Defaults to None.
         """
 
         # create the dir if it not exist
@@ -98,59 +105,41 @@ class Packet:
         file_name2 = "{}/packets_entities.csv".format(file_path)
         new_columns = Packet.attr_names.copy()
 
-        packets_rows = []
-        
-        for aux in packets:
-            packet = packets[aux]
-        
-            packets_rows.insert(0,[
-                packet.packet_id,
-                packet.created_at,
-                packet.size,
-                packet.sfc_request.name,
-                packet.total_sfc_requests_active,
-                packet.sfc_request.user.name,
-                packet.max_delay,
-                packet.delay,
-                packet.mobility_penalty,
-                packet.sla_violated,
-                packet.sla_violation_percentage,
-                packet.active,
-                packet.dropped,
-                packet.orphan,
-                packet.processed,
-            ])
-        
+        # The last packets created are the first rows in the file
+        packets_rows = [row for _, row in sorted(Packet.rows(packets, archive), key=lambda aux: aux[0], reverse=True)]
+
         df = pd.DataFrame(packets_rows, columns=new_columns)
 
         df.to_csv(file_name2, sep=';', index=False)
 
     @staticmethod
-    def list(packets):
-        print("Packets ({})".format(len(packets)))
+    def rows(packets, archive=None):
+        """Return (index, row) for the packets in the archive and in the dict, where the index is the creation order
+        of the packet and the row have the values of the attr_names
 
-        table = BeautifulTable(180)
-        table.columns.header = Packet.attr_names
+        Args:
+            packets: The list os all the packets, the index is a tuple (sfc_request_name, packet_id)
+            archive (Packet_Archive, optional): The packets that already left the simulation. Defaults to None.
+        """
+        if archive is not None:
+            yield from archive.rows()
 
         for aux in packets:
             packet = packets[aux]
-            table.rows.append([
-                packet.packet_id,
-                packet.created_at,
-                packet.size,
-                packet.sfc_request.name,
-                packet.total_sfc_requests_active,
-                packet.sfc_request.user.name,
-                packet.max_delay,
-                packet.delay,
-                packet.mobility_penalty,
-                packet.sla_violated,
-                packet.sla_violation_percentage,
-                packet.active,
-                packet.dropped,
-                packet.orphan,
-                packet.processed
-            ])
+            yield packet.index, Packet_Archive.values(packet)
+
+    @staticmethod
+    def list(packets, archive=None):
+        # The total is the number of rows listed, the len() of a Packet_Table only counts the packets in the simulation
+        rows = sorted(Packet.rows(packets, archive), key=lambda aux: aux[0])
+        print("Packets ({})".format(len(rows)))
+
+        from beautifultable import BeautifulTable
+        table = BeautifulTable(180)
+        table.columns.header = Packet.attr_names
+
+        for _, row in rows:
+            table.rows.append(row)
 
         print(table)
         print("\n")
@@ -0,0 +1,106 @@
+from array import array
+import numbers
+
+
+class Packet_Archive:
+    # How each attribute from Packet.attr_names is stored: "number", "bool" or "str"
+    attr_types = [
+        ("Packet_ID", "number"),
+        ("Created_At", "number"),
+        ("Size", "number"),
+        ("SFC_Request", "str"),
+        ("Total_SFC_Requests_Active", "number"),
+        ("User", "str"),
+        ("Max_Delay", "number"),
+        ("Delay", "number"),
+        ("Mobility_Penalty", "number"),
+        ("SLA_Violated", "bool"),
+        ("SLA_Violation_Percentage", "number"),
+        ("Active", "bool"),
+        ("Dropped", "bool"),
+        ("Orphan", "bool"),
+        ("Processed", "bool")
+    ]
+
+    def __init__(self):
+        """ Append only storage for the packets that left the simulation (processed, dropped or orphan).
+
+        Each attribute is stored in a typed array, the numbers start as integers and the whole column is
+        converted to float when the first float value is added (the same that pandas does when the CSV is created).
+        The strings are stored as the position in a list with the distinct values.
+        """
+        self.index = array('q')
+        self.columns = []
+        for _, attr_type in Packet_Archive.attr_types:
+            if attr_type == "bool":
+                self.columns.append(array('b'))
+            else:
+                self.columns.append(array('q'))
+
+        self.names = []
+        self.names_index = {}
+
+    def __len__(self):
+        return len(self.index)
+
+    def append(self, packet):
+        """Add the packet in the archive
+
+        Args:
+            packet (Packet): The packet
+        """
+        self.index.append(packet.index)
+
+        values = Packet_Archive.values(packet)
+        for i, (_, attr_type) in enumerate(Packet_Archive.attr_types):
+            value = values[i]
+
+            if attr_type == "str":
+                if value not in self.names_index:
+                    self.names_index[value] = len(self.names)
+                    self.names.append(value)
+                value = self.names_index[value]
+
+            elif attr_type == "number" and self.columns[i].typecode == 'q' and not isinstance(value, numbers.Integral):
+                self.columns[i] = array('d', self.columns[i])
+
+            self.columns[i].append(value)
+
+    def rows(self):
+        """Return the packets in the archive as (index, row) where the row has the values of Packet.attr_names"""
+        for pos in range(len(self.index)):
+            row = []
+            for i, (_, attr_type) in enumerate(Packet_Archive.attr_types):
+                value = self.columns[i][pos]
+                if attr_type == "str":
+                    value = self.names[value]
+                elif attr_type == "bool":
+                    value = bool(value)
+                row.append(value)
+
+            yield self.index[pos], row
+
+    @staticmethod
+    def values(packet):
+        """Return the values of Packet.attr_names for the packet
+
+        Args:
+            packet (Packet): The packet
+        """
+        return [
+            packet.packet_id,
+            packet.created_at,
+            packet.size,
+            packet.sfc_request.name,
+            packet.total_sfc_requests_active,
+            packet.sfc_request.user.name,
+            packet.max_delay,
+            packet.delay,
+            packet.mobility_penalty,
+            packet.sla_violated,
+            packet.sla_violation_percentage,
+            packet.active,
+            packet.dropped,
+            packet.orphan,
+            packet.processed
+        ]
@@ -0,0 +1,248 @@
+import numbers
+import os
+
+import numpy as np
+import pandas as pd
+
+from Simulation_Entities.Packet import Packet
+from Simulation_Entities.Packet_Archive import Packet_Archive
+
+
+class Packet_Table:
+    # Bits of the flags column
+    ACTIVE = 1
+    DROPPED = 2
+    ORPHAN = 4
+    PROCESSED = 8
+    SLA_VIOLATED = 16
+
+    INT32_MIN = np.iinfo(np.int32).min
+    INT32_MAX = np.iinfo(np.int32).max
+
+    # Columns that store numbers, they are int32 until the first float value (float64) or a value out of the
+    # int32 range (int64) is stored
+    number_columns = [
+        "packet_id",
+        "created_at",
+        "size",
+        "total_sfc_requests_active",
+        "max_delay",
+        "delay",
+        "mobility_penalty"
+    ]
+
+    def __init__(self, capacity=1024):
+        """ Store the packets as a struct of arrays (NumPy) instead of one Packet object for each packet.
+
+        A packet is identified by an integer handle (the position in the arrays, that is also the creation order)
+        and the simulation access it through a Packet_View that has the same attributes of the Packet.
+        The table also works as the dict of the packets in the simulation, (sfc_request_name, packet_id) -> Packet_View,
+        but only for the packets that are still in the simulation, the rows of the packets removed are kept to be
+        saved in the end of the simulation.
+
+        Args:
+            capacity (int, optional): The initial number of rows. Defaults to 1024.
+        """
+        self.size = 0
+        self.capacity = capacity
+
+        self.columns = {}
+        for name in Packet_Table.number_columns:
+            self.columns[name] = np.zeros(capacity, dtype=np.int32)
+
+        self.columns["sla_violation_percentage"] = np.zeros(capacity, dtype=np.float64)
+        self.columns["created_tick"] = np.zeros(capacity, dtype=np.int32)
+        self.columns["request"] = np.zeros(capacity, dtype=np.int32)
+        self.columns["flags"] = np.zeros(capacity, dtype=np.uint8)
+
+        # The SFC Requests referenced by the packets
+        self.sfc_requests = []
+        self.sfc_requests_index = {}
+
+        # (sfc_request_name, packet_id) -> handle for the packets in the simulation
+        self.live = {}
+
+    def create(self, packet_id, created_at, sfc_request, max_delay, total_sfc_requests_active, size):
+        """Create a new packet, the parameters are the same of the Packet entity
+
+        Returns:
+            Packet_View: The view of the packet created
+        """
+        if self.size == self.capacity:
+            self.grow()
+
+        handle = self.size
+        self.size += 1
+
+        if sfc_request.name not in self.sfc_requests_index:
+            self.sfc_requests_index[sfc_request.name] = len(self.sfc_requests)
+            self.sfc_requests.append(sfc_request)
+
+        self.columns["request"][handle] = self.sfc_requests_index[sfc_request.name]
+        self.columns["flags"][handle] = Packet_Table.ACTIVE
+
+        self.set_value(handle, "packet_id", packet_id)
+        self.set_value(handle, "created_at", created_at)
+        self.set_value(handle, "size", size)
+        self.set_value(handle, "total_sfc_requests_active", total_sfc_requests_active)
+        self.set_value(handle, "max_delay", max_delay)
+
+        return Packet_View(self, handle)
+
+    def grow(self):
+        """Double the capacity of all the columns"""
+        self.capacity = self.capacity * 2
+        for name in self.columns:
+            column = np.zeros(self.capacity, dtype=self.columns[name].dtype)
+            column[:self.size] = self.columns[name][:self.size]
+            self.columns[name] = column
+
+    def get_value(self, handle, name):
+        return self.columns[name][handle].item()
+
+    def set_value(self, handle, name, value):
+        column = self.columns[name]
+        if column.dtype.kind == 'i':
+            if not isinstance(value, numbers.Integral):
+                column = column.astype(np.float64)
+                self.columns[name] = column
+            elif column.dtype == np.int32 and not Packet_Table.INT32_MIN <= value <= Packet_Table.INT32_MAX:
+                column = column.astype(np.int64)
+                self.columns[name] = column
+
+        column[handle] = value
+
+    def get_flag(self, handle, flag):
+        return bool(self.columns["flags"][handle] & flag)
+
+    def set_flag(self, handle, flag, value):
+        if value:
+            self.columns["flags"][handle] |= flag
+        else:
+            self.columns["flags"][handle] &= ~np.uint8(flag)
+
+    def __setitem__(self, key, packet):
+        self.live[key] = packet.handle
+
+    def __getitem__(self, key):
+        return Packet_View(self, self.live[key])
+
+    def __delitem__(self, key):
+        del self.live[key]
+
+    def __contains__(self, key):
+        return key in self.live
+
+    def __iter__(self):
+        return iter(list(self.live))
+
+    def __len__(self):
+        return len(self.live)
+
+    def get(self, key, default=None):
+        if key in self.live:
+            return Packet_View(self, self.live[key])
+        return default
+
+    def data_frame(self):
+        """Return all the packets (in the simulation or not) as a DataFrame with the columns of Packet.attr_names,
+        the last packets created are the first rows"""
+        n = self.size
+        rows = slice(n - 1, None, -1) if n > 0 else slice(0, 0)
+
+        flags = self.columns["flags"][rows]
+        request = self.columns["request"][rows]
+        sfc_requests_names = np.array([aux.name for aux in self.sfc_requests] or [""], dtype=object)
+        users_names = np.array([aux.user.name for aux in self.sfc_requests] or [""], dtype=object)
+
+        data = {
+            "Packet_ID": self.columns["packet_id"][rows],
+            "Created_At": self.columns["created_at"][rows],
+            "Size": self.columns["size"][rows],
+            "SFC_Request": sfc_requests_names[request],
+            "Total_SFC_Requests_Active": self.columns["total_sfc_requests_active"][rows],
+            "User": users_names[request],
+            "Max_Delay": self.columns["max_delay"][rows],
+            "Delay": self.columns["delay"][rows],
+            "Mobility_Penalty": self.columns["mobility_penalty"][rows],
+            "SLA_Violated": (flags & Packet_Table.SLA_VIOLATED) > 0,
+            "SLA_Violation_Percentage": self.columns["sla_violation_percentage"][rows],
+            "Active": (flags & Packet_Table.ACTIVE) > 0,
+            "Dropped": (flags & Packet_Table.DROPPED) > 0,
+            "Orphan": (flags & Packet_Table.ORPHAN) > 0,
+            "Processed": (flags & Packet_Table.PROCESSED) > 0
+        }
+
+        return pd.DataFrame(data, columns=Packet.attr_names)
+
+    def save_csv(self, file_path="."):
+        """Save all the packets into a CSV file (the same file created by Packet.save_csv)
+
+        Args:
+            file_path (str, optional): The path where the file will be stored. Defaults to ".".
+        """
+        # create the dir if it not exist
+        if not os.path.exists(file_path):
+            os.makedirs(file_path)
+
+        file_name = "{}/packets_entities.csv".format(file_path)
+        self.data_frame().to_csv(file_name, sep=';', index=False)
+
+    def rows(self):
+        """Return (index, row) for all the packets, where the row have the values of the Packet.attr_names"""
+        for handle in range(self.size):
+            yield handle, Packet_Archive.values(Packet_View(self, handle))
+
+
+def _column(name):
+    return property(
+        lambda self: self.table.get_value(self.handle, name),
+        lambda self, value: self.table.set_value(self.handle, name, value)
+    )
+
+
+def _flag(flag):
+    return property(
+        lambda self: self.table.get_flag(self.handle, flag),
+        lambda self, value: self.table.set_flag(self.handle, flag, value)
+    )
+
+
+class Packet_View:
+    """ A lightweight view of one row of the Packet_Table with the same attributes of the Packet entity """
+
+    __slots__ = ("table", "handle")
+
+    def __init__(self, table, handle):
+        self.table = table
+        self.handle = handle
+
+    packet_id = _column("packet_id")
+    created_at = _column("created_at")
+    size = _column("size")
+    total_sfc_requests_active = _column("total_sfc_requests_active")
+    max_delay = _column("max_delay")
+    delay = _column("delay")
+    mobility_penalty = _column("mobility_penalty")
+    sla_violation_percentage = _column("sla_violation_percentage")
+    created_tick = _column("created_tick")
+
+    active = _flag(Packet_Table.ACTIVE)
+    dropped = _flag(Packet_Table.DROPPED)
+    orphan = _flag(Packet_Table.ORPHAN)
+    processed = _flag(Packet_Table.PROCESSED)
+    sla_violated = _flag(Packet_Table.SLA_VIOLATED)
+
+    @property
+    def sfc_request(self):
+        return self.table.sfc_requests[self.table.columns["request"][self.handle]]
+
+    @property
+    def index(self):
+        return self.handle
+
+    def set_size(self, size):
+        self.size = size
+
+    def __str__(self):
+        return str(self.__class__) + ": " + str(self.handle)
@@ -1,4 +1,3 @@
-from beautifultable import BeautifulTable
 from termcolor import colored, cprint
 import pandas as pd
 import os
@@ -107,6 +106,7 @@ class SFC_Instance:
 
     def show(self):
         cprint("SFC Instance [{}] Details".format(self.name), "blue", attrs=['bold'])
+        from beautifultable import BeautifulTable
         table = BeautifulTable()
         table.rows.append([self.name])
         table.rows.append([self.sfc.name])
@@ -169,6 +169,7 @@ class SFC_Instance:
     @staticmethod
     def list(sfc_instances):
         print("SFC Instances (total: {})".format(len(sfc_instances)))
+        from beautifultable import BeautifulTable
         table = BeautifulTable(180)
         table.columns.header = SFC_Instance.attr_names
 
@@ -1,9 +1,10 @@
-from beautifultable import BeautifulTable
 from termcolor import colored, cprint
 import pandas as pd
 import os
 import numpy as np
 
+from Edge_Entities.Random_Streams import Random_Streams
+
 
 class SFC_Request:
 
@@ -66,6 +67,7 @@ class SFC_Request:
 
     def show(self):
         cprint("SFC Request [{}] Details".format(self.name), "blue", attrs=['bold'])
+        from beautifultable import BeautifulTable
         table = BeautifulTable()
         table.rows.append([self.name])
         table.rows.append([self.user.name])
@@ -155,6 +157,7 @@ class SFC_Request:
     @staticmethod
     def list(sfc_requests):
         print("SFC Requests (total: {})".format(len(sfc_requests)))
+        from beautifultable import BeautifulTable
         table = BeautifulTable(180)
         table.columns.header = SFC_Request.attr_names
 
@@ -239,7 +242,7 @@ class SFC_Request:
     @staticmethod
     def generate_poisson_arrival(seed, sfc_requests_number, last_time_window):
 
-        np.random.seed(int(seed))
+        np.random.seed(Random_Streams.int_seed(seed))
 
         exp = np.random.exponential(size=sfc_requests_number)
 
@@ -1,4 +1,3 @@
-from beautifultable import BeautifulTable
 from termcolor import colored, cprint
 import pandas as pd
 import os
@@ -150,6 +149,7 @@ class VNF_Instance:
 
     def show(self):
         cprint("VNF Instance [{}] Details".format(self.name), "blue", attrs=['bold'])
+        from beautifultable import BeautifulTable
         table = BeautifulTable()
         table.rows.append([self.name])
         table.rows.append([self.vnf.name])
@@ -222,6 +222,7 @@ class VNF_Instance:
             vnf_instances (list): List of VNF Instances that will be printed
         """
         print("VNF Instances (total: {})".format(len(vnf_instances)))
+        from beautifultable import BeautifulTable
         table = BeautifulTable(150)
         table.columns.header = VNF_Instance.attr_names
         for aux in vnf_instances or []:
@@ -0,0 +1,317 @@
+"""
+Estimate the cost of a simulation (main.py --estimate) from the specs and the simulation parameters, without
+generating the environment nor running the simulation.
+
+The workload (SFC Requests and packets) is estimated from the specs: the packets of each SFC Request are generated
+from its placement until the end of its duration, with the mean rate of the data source bursts, or they are read
+from the packet flow file. The event rows of each table, the peak memory and the wall time of a round are estimated
+by linear models of the workload fitted from previous rounds (the calibration file), thus they are only estimated
+when a calibration is used.
+
+The calibration is fitted from the round folders with perf.json (NSS_PERF=1):
+
+Usage:
+    python Simulation_Estimator.py Experiment/Results/Q1 Results_X --output calibration.json
+"""
+import argparse
+import itertools
+import json
+import math
+import os
+
+import numpy as np
+import pandas as pd
+
+# The features of the linear models, "intercept" is the fixed cost of a round
+FEATURES = ["intercept", "packets", "sfc_requests", "sim_time"]
+
+# The max number of arrival times of the SFC Requests used to compute the mean duration of the packet generation
+ARRIVAL_SAMPLES = 200
+
+
+def estimate(specs, sfc_requests_parameters, total_time, time_window, time_limit_to_packet_generation,
+             packet_generation, packet_flow_file="", rounds=1, workers=1, calibration=None):
+    """
+    Estimate the workload and the cost of the simulation
+
+    Args:
+        specs (dict): The specs of the entities
+        sfc_requests_parameters (dict): The sfc_requests block of the specs (with the defaults of main.py)
+        total_time (int): The total time of the simulation (ms)
+        time_window (int): The time window of the placement (ms)
+        time_limit_to_packet_generation (int): The max time for the packet generation (ms)
+        packet_generation (int): 1 if the packets are generated
+        packet_flow_file (str, optional): The packet flow file (PATH_PACKET_FLOW_FILE). Defaults to "".
+        rounds (int, optional): The number of rounds (the max rounds of the replication). Defaults to 1.
+        workers (int, optional): The number of processes that execute the rounds. Defaults to 1.
+        calibration (dict, optional): The calibration loaded by load_calibration(). Defaults to None.
+
+    Returns:
+        dict: The estimate of a round and of all the rounds
+    """
+    entities_number = specs['entities_number']
+
+    # Each user requests random.choice(sfc_request_num) SFCs
+    sfc_request_num = specs['user']['sfc_request_num']
+    sfc_requests = entities_number['users'] * np.mean(sfc_request_num)
+
+    max_arrival_time = sfc_requests_parameters.get('max_arrival_time', total_time - time_window)
+
+    # The arrivals are spread from 0 to max_arrival_time (SFC_Request.generate_poisson_arrival) and the packets of
+    # an SFC Request are generated after its placement, executed at the end of the time window of its arrival
+    arrivals = np.linspace(0, max_arrival_time - 1, min(ARRIVAL_SAMPLES, max(1, int(round(sfc_requests)))))
+    if time_window > 0:
+        starts = (arrivals // time_window + 1) * time_window
+    else:
+        # All the SFC Requests are placed at the time 0
+        starts = np.zeros(len(arrivals))
+
+    if not packet_generation:
+        packet_source = "disabled"
+        packets = 0.0
+    elif packet_flow_file:
+        packet_source = "file"
+        packets = sfc_requests * _file_packets_per_sfc_request(
+            packet_flow_file, specs, starts, time_limit_to_packet_generation)
+    else:
+        packet_source = "data_source"
+        packets = sfc_requests * _data_source_packets_per_sfc_request(
+            specs, sfc_requests_parameters, starts, total_time, time_limit_to_packet_generation)
+
+    result = {
+        "sfc_requests": float(sfc_requests),
+        "packets": float(packets),
+        "packet_source": packet_source,
+        "sim_time": total_time,
+        "rounds": rounds,
+        "workers": workers,
+        "calibration": None,
+        "rows": None,
+        "peak_rss_mb": None,
+        "wall_time": None,
+        "total_wall_time": None
+    }
+
+    if calibration is not None:
+        workload = {
+            "intercept": 1.0,
+            "packets": result["packets"],
+            "sfc_requests": result["sfc_requests"],
+            "sim_time": float(total_time)
+        }
+
+        result["calibration"] = calibration.get("file_name")
+        result["rows"] = {
+            table: _predict(coefficients, workload)
+            for table, coefficients in sorted(calibration["rows"].items())
+        }
+        result["peak_rss_mb"] = _predict(calibration["peak_rss_mb"], workload) if calibration.get("peak_rss_mb") else None
+        result["wall_time"] = _predict(calibration["wall_time"], workload)
+
+        # The rounds are executed in batches of workers processes
+        result["total_wall_time"] = result["wall_time"] * math.ceil(rounds / max(1, min(workers, rounds)))
+
+    return result
+
+
+def _data_source_packets_per_sfc_request(specs, sfc_requests_parameters, starts, total_time, time_limit):
+    """The expected number of packets of an SFC Request generated by Simulation.flow_generator"""
+    data_source = specs['data_source']
+
+    # A burst of B packets (each one followed by the packet interval I) after the burst interval BI, thus the mean
+    # rate is E[B] / (E[BI] + E[B] * E[I]). Each data source chooses its parameters independently
+    rates = [
+        burst_size / (burst_interval + burst_size * packet_interval)
+        for burst_size, burst_interval, packet_interval in itertools.product(
+            data_source['packets_burst_size'], data_source['packets_burst_interval'], data_source['packet_interval'])
+        if burst_interval + burst_size * packet_interval > 0
+    ]
+    rate = np.mean(rates) if rates else 0.0
+
+    # The packets are not created when the remaining simulation time is lower than the max latency of the SFC
+    durations = sfc_requests_parameters.get('duration', [total_time])
+    ends = np.minimum(time_limit, total_time - np.mean(specs['sfc']['max_latency']))
+
+    spans = [np.clip(np.minimum(starts + duration, ends) - starts, 0, None).mean() for duration in durations]
+
+    return rate * np.mean(spans)
+
+
+def _file_packets_per_sfc_request(packet_flow_file, specs, starts, time_limit):
+    """The expected number of packets of an SFC Request read from the packet flow file by Simulation.flow_generator_by_file"""
+    entities_number = specs['entities_number']
+
+    data = pd.read_csv(packet_flow_file, sep=';', quotechar="'")
+
+    # Only the flows of the users and SFCs generated by the specs, each user requests a SFC with probability
+    # mean(sfc_request_num) / sfcs
+    users = {"u_{}".format(i) for i in range(entities_number['users'])}
+    sfcs = {"s_{}".format(i) for i in range(entities_number['sfcs'])}
+    data = data[data.user.isin(users) & data.sfc.isin(sfcs)]
+
+    if len(data) == 0:
+        return 0.0
+
+    # A packet is created if the time of the previous packet of the flow is below the time limit
+    packets = 0.0
+    for _, flow in data.groupby(["user", "sfc"], sort=False):
+        previous = np.concatenate([[0], np.cumsum(flow.time.values)[:-1]])
+        packets += np.searchsorted(previous, time_limit - starts, side="right").mean()
+
+    # The expected packets of all the flows is packets * mean(sfc_request_num) / sfcs, divided by the expected
+    # SFC Requests users * mean(sfc_request_num)
+    return packets / (entities_number['users'] * entities_number['sfcs'])
+
+
+def _predict(coefficients, workload):
+    return max(0.0, sum(coefficient * workload[feature] for feature, coefficient in coefficients.items()))
+
+
+def print_estimate(result):
+    """Print the estimate of the simulation"""
+    print("Estimate (packets from {}, all the SFC Requests placed)".format(result["packet_source"]))
+    print("  SFC Requests: {:.0f}".format(result["sfc_requests"]))
+    print("  Packets:      {:.0f}".format(result["packets"]))
+
+    if result["rows"] is None:
+        print("  No calibration (--calibration), the event rows, memory and wall time are not estimated")
+        return
+
+    print("  Event rows per round:")
+    for table, rows in result["rows"].items():
+        print("    {:<28} {:.0f}".format(table, rows))
+
+    if result["peak_rss_mb"] is not None:
+        print("  Peak memory:  {:.0f} MB".format(result["peak_rss_mb"]))
+    print("  Wall time:    {:.1f}s per round, {:.1f}s for {} rounds with {} workers".format(
+        result["wall_time"], result["total_wall_time"], result["rounds"], result["workers"]))
+
+
+def load_calibration(file_name):
+    """Load the calibration file saved by fit()"""
+    with open(file_name) as json_file:
+        calibration = json.load(json_file)
+
+    calibration["file_name"] = file_name
+    return calibration
+
+
+def fit(paths):
+    """
+    Fit the calibration from the round folders with perf.json found in the paths
+
+    Args:
+        paths (list): The result folders, searched recursively
+
+    Returns:
+        dict: The calibration
+    """
+    samples = []
+    for path in paths:
+        for root, dirs, files in os.walk(path):
+            if "perf.json" in files and "packets_entities.csv" in files:
+                samples.append(_round_sample(root))
+
+    if not samples:
+        return None
+
+    x = np.array([[sample["workload"][feature] for feature in FEATURES] for sample in samples])
+
+    tables = sorted({table for sample in samples for table in sample["rows"]})
+
+    calibration = {
+        "rounds": len(samples),
+        # The coefficients are not determined if the workloads of the rounds are linearly dependent, e.g. all the
+        # rounds with the same number of SFC Requests
+        "rank": int(np.linalg.matrix_rank(x)),
+        "features": FEATURES,
+        "wall_time": _fit(x, np.array([sample["wall_time"] for sample in samples])),
+        "peak_rss_mb": None,
+        "rows": {
+            table: _fit(x, np.array([sample["rows"].get(table, 0) for sample in samples]))
+            for table in tables
+        }
+    }
+
+    # The perf.json saved before the peak RSS was added
+    memory = [i for i, sample in enumerate(samples) if sample["peak_rss_mb"] is not None]
+    if memory:
+        calibration["peak_rss_mb"] = _fit(x[memory], np.array([samples[i]["peak_rss_mb"] for i in memory]))
+
+    return calibration
+
+
+def _round_sample(path):
+    """The workload, event rows, wall time and peak memory of a round folder"""
+    with open(os.path.join(path, "perf.json")) as json_file:
+        perf = json.load(json_file)
+
+    rows = {}
+    for file_name in os.listdir(path):
+        table, extension = os.path.splitext(file_name)
+        if extension == ".csv" and not table.endswith("_entities"):
+            rows[table] = _count_rows(os.path.join(path, file_name))
+
+    return {
+        "workload": {
+            "intercept": 1.0,
+            "packets": _count_rows(os.path.join(path, "packets_entities.csv")),
+            "sfc_requests": _count_rows(os.path.join(path, "Entities", "sfc_requests.csv")),
+            "sim_time": perf["sim_time"]
+        },
+        "rows": rows,
+        "wall_time": perf["wall_time"],
+        "peak_rss_mb": perf.get("peak_rss_mb")
+    }
+
+
+def _count_rows(file_name):
+    """The number of rows of a CSV file, without the header"""
+    if not os.path.isfile(file_name):
+        return 0
+
+    with open(file_name, "rb") as file:
+        return max(0, sum(1 for line in file) - 1)
+
+
+def _fit(x, y):
+    """
+    Least squares with non negative coefficients: the features with negative coefficients are removed and the
+    model is fitted again
+    """
+    active = list(range(len(FEATURES)))
+    coefficients = np.zeros(len(FEATURES))
+    while active:
+        solution = np.linalg.lstsq(x[:, active], y, rcond=None)[0]
+        if (solution >= 0).all():
+            coefficients[active] = solution
+            break
+        active = [feature for feature, value in zip(active, solution) if value > 0]
+
+    return {feature: float(coefficient) for feature, coefficient in zip(FEATURES, coefficients)}
+
+
+def main_fit():
+    parser = argparse.ArgumentParser(prog='Estimator')
+    parser.add_argument('paths', nargs='+', help='The result folders with the rounds executed with NSS_PERF=1')
+    parser.add_argument('--output', default="calibration.json", help='The calibration file --output calibration.json')
+    args = parser.parse_args()
+
+    calibration = fit(args.paths)
+    if calibration is None:
+        print("Error: There is no round with perf.json in {}".format(", ".join(args.paths)))
+        quit()
+
+    if calibration["rank"] < len(FEATURES):
+        print("Warning: The workloads of the {} rounds determine only {} of the {} coefficients ({}), use rounds "
+              "with different number of packets, SFC Requests and simulation time".format(
+                  calibration["rounds"], calibration["rank"], len(FEATURES), ", ".join(FEATURES)))
+
+    with open(args.output, "w") as file:
+        json.dump(calibration, file, indent=2)
+
+    print("Calibration fitted from {} rounds saved in {}".format(calibration["rounds"], args.output))
+
+
+if __name__ == "__main__":
+    main_fit()
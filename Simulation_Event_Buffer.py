@@ -0,0 +1,141 @@
+import numbers
+import sys
+
+import numpy as np
+import pandas as pd
+
+
+class Simulation_Event_Buffer:
+    # The columns stored in NumPy arrays, the other columns are lists of values
+    typed_columns = {
+        "Time": np.float64,
+        "Packet_ID": np.int64
+    }
+
+    def __init__(self, columns, capacity=1024):
+        """ Append-only columnar buffer with the events of a table of the Simulation_Data, in chronological order.
+
+        The events are appended in amortized O(1) (the NumPy columns double their capacity when they are full) and
+        the buffer is materialized into a DataFrame only when it is requested. The events appended after the last
+        flush() are not in the DataFrame, as the events that were in the list buffers before.
+
+        Args:
+            columns (list): The names of the columns
+            capacity (int, optional): The initial number of rows of the NumPy columns. Defaults to 1024.
+        """
+        self.columns = list(columns)
+        self.capacity = capacity
+        self.size = 0
+
+        # The number of rows in the DataFrame, the rows before the last flush
+        self.flushed = 0
+
+        self.data = []
+        for name in self.columns:
+            if name in Simulation_Event_Buffer.typed_columns:
+                self.data.append(np.zeros(capacity, dtype=Simulation_Event_Buffer.typed_columns[name]))
+            else:
+                self.data.append([])
+
+        self.time = self.columns.index("Time")
+
+        # The binary search by time is only used if the events were appended in time order
+        self.ordered = True
+
+        # The last DataFrame materialized and its number of rows
+        self.frame_cache = None
+        self.frame_size = -1
+
+    def append(self, row):
+        """Append an event, the row has a value for each column"""
+        if self.size == self.capacity:
+            self.grow()
+
+        if self.size > 0 and row[self.time] < self.data[self.time][self.size - 1]:
+            self.ordered = False
+
+        for i, value in enumerate(row):
+            column = self.data[i]
+            if isinstance(column, list):
+                column.append(value)
+            elif column.dtype.kind == 'i' and not isinstance(value, numbers.Integral):
+                # e.g. a Packet_ID that is not a number, the column is stored as a list from now on
+                self.data[i] = column[:self.size].tolist() + [value]
+            else:
+                column[self.size] = value
+
+        self.size += 1
+
+    def grow(self):
+        """Double the capacity of the NumPy columns"""
+        self.capacity = self.capacity * 2
+        for i, column in enumerate(self.data):
+            if not isinstance(column, list):
+                aux = np.zeros(self.capacity, dtype=column.dtype)
+                aux[:self.size] = column[:self.size]
+                self.data[i] = aux
+
+    def flush(self):
+        """Make the events appended until now visible in the DataFrame"""
+        self.flushed = self.size
+
+    def clear(self):
+        self.size = 0
+        self.flushed = 0
+        self.ordered = True
+        self.frame_cache = None
+        self.frame_size = -1
+        for i, column in enumerate(self.data):
+            if isinstance(column, list):
+                column.clear()
+
+    def __len__(self):
+        """The number of events not flushed yet"""
+        return self.size - self.flushed
+
+    def frame(self):
+        """The DataFrame with the events flushed, it is materialized again only if there are new events"""
+        if self.frame_size != self.flushed:
+            self.frame_cache = self.rows_frame(0, self.flushed)
+            self.frame_size = self.flushed
+
+        return self.frame_cache
+
+    def rows_frame(self, start, end):
+        """The DataFrame with the rows [start, end), the dtypes of the list columns are inferred like a DataFrame
+        created from a list of rows"""
+        data = {}
+        for name, column in zip(self.columns, self.data):
+            if isinstance(column, list):
+                # The empty columns are object, as the columns of an empty DataFrame (not float64)
+                data[name] = column[start:end] if end > start else np.empty(0, dtype=object)
+            else:
+                data[name] = column[start:end].copy()
+
+        return pd.DataFrame(data, columns=self.columns, index=pd.RangeIndex(start, end))
+
+    def time_window(self, start_time, end_time, include_end=False):
+        """
+        The DataFrame with the events flushed with start_time <= Time < end_time (or <= end_time)
+
+        Args:
+            start_time (float): The start time
+            end_time (float): The end time
+            include_end (bool, optional): Include the events of the end_time. Defaults to False.
+        """
+        time = self.data[self.time][:self.flushed]
+
+        side = "right" if include_end else "left"
+        if self.ordered:
+            start = int(np.searchsorted(time, start_time, side="left"))
+            end = int(np.searchsorted(time, end_time, side=side))
+            return self.rows_frame(start, max(start, end))
+
+        frame = self.frame()
+        if include_end:
+            return frame[(frame["Time"] >= start_time) & (frame["Time"] <= end_time)]
+        return frame[(frame["Time"] >= start_time) & (frame["Time"] < end_time)]
+
+    def nbytes(self):
+        """The approximate bytes of the columns (the values of the list columns are shared with the entities)"""
+        return sum(column.nbytes if not isinstance(column, list) else sys.getsizeof(column) for column in self.data)
@@ -0,0 +1,111 @@
+import json
+import os
+import sys
+import time
+
+from Simulation_SimPy import queue_length
+
+
+class Simulation_Heartbeat:
+    """
+    Periodic report of the progress of the simulation, thus a slow simulation can be distinguished from a hung one.
+
+    The heartbeat is checked every sim_interval ms of the simulation time by the wrapper of env.step (no event is
+    added to the simpy queue) and it is reported at most once every wall_interval seconds, to the stderr and
+    optionally as a JSON line appended to a file (e.g. shared by all the cells of a sweep).
+    """
+
+    def __init__(self, env, simulation, total_time, wall_interval, file_path="", label="", round=0, sim_interval=100):
+        """
+        Args:
+            env (SimPy): The simpy environment
+            simulation (Simulation): The simulation
+            total_time (int): The total time of the simulation (ms)
+            wall_interval (float): The min wall time between two heartbeats (s)
+            file_path (str, optional): The JSON lines file. Defaults to "" (only stderr).
+            label (str, optional): Identifies the simulation in the JSON lines, e.g. the results path. Defaults to "".
+            round (int, optional): The round number. Defaults to 0.
+            sim_interval (int, optional): The simulation time between the checks (ms). Defaults to 100.
+        """
+        self.env = env
+        self.simulation = simulation
+        self.total_time = total_time
+        self.wall_interval = float(wall_interval)
+        self.file_path = file_path
+        self.label = label
+        self.round = round
+        self.sim_interval = int(sim_interval)
+
+        self.start_wall_time = time.time()
+        self.last_beat = (env.now, self.start_wall_time)
+        self.next_check = env.now + self.sim_interval
+
+    def start(self):
+        """Check the heartbeat after the events processed by the environment"""
+        step = self.env.step
+
+        def heartbeat_step():
+            step()
+            if self.env.now >= self.next_check:
+                self.next_check = (self.env.now // self.sim_interval + 1) * self.sim_interval
+                if time.time() - self.last_beat[1] >= self.wall_interval:
+                    self.beat()
+
+        self.env.step = heartbeat_step
+
+    def beat(self, finished=False):
+        """Report the progress of the simulation"""
+        now = self.env.now
+        wall_time = time.time()
+
+        last_now, last_wall_time = self.last_beat
+        speed = (now - last_now) / (wall_time - last_wall_time) if wall_time > last_wall_time else None
+        self.last_beat = (now, wall_time)
+
+        edge_environment = self.simulation.edge_environment
+        heartbeat = {
+            "label": self.label,
+            "round": self.round,
+            "timestamp": wall_time,
+            "elapsed": wall_time - self.start_wall_time,
+            "sim_time": now,
+            "total_time": self.total_time,
+            "progress": now / self.total_time if self.total_time else None,
+            "sim_ms_per_wall_s": speed,
+            "packets": len(self.simulation.packets),
+            "sfc_instances": sum(1 for sfc_instance in edge_environment.sfc_instances if sfc_instance.active),
+            "vnf_instances": sum(1 for vnf_instance in edge_environment.vnf_instances if vnf_instance.active),
+            "pending_events": queue_length(self.env) + len(self.simulation.arrival_scheduler),
+            "rss_mb": rss_mb(),
+            "finished": finished
+        }
+
+        print("[heartbeat] {} Round {}: {}/{} ms ({:.1f}%) {} sim-ms/s, {} packets, {} SFC Instances, "
+              "{} VNF Instances, {} pending events, {:.1f} MB RSS".format(
+                  self.label, self.round, now, self.total_time, (heartbeat["progress"] or 0) * 100,
+                  "{:.0f}".format(speed) if speed is not None else "-", heartbeat["packets"],
+                  heartbeat["sfc_instances"], heartbeat["vnf_instances"], heartbeat["pending_events"],
+                  heartbeat["rss_mb"]), file=sys.stderr, flush=True)
+
+        if self.file_path:
+            # A single write of a line in append mode, thus many simulations can share the file
+            with open(self.file_path, "a") as file:
+                file.write(json.dumps(heartbeat) + "\n")
+
+
+def rss_mb():
+    """The resident set size of the process (MB), the peak RSS if the current one is not available"""
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError, IndexError):
+        return peak_rss_mb()
+
+
+def peak_rss_mb():
+    """The peak resident set size of the process (MB)"""
+    import resource
+
+    # ru_maxrss is KB on Linux and bytes on macOS
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss / 2 ** 20 if sys.platform == "darwin" else maxrss / 2 ** 10
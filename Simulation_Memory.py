@@ -0,0 +1,231 @@
+import json
+import os
+import sys
+import sysconfig
+import tracemalloc
+
+from Simulation_Event_Buffer import Simulation_Event_Buffer
+from Simulation_Heartbeat import rss_mb
+from Simulation_SimPy import queue_entries
+
+# Memory report of a round, only enabled when the environment variable NSS_MEMORY_REPORT is 1. The reports are taken
+# at the simulation times in NSS_MEMORY_REPORT_TIMES (ms, comma separated) and at the end of the simulation, and saved
+# in memory.json. Each report has:
+#   modules:    the memory allocated by each module and still in use (tracemalloc snapshot grouped by module)
+#   subsystems: the approximate bytes and number of objects of the main structures of the simulation
+# tracemalloc makes the simulation slower, it is only started when the report is enabled.
+
+# The max number of objects measured in each structure, the size of the others is extrapolated
+SAMPLE_SIZE = 1000
+
+# The number of modules in each report
+TOP_MODULES = 30
+
+enabled = False
+times = []
+started_tracemalloc = False
+
+# Defined by start()
+env = None
+simulation = None
+reports = []
+
+program_path = os.path.dirname(os.path.abspath(__file__))
+library_paths = {os.path.abspath(path) for path in [sysconfig.get_paths()["stdlib"], sysconfig.get_paths()["purelib"], sysconfig.get_paths()["platlib"]]}
+
+
+def configure():
+    """Enable the report if NSS_MEMORY_REPORT is 1 and start tracemalloc, called at the start of each round"""
+    global enabled, times, started_tracemalloc, env, simulation
+    enabled = False
+    try:
+        if os.environ["NSS_MEMORY_REPORT"] == "1":
+            enabled = True
+    except KeyError as ke:
+        pass
+
+    times = []
+    if "NSS_MEMORY_REPORT_TIMES" in os.environ and os.environ["NSS_MEMORY_REPORT_TIMES"]:
+        times = sorted(int(value) for value in os.environ["NSS_MEMORY_REPORT_TIMES"].split(","))
+
+    env = None
+    simulation = None
+    reports.clear()
+
+    # The profiler (--profile tracemalloc) can be tracing already
+    started_tracemalloc = False
+    if enabled and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        started_tracemalloc = True
+
+
+def start(simpy_env, sm):
+    """
+    Take the reports when the simulation reaches the report times, after the events processed by the environment
+
+    Args:
+        simpy_env (SimPy): The simpy environment
+        sm (Simulation): The simulation
+    """
+    global env, simulation
+    if not enabled:
+        return
+
+    env = simpy_env
+    simulation = sm
+
+    step = env.step
+    pending = list(times)
+
+    def memory_step():
+        step()
+        if pending and env.now >= pending[0]:
+            while pending and env.now >= pending[0]:
+                pending.pop(0)
+            report(env.now)
+
+    env.step = memory_step
+
+
+def report(label):
+    """
+    Take a report of the memory
+
+    Args:
+        label (int|str): The simulation time or "end"
+    """
+    snapshot = tracemalloc.take_snapshot()
+
+    modules = {}
+    total = 0
+    for statistic in snapshot.statistics("filename"):
+        module = module_name(statistic.traceback[0].filename)
+        if module not in modules:
+            modules[module] = {"bytes": 0, "count": 0}
+        modules[module]["bytes"] += statistic.size
+        modules[module]["count"] += statistic.count
+        total += statistic.size
+
+    reports.append({
+        "time": label,
+        "rss_mb": rss_mb(),
+        "tracemalloc_bytes": total,
+        "modules": dict(sorted(modules.items(), key=lambda item: -item[1]["bytes"])[:TOP_MODULES]),
+        "subsystems": subsystems()
+    })
+
+
+def save(file_path="."):
+    """Take the report of the end of the simulation and save the reports in memory.json"""
+    global started_tracemalloc
+    if not enabled or env is None:
+        return
+
+    report("end")
+
+    if started_tracemalloc:
+        tracemalloc.stop()
+        started_tracemalloc = False
+
+    os.makedirs(file_path, exist_ok=True)
+    with open(os.path.join(file_path, "memory.json"), "w") as file:
+        json.dump({"reports": reports}, file, indent=2)
+
+
+def module_name(file_name):
+    """The module of a file: the path in the simulator (e.g. Edge_Entities/Link), the package of a library (e.g.
+    pandas) or the file name"""
+    # e.g. <frozen importlib._bootstrap>
+    if file_name.startswith("<"):
+        return file_name
+
+    file_name = os.path.abspath(file_name)
+
+    if file_name.startswith(program_path + os.sep):
+        return os.path.splitext(os.path.relpath(file_name, program_path))[0]
+
+    for path in library_paths:
+        if file_name.startswith(path + os.sep):
+            relative = os.path.relpath(file_name, path).split(os.sep)
+            if relative[0] in ["site-packages", "dist-packages"] and len(relative) > 1:
+                return relative[1].split(".")[0]
+            return os.path.splitext(relative[0])[0]
+
+    return os.path.basename(file_name)
+
+
+def subsystems():
+    """The approximate bytes and number of objects of the main structures of the simulation"""
+    sd = simulation.sd
+    edge_environment = simulation.edge_environment
+
+    result = {}
+
+    if isinstance(simulation.packets, dict):
+        result["Simulation.packets"] = _objects_size(simulation.packets.values(), sys.getsizeof(simulation.packets))
+    else:
+        # Packet_Table, the rows of the packets that left the simulation are kept
+        table = simulation.packets
+        result["Simulation.packets"] = {
+            "bytes": sum(column.nbytes for column in table.columns.values()) + sys.getsizeof(table.live),
+            "objects": table.size
+        }
+
+    if simulation.packets_archive is not None:
+        result["Simulation.packets_archive"] = {
+            "bytes": sys.getsizeof(simulation.packets_archive.index)
+                     + sum(sys.getsizeof(column) for column in simulation.packets_archive.columns),
+            "objects": len(simulation.packets_archive)
+        }
+
+    # The columnar buffers of the events (the DataFrames are materialized only when they are requested)
+    for name, value in vars(sd).items():
+        if isinstance(value, Simulation_Event_Buffer):
+            result["Simulation_Data.{}".format(name)] = {
+                "bytes": value.nbytes(),
+                "objects": value.size
+            }
+
+    result["Edge_Environment.links"] = _objects_size(edge_environment.links.values(), sys.getsizeof(edge_environment.links))
+
+    for name in ["resource_links", "resource_instances"]:
+        resources = getattr(simulation, name)
+        size = _objects_size(resources.values(), sys.getsizeof(resources))
+        # The requests waiting and using the resources
+        requests = sum(len(resource.queue) + len(resource.users) for resource in resources.values())
+        size["bytes"] += sum(sys.getsizeof(resource.queue) + sys.getsizeof(resource.users) for resource in resources.values())
+        size["requests"] = requests
+        result["Simulation.{}".format(name)] = size
+
+    result["simpy.queue"] = _rows_size(queue_entries(env))
+
+    return result
+
+
+def _sample(values):
+    """A sample of at most SAMPLE_SIZE values, evenly spaced"""
+    values = list(values)
+    if len(values) <= SAMPLE_SIZE:
+        return values, 1.0
+    step = len(values) / SAMPLE_SIZE
+    return [values[int(i * step)] for i in range(SAMPLE_SIZE)], len(values) / SAMPLE_SIZE
+
+
+def _objects_size(objects, container_size=0):
+    """The size of the objects and their attributes dict (the objects referenced by the attributes are not counted)"""
+    sample, scale = _sample(objects)
+    size = sum(sys.getsizeof(obj) + (sys.getsizeof(obj.__dict__) if hasattr(obj, "__dict__") else 0) for obj in sample)
+    return {
+        "bytes": int(container_size + size * scale),
+        "objects": int(round(len(sample) * scale))
+    }
+
+
+def _rows_size(rows):
+    """The size of a list of rows (tuples or lists) and their values"""
+    sample, scale = _sample(rows)
+    size = sum(sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row) for row in sample)
+    return {
+        "bytes": int(sys.getsizeof(rows) + size * scale),
+        "objects": len(rows)
+    }
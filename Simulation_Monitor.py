@@ -1,4 +1,6 @@
 from Monitor.SFC_Instance_Monitor import SFC_Instance_Monitor
+import Simulation_Perf
+import Simulation_Counters
 
 class Simulation_Monitor:
     """ Each VNF_Instance is periodically monitored and, if the resources above or below the 
@@ -61,15 +63,27 @@ class Simulation_Monitor:
             migration_threshold_packet_window = self.migration_threshold_packet_window,
             enable_migration = self.enable_migration
         )
-        self.env.process(sfc_instance_monitor.run())
+        self.env.process(Simulation_Perf.timed(Simulation_Counters.counted(sfc_instance_monitor.run(), "monitor_sfc_instance"), "monitor.sfc_instance"))
+
+        self.start_scaling(self.scaling, self.scaling_down)
+
+    def start_scaling(self, scaling, scaling_down):
+        """Start the scaling processes, used by run() and by the variants resumed from a snapshot
+
+        Args:
+            scaling (Scaling): The Scaling Up component
+            scaling_down (Scaling): The Scaling Down component
+        """
+        self.scaling = scaling
+        self.scaling_down = scaling_down
 
         # Run the scaling up or the scaling that make the scaling up and down at same time
         if self.scaling:
-            self.env.process(self.scaling.run())
+            self.env.process(Simulation_Perf.timed(Simulation_Counters.counted(self.scaling.run(), "scaling_up"), "scaling.up"))
 
         # Run the scaling down
         if self.scaling_down:
-            self.env.process(self.scaling_down.run())
+            self.env.process(Simulation_Perf.timed(Simulation_Counters.counted(self.scaling_down.run(), "scaling_down"), "scaling.down"))
 
     def stop(self):
         if self.scaling:
@@ -0,0 +1,172 @@
+import functools
+import inspect
+import json
+import os
+import time
+
+from Simulation_Heartbeat import peak_rss_mb
+
+# Wall time instrumentation of the phases of a round, only enabled when the environment variable NSS_PERF is 1.
+# The methods are wrapped by instrument() when the objects are created, thus when it is disabled the simulation
+# runs the original methods without any overhead.
+# The phases are measured in self time: the time of the phases called by a phase (e.g. packet.vnf_process, that runs
+# inside packet.process_packet) is only added to the called phase, thus the phases do not overlap and their sum is
+# at most the wall time of the round.
+
+enabled = False
+
+# Phase -> [calls, seconds]
+phases = {}
+
+# The seconds of the called phases of each phase being measured, the innermost is the last
+running = []
+
+
+def configure():
+    """Enable the instrumentation if NSS_PERF is 1 and reset the phases, called at the start of each round"""
+    global enabled
+    enabled = False
+    try:
+        if os.environ["NSS_PERF"] == "1":
+            enabled = True
+    except KeyError as ke:
+        pass
+
+    phases.clear()
+    running.clear()
+
+
+def start():
+    """Start measuring a call of a phase, return the start time used by stop()"""
+    running.append(0.0)
+    return time.perf_counter()
+
+
+def stop(phase, start_time):
+    """Add the self time of the call of the phase started by start(), the elapsed time is removed from its caller"""
+    elapsed = time.perf_counter() - start_time
+    called = running.pop()
+    if running:
+        running[-1] += elapsed
+    add(phase, elapsed - called)
+
+
+def add(phase, seconds, calls=1):
+    """Add the wall time of a call of the phase, the phases called by it must not be included (see start)"""
+    if not enabled:
+        return
+
+    if phase not in phases:
+        phases[phase] = [0, 0.0]
+
+    phases[phase][0] += calls
+    phases[phase][1] += seconds
+
+
+def timed(generator, phase):
+    """
+    Wrap a simpy process (generator), each time it is resumed is a call of the phase, e.g. an iteration of a monitor
+    or a hop of a packet. The generator is returned without the wrapper if the instrumentation is disabled
+    """
+    if not enabled:
+        return generator
+
+    return _timed(generator, phase)
+
+
+def _timed(generator, phase):
+    value = None
+    exception = None
+    while True:
+        start_time = start()
+        try:
+            if exception is not None:
+                event = generator.throw(exception)
+            else:
+                event = generator.send(value)
+        except StopIteration as stop_iteration:
+            stop(phase, start_time)
+            return stop_iteration.value
+        except BaseException:
+            stop(phase, start_time)
+            raise
+        stop(phase, start_time)
+
+        value = None
+        exception = None
+        try:
+            value = yield event
+        except BaseException as e:
+            exception = e
+
+
+def instrument(obj, method, phase):
+    """
+    Replace the method of the object by a wrapper that measures its wall time, the generator methods (simpy
+    processes) are measured by timed(). Nothing is done if the instrumentation is disabled
+
+    Args:
+        obj (object): The object, e.g. the Simulation
+        method (str): The method name
+        phase (str): The phase name used in perf.json
+    """
+    if not enabled:
+        return
+
+    original = getattr(obj, method)
+
+    if inspect.isgeneratorfunction(original):
+        @functools.wraps(original)
+        def wrapper(*args, **kwargs):
+            return _timed(original(*args, **kwargs), phase)
+    else:
+        @functools.wraps(original)
+        def wrapper(*args, **kwargs):
+            start_time = start()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                stop(phase, start_time)
+
+    setattr(obj, method, wrapper)
+
+
+def save(file_path, sim_time, wall_time, profile=None):
+    """
+    Save the phases of the round in perf.json, it is also saved without the phases when the round is profiled
+
+    Args:
+        file_path (str): The round folder
+        sim_time (int): The simulation time (ms)
+        wall_time (float): The wall time of the round (s)
+        profile (dict, optional): The summary of the Simulation_Profiler. Defaults to None.
+    """
+    if not enabled and profile is None:
+        return
+
+    os.makedirs(file_path, exist_ok=True)
+
+    perf = {
+        "sim_time": sim_time,
+        "wall_time": wall_time,
+        # Simulated ms per wall ms
+        "sim_wall_ratio": sim_time / (wall_time * 1000) if wall_time > 0 else None,
+        # The peak RSS of the process, thus of the rounds executed before by the same process too
+        "peak_rss_mb": peak_rss_mb(),
+        # The seconds of each phase are its self time, without the phases called by it (e.g. packet.process_packet
+        # without packet.vnf_process and packet.link_process), thus the phases are exclusive
+        "phases_time": "self",
+        "phases_seconds": sum(seconds for calls, seconds in phases.values()),
+        "phases": {
+            phase: {
+                "calls": calls,
+                "seconds": seconds,
+                "mean_us": seconds / calls * 1e6 if calls else 0.0
+            }
+            for phase, (calls, seconds) in sorted(phases.items(), key=lambda item: -item[1][1])
+        }
+    }
+    if profile is not None:
+        perf["profile"] = profile
+    with open(os.path.join(file_path, "perf.json"), "w") as file:
+        json.dump(perf, file, indent=2)
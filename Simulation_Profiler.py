@@ -0,0 +1,215 @@
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+
+# Profiler of a round (main.py --profile), the artifacts are saved in the round folder:
+#   cprofile:    profile.pstats and profile.collapsed (the time of each call stack, estimated from the pstats)
+#   tracemalloc: profile.tracemalloc (the snapshot) and profile.collapsed (the memory allocated by each call stack)
+#   sampling:    profile.collapsed (the samples of each call stack of the main thread)
+# The collapsed stacks ("f1;f2;f3 weight" per line) can be converted in a flame graph by flamegraph.pl or speedscope.
+
+MODES = ["cprofile", "tracemalloc", "sampling"]
+
+# The interval between the samples of the sampling profiler (s)
+SAMPLING_INTERVAL = 0.001
+
+# The number of frames saved by tracemalloc for each allocation
+TRACEMALLOC_FRAMES = 5
+
+# The stacks of the cProfile with less time than this (us) are not saved in the collapsed stacks
+MIN_STACK_TIME = 1
+
+# Defined by start()
+mode = None
+profiler = None
+sampler = None
+
+
+class _Sampler(threading.Thread):
+    """Thread that samples the call stack of the main thread"""
+
+    def __init__(self, thread_id, interval):
+        super().__init__(daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = defaultdict(int)
+        self.running = True
+
+    def run(self):
+        while self.running:
+            frame = sys._current_frames().get(self.thread_id)
+
+            stack = []
+            while frame is not None:
+                stack.append(_code_name(frame.f_code))
+                frame = frame.f_back
+
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+            time.sleep(self.interval)
+
+
+def _code_name(code):
+    return "{} ({}:{})".format(code.co_name, os.path.basename(code.co_filename), code.co_firstlineno)
+
+
+def _function_name(function):
+    """The name of a pstats function (file, line, name)"""
+    file_name, line, name = function
+    if file_name == "~":
+        return name
+    return "{} ({}:{})".format(name, os.path.basename(file_name), line)
+
+
+def start(profile_mode):
+    """
+    Start the profiler of the round
+
+    Args:
+        profile_mode (str): One of the MODES, or empty for no profiler
+    """
+    global mode, profiler, sampler
+    mode = profile_mode or None
+    profiler = None
+    sampler = None
+
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+    elif mode == "tracemalloc":
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+    elif mode == "sampling":
+        sampler = _Sampler(threading.get_ident(), SAMPLING_INTERVAL)
+        sampler.start()
+
+
+def stop(file_path, top=20):
+    """
+    Stop the profiler and save its artifacts in the round folder
+
+    Args:
+        file_path (str): The round folder
+        top (int, optional): The number of functions (or lines) of the summary. Defaults to 20.
+
+    Returns:
+        dict: The summary with the top functions, saved in the perf report, or None if there is no profiler
+    """
+    if mode is None:
+        return None
+
+    os.makedirs(file_path, exist_ok=True)
+
+    if mode == "cprofile":
+        profiler.disable()
+        profiler.dump_stats(os.path.join(file_path, "profile.pstats"))
+        stats = pstats.Stats(profiler).stats
+        _save_collapsed(file_path, _cprofile_stacks(stats))
+
+        functions = sorted(stats.items(), key=lambda item: -item[1][2])[:top]
+        hot = [
+            {
+                "function": _function_name(function),
+                "calls": nc,
+                "self_seconds": tt,
+                "total_seconds": ct
+            }
+            for function, (cc, nc, tt, ct, callers) in functions
+        ]
+
+    elif mode == "tracemalloc":
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        snapshot.dump(os.path.join(file_path, "profile.tracemalloc"))
+
+        stacks = defaultdict(int)
+        for statistic in snapshot.statistics("traceback"):
+            frames = ["{}:{}".format(os.path.basename(frame.filename), frame.lineno) for frame in statistic.traceback]
+            stacks[";".join(frames)] += statistic.size
+        _save_collapsed(file_path, stacks)
+
+        hot = [
+            {
+                "line": "{}:{}".format(os.path.basename(statistic.traceback[0].filename), statistic.traceback[0].lineno),
+                "size_kb": statistic.size / 1024,
+                "count": statistic.count
+            }
+            for statistic in snapshot.statistics("lineno")[:top]
+        ]
+
+    else:
+        sampler.running = False
+        sampler.join()
+        _save_collapsed(file_path, sampler.stacks)
+
+        total = sum(sampler.stacks.values())
+        self_samples = defaultdict(int)
+        total_samples = defaultdict(int)
+        for stack, count in sampler.stacks.items():
+            functions = stack.split(";")
+            self_samples[functions[-1]] += count
+            for function in set(functions):
+                total_samples[function] += count
+
+        hot = [
+            {
+                "function": function,
+                "self_samples": count,
+                "total_samples": total_samples[function],
+                "self_percentage": count / total * 100
+            }
+            for function, count in sorted(self_samples.items(), key=lambda item: -item[1])[:top]
+        ]
+
+    return {
+        "mode": mode,
+        "top": hot
+    }
+
+
+def _cprofile_stacks(stats):
+    """
+    Estimate the time (us) of each call stack from the pstats, that only has the time of each caller -> callee
+    edge. The time of a function is split among the stacks in the proportion of the time of its callers, the
+    recursive calls are not expanded
+    """
+    children = defaultdict(dict)
+    for function, (cc, nc, tt, ct, callers) in stats.items():
+        for caller, edge in callers.items():
+            children[caller][function] = edge[3]
+
+    stacks = defaultdict(int)
+
+    def walk(function, stack, fraction):
+        stack = stack + [_function_name(function)]
+        tt, ct = stats[function][2], stats[function][3]
+
+        weight = int(round(tt * fraction * 1e6))
+        if weight > 0:
+            stacks[";".join(stack)] += weight
+
+        for child, edge_time in children[function].items():
+            child_time = stats[child][3]
+            if child == function or child_time <= 0 or _function_name(child) in stack:
+                continue
+
+            child_fraction = edge_time * fraction / child_time
+            if child_time * child_fraction * 1e6 >= MIN_STACK_TIME:
+                walk(child, stack, child_fraction)
+
+    for function, (cc, nc, tt, ct, callers) in stats.items():
+        if not callers:
+            walk(function, [], 1.0)
+
+    return stacks
+
+
+def _save_collapsed(file_path, stacks):
+    with open(os.path.join(file_path, "profile.collapsed"), "w") as file:
+        for stack, weight in sorted(stacks.items()):
+            file.write("{} {}\n".format(stack, weight))
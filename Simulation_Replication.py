@@ -0,0 +1,146 @@
+import csv
+import json
+import math
+import os
+
+from Simulation_Convergence_Monitor import t_quantile
+
+
+class Simulation_Replication:
+    """
+    Sequential replication control: the rounds are executed until the confidence interval of the mean of the
+    metrics among the rounds is narrower than the relative width configured, between min_rounds and max_rounds.
+
+    The mean and the variance of each metric are updated with the summary of each round (Welford), the values of
+    the rounds are kept only to be saved in replication.csv.
+    """
+
+    def __init__(self, relative_width, min_rounds=2, max_rounds=30, confidence=0.95, metrics=None):
+        """
+        Args:
+            relative_width (float): The max half width of the confidence interval relative to the mean
+            min_rounds (int, optional): The min number of rounds. Defaults to 2.
+            max_rounds (int, optional): The max number of rounds. Defaults to 30.
+            confidence (float, optional): The confidence level. Defaults to 0.95.
+            metrics (list, optional): The metrics of Simulation_Round_Summary. Defaults to sla_violation_rate
+                and delay_mean.
+        """
+        self.relative_width = float(relative_width)
+        self.min_rounds = max(int(min_rounds), 2)
+        self.max_rounds = int(max_rounds)
+        self.confidence = float(confidence)
+        self.metrics = metrics or ["sla_violation_rate", "delay_mean"]
+
+        # Metric -> [count, mean, sum of the squares of the differences from the mean]
+        self.statistics = {metric: [0, 0.0, 0.0] for metric in self.metrics}
+
+        # (round, summary) of each round
+        self.rounds = []
+
+        self.stop_reason = None
+
+    @classmethod
+    def from_parameters(cls, parameters):
+        """
+        Create the replication control of the replication block of the simulation parameters, the parameters not in
+        the block have the defaults of __init__
+
+        Args:
+            parameters (dict): The replication block
+        """
+        keys = ["relative_width", "min_rounds", "max_rounds", "confidence", "metrics"]
+        return cls(**{key: parameters[key] for key in keys if key in parameters})
+
+    def add_round(self, i, summary):
+        """
+        Update the statistics with the summary of the round i
+
+        Args:
+            i (int): The round number
+            summary (dict): The summary of Simulation_Round_Summary
+        """
+        self.rounds.append((i, summary))
+
+        for metric in self.metrics:
+            value = summary.get(metric)
+            if value is None:
+                continue
+
+            statistic = self.statistics[metric]
+            statistic[0] += 1
+            delta = value - statistic[1]
+            statistic[1] += delta / statistic[0]
+            statistic[2] += delta * (value - statistic[1])
+
+    def estimate(self, metric):
+        """
+        Returns:
+            dict: The rounds, the mean, the half width and the relative width of the metric
+        """
+        count, mean, m2 = self.statistics[metric]
+
+        half_width = math.inf
+        if count > 1:
+            half_width = t_quantile((1 + self.confidence) / 2, count - 1) * math.sqrt(m2 / (count - 1)) / math.sqrt(count)
+
+        if mean != 0:
+            relative_width = half_width / abs(mean)
+        else:
+            relative_width = 0 if half_width == 0 else math.inf
+
+        return {
+            "rounds": count,
+            "mean": mean,
+            "half_width": half_width,
+            "relative_width": relative_width
+        }
+
+    def finished(self):
+        """Return True if no more rounds are required, the stop reason is saved in stop_reason"""
+        if len(self.rounds) >= self.max_rounds:
+            self.stop_reason = "max_rounds"
+            return True
+
+        if len(self.rounds) < self.min_rounds:
+            return False
+
+        for metric in self.metrics:
+            if self.estimate(metric)["relative_width"] > self.relative_width:
+                return False
+
+        self.stop_reason = "converged"
+        return True
+
+    def save(self, file_path="."):
+        """
+        Save the values of each round (replication.csv) and the estimates and the stopping reason (replication.json)
+        """
+        os.makedirs(file_path, exist_ok=True)
+
+        summary = {
+            "stop_reason": self.stop_reason,
+            "rounds": len(self.rounds),
+            "min_rounds": self.min_rounds,
+            "max_rounds": self.max_rounds,
+            "relative_width": self.relative_width,
+            "confidence": self.confidence,
+            "metrics": {metric: self.estimate(metric) for metric in self.metrics}
+        }
+        with open(os.path.join(file_path, "replication.json"), "w") as file:
+            # inf is not valid JSON, it is saved as null
+            json.dump(_finite(summary), file, indent=2)
+
+        with open(os.path.join(file_path, "replication.csv"), "w", newline="") as file:
+            writer = csv.writer(file, delimiter=";")
+            writer.writerow(["Round"] + self.metrics)
+            for i, values in self.rounds:
+                writer.writerow([i] + [values.get(metric) for metric in self.metrics])
+
+
+def _finite(value):
+    """Replace the infinite values by None (null in the JSON)"""
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, float) and math.isinf(value):
+        return None
+    return value
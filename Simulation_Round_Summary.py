@@ -0,0 +1,61 @@
+import json
+import os
+
+import numpy as np
+
+
+class Simulation_Round_Summary:
+    """
+    The summary metrics of a round, computed while the packets leave the simulation, thus the sequential
+    replication does not need to read the CSV files of the rounds. The packets still in the simulation when it
+    finishes are observed too, the summary has the same packets of packets_entities.csv.
+    """
+
+    METRICS = ["sla_violation_rate", "drop_rate", "delay_mean", "delay_p95", "packets"]
+
+    def __init__(self):
+        self.packets = 0
+        self.packets_sla_violated = 0
+        self.packets_dropped = 0
+        self.delays = []
+
+    def observe_packet(self, packet):
+        """Called by the simulation when a packet leaves the simulation (processed, dropped or orphan) or when the
+        simulation finishes, the packets still active count with the delay until the end of the simulation"""
+        self.packets += 1
+        if packet.sla_violated:
+            self.packets_sla_violated += 1
+        if packet.dropped:
+            self.packets_dropped += 1
+        if packet.processed or packet.active:
+            self.delays.append(packet.delay)
+
+    def observe_deadline(self, packet):
+        """Called by the simulation when the SLA of an active packet is violated, the summary counts the packet only
+        when it leaves the simulation"""
+        pass
+
+    def summary(self):
+        """
+        Returns:
+            dict: Metric -> value, the rates are 0 and the delays are None if no packet left the simulation
+        """
+        return {
+            "sla_violation_rate": self.packets_sla_violated / self.packets if self.packets else 0.0,
+            "drop_rate": self.packets_dropped / self.packets if self.packets else 0.0,
+            "delay_mean": float(np.mean(self.delays)) if self.delays else None,
+            "delay_p95": float(np.percentile(self.delays, 95)) if self.delays else None,
+            "packets": self.packets
+        }
+
+    def save(self, file_path="."):
+        """Save the summary of the round (summary.json)"""
+        os.makedirs(file_path, exist_ok=True)
+        with open(os.path.join(file_path, "summary.json"), "w") as file:
+            json.dump(self.summary(), file, indent=2)
+
+    @staticmethod
+    def load(file_path="."):
+        """Load the summary saved by a round (used when the rounds run in the process pool)"""
+        with open(os.path.join(file_path, "summary.json")) as file:
+            return json.load(file)
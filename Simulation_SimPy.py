@@ -0,0 +1,78 @@
+import heapq
+
+import simpy
+
+# The simulator schedules events with a given key and reads the head of the simpy event queue, which are not
+# part of the public API of simpy. All the access to the simpy internals is done by this module, thus it
+# is checked against the simpy version once.
+#
+# In the supported versions Environment._queue is a heap of (time, priority, eid, event) and Environment._eid is
+# the itertools.count that gives the eid of each event scheduled.
+SUPPORTED_VERSIONS = [(4, 0), (4, 1)]
+
+
+def simpy_version():
+    """Return the (major, minor) version of simpy"""
+    return tuple(int(value) for value in simpy.__version__.split(".")[:2])
+
+
+if simpy_version() not in SUPPORTED_VERSIONS:
+    raise ImportError("simpy {} is not supported, the simulator uses the event queue of simpy {}".format(
+        simpy.__version__, ", ".join("{}.{}".format(*version) for version in SUPPORTED_VERSIONS)))
+
+
+def triggered_event(env, priority, delay=0):
+    """Create an event already triggered (with a None value) that is processed after the delay with the given priority
+
+    Args:
+        env (SimPy): The simpy environment
+        priority (int): The priority of the event (URGENT, NORMAL or LATE)
+        delay (int, optional): The time to wait. Defaults to 0.
+    """
+    event = _triggered(env)
+    env.schedule(event, priority, delay)
+    return event
+
+
+def triggered_event_at(env, key):
+    """Create an event already triggered (with a None value) that is processed with the key (time, priority, eid),
+    where the eid was reserved by reserve_eid()
+
+    Args:
+        env (SimPy): The simpy environment
+        key (tuple): The key (time, priority, eid) of the event in the simpy queue
+    """
+    event = _triggered(env)
+    heapq.heappush(env._queue, key + (event,))
+    return event
+
+
+def _triggered(env):
+    event = env.event()
+    event._ok = True
+    event._value = None
+    return event
+
+
+def reserve_eid(env):
+    """Reserve the eid of an event that will be scheduled later, it is ordered as if it was scheduled now"""
+    return next(env._eid)
+
+
+def next_key(env):
+    """Return the key (time, priority, eid) of the next event in the simpy queue or None"""
+    queue = env._queue
+    if queue:
+        return queue[0][:3]
+
+    return None
+
+
+def queue_length(env):
+    """Return the number of events in the simpy queue"""
+    return len(env._queue)
+
+
+def queue_entries(env):
+    """Return the entries (time, priority, eid, event) of the simpy queue, it must not be changed"""
+    return env._queue
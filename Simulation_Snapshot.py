@@ -0,0 +1,75 @@
+import os
+import sys
+import traceback
+
+
+def fork(variants, run_variant, workers=1):
+    """
+    Resume each variant from the current state of the simulation (the snapshot) in its own process
+
+    The state of the simulation is copied by os.fork: the simpy environment with its queue and processes, the
+    Edge_Environment, the packets, the resources, the Simulation_Data buffers and the states of the random
+    generators. The simpy processes are python generators, thus they can not be saved in a file and restored,
+    and the variants must be forked from the process that executed the warm-up.
+
+    All the variants start from the same state, including the random generators, thus their results differ
+    only by what the variant changes. At most workers variants are executed at the same time, each child has
+    a copy of the whole simulation.
+
+    Args:
+        variants (list): The variants
+        run_variant (function): Called with the variant in the child process, it finishes the simulation
+        workers (int, optional): The max number of children running at the same time. Defaults to 1.
+
+    Returns:
+        list: The variants that failed
+    """
+    if not hasattr(os, "fork"):
+        print("Error: The snapshot variants require os.fork, that is not available in this platform", file=sys.stderr)
+        return variants
+
+    # The output buffered before the fork would be written again by each child
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    children = {}
+    failed = []
+    for variant in variants:
+        # Wait for a child to finish before forking a new one
+        while len(children) >= max(1, workers):
+            wait_child(children, failed)
+
+        pid = os.fork()
+        if pid == 0:
+            status = 0
+            try:
+                run_variant(variant)
+            except BaseException:
+                traceback.print_exc()
+                status = 1
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(status)
+
+        children[pid] = variant
+
+    while children:
+        wait_child(children, failed)
+
+    # In the order of the variants
+    return [variant for variant in variants if any(variant is f for f in failed)]
+
+
+def wait_child(children, failed):
+    """Wait for any child to finish, the variant is added to failed if its exit status is not 0
+
+    Args:
+        children (dict): pid -> variant of the children running
+        failed (list): The variants that failed
+    """
+    pid, status = os.wait()
+    if pid in children:
+        variant = children.pop(pid)
+        if status != 0:
+            failed.append(variant)
@@ -0,0 +1,278 @@
+import heapq
+import itertools
+
+from Simulation_SimPy import next_key, triggered_event
+
+# Priority used to schedule an event after all the URGENT (0) and NORMAL (1) events of the same time
+LATE = 2
+
+
+def scheduled_event(env, priority, delay=0):
+    """Create an event already triggered that is processed after the delay with the given priority
+
+    Args:
+        env (SimPy): The simpy environment
+        priority (int): The priority of the event (URGENT, NORMAL or LATE)
+        delay (int, optional): The time to wait. Defaults to 0.
+    """
+    return triggered_event(env, priority, delay)
+
+
+def late_timeout(env, delay):
+    """Create a timeout that is processed after all the other events scheduled for the same time
+
+    Args:
+        env (SimPy): The simpy environment
+        delay (int): The time to wait
+    """
+    return scheduled_event(env, LATE, delay)
+
+
+def yield_turn(env, priority):
+    """Return an event that is processed after all the events already scheduled for the current time with
+    the same or a higher priority (lower value). If there is no such event the process can continue without
+    waiting and None is returned.
+
+    Args:
+        env (SimPy): The simpy environment
+        priority (int): The priority used by simpy for the event that the process would wait for
+    """
+    key = next_key(env)
+    if key is not None and key[0] == env.now and key[1] <= priority:
+        return scheduled_event(env, priority)
+
+    return None
+
+
+class Simulation_Timer:
+    """
+    Keep the countdowns of the SFC Instances (timeout) and VNF Instances (idle timeout, startup and shutdown)
+    as deadlines in a heap instead of decreasing all of them every millisecond.
+
+    Each countdown is stored as the value it had after the tick "base_tick", the value in a later tick is
+    computed when it is needed, and the entity attribute is only written when the countdown expires or
+    when sync() is called. Countdowns that expire in the same tick are returned in the same order that the
+    old per millisecond loop handled them: kind first and then the position of the entity in the list of the
+    edge environment.
+    """
+
+    SFC_INSTANCE_TIMEOUT = 0
+    VNF_INSTANCE_TIMEOUT = 1
+    VNF_INSTANCE_STARTUP = 2
+    VNF_INSTANCE_SHUTDOWN = 3
+
+    ATTRS = {
+        SFC_INSTANCE_TIMEOUT: 'timeout',
+        VNF_INSTANCE_TIMEOUT: 'timeout',
+        VNF_INSTANCE_STARTUP: 'startup_remain_time',
+        VNF_INSTANCE_SHUTDOWN: 'shutdown_remain_time'
+    }
+
+    def __init__(self, edge_environment):
+        """Create the timer for the SFC Instances and VNF Instances of the edge environment
+
+        Args:
+            edge_environment (Edge_Environment): The edge environment
+        """
+        self.edge_environment = edge_environment
+
+        # The last tick (ms) processed
+        self.tick = 0
+
+        # Heap with (deadline, kind, order, seq, key)
+        self.deadlines = []
+        self.seq = itertools.count()
+
+        # key -> [entity, base_value, base_tick]
+        self.countdowns = {}
+
+        # key -> deadline of the entry in the heap that will handle the countdown
+        self.pending = {}
+
+        # VNF Instances with SFC Instances, the timeout is restarted every tick
+        # id -> [vnf_instance, base_value, base_tick]
+        self.holds = {}
+
+        # id -> position of the entity in the edge environment list
+        self.order = {}
+
+    def track(self, tick):
+        """Rebuild all the countdowns from the current attributes of the SFC Instances and VNF Instances.
+        It must be called after the entities were changed outside the timer (e.g. placement)
+
+        Args:
+            tick (int): The tick where the attribute values were observed
+        """
+        self.tick = tick
+        self.deadlines = []
+        self.countdowns = {}
+        self.pending = {}
+        self.holds = {}
+        self.order = {}
+
+        for order, sfc_instance in enumerate(self.edge_environment.sfc_instances):
+            self.order[id(sfc_instance)] = order
+            if sfc_instance.active:
+                self.start(self.SFC_INSTANCE_TIMEOUT, sfc_instance, sfc_instance.timeout, tick)
+
+        for order, vnf_instance in enumerate(self.edge_environment.vnf_instances):
+            self.order[id(vnf_instance)] = order
+
+            if vnf_instance.startup_remain_time >= 0:
+                self.start(self.VNF_INSTANCE_STARTUP, vnf_instance, vnf_instance.startup_remain_time, tick)
+
+            if vnf_instance.active:
+                if len(vnf_instance.sfc_instances) > 0:
+                    self.holds[id(vnf_instance)] = [vnf_instance, vnf_instance.timeout, tick]
+                elif vnf_instance.timeout >= 0:
+                    self.start(self.VNF_INSTANCE_TIMEOUT, vnf_instance, vnf_instance.timeout, tick)
+
+            if vnf_instance.accept_sfc_instances == False and vnf_instance.shutdown_remain_time >= 0:
+                self.start(self.VNF_INSTANCE_SHUTDOWN, vnf_instance, vnf_instance.shutdown_remain_time, tick)
+
+    def sync(self, tick):
+        """Write the value of all the countdowns at the tick in the entities attributes
+
+        Args:
+            tick (int): The tick
+        """
+        for (kind, _), (entity, value, base_tick) in self.countdowns.items():
+            setattr(entity, self.ATTRS[kind], value - (tick - base_tick))
+
+        for vnf_instance, value, base_tick in self.holds.values():
+            vnf_instance.timeout = value if tick <= base_tick else vnf_instance.vnf.timeout
+
+    def start(self, kind, entity, value, base_tick):
+        """Start (or restart) a countdown
+
+        Args:
+            kind (int): The countdown kind
+            entity (SFC_Instance|VNF_Instance): The entity
+            value (int): The countdown value after the base_tick
+            base_tick (int): The tick where the countdown has the value
+        """
+        key = (kind, id(entity))
+        self.countdowns[key] = [entity, value, base_tick]
+
+        deadline = self.deadline(kind, value, base_tick)
+
+        # The entry already in the heap is popped before the new deadline and is pushed again with the
+        # right deadline at that time, thus restarting a timeout does not grow the heap
+        if deadline is not None and (key not in self.pending or self.pending[key] > deadline):
+            self.push(key, deadline)
+
+    def reset(self, kind, entity):
+        """Restart a countdown from the current value of the entity attribute, e.g. after the SFC Instance timeout is reset
+
+        Args:
+            kind (int): The countdown kind
+            entity (SFC_Instance|VNF_Instance): The entity
+        """
+        self.start(kind, entity, getattr(entity, self.ATTRS[kind]), self.tick)
+
+    def remain_time(self, kind, entity):
+        """Return the value of the countdown in the last tick processed
+
+        Args:
+            kind (int): The countdown kind
+            entity (SFC_Instance|VNF_Instance): The entity
+        """
+        key = (kind, id(entity))
+        if key in self.countdowns:
+            _, value, base_tick = self.countdowns[key]
+            return value - (self.tick - base_tick)
+
+        return getattr(entity, self.ATTRS[kind])
+
+    def release_vnf_instance(self, vnf_instance):
+        """Start the idle timeout of a VNF Instance that lost its last SFC Instance during the current tick,
+        the timeout was restarted until the previous tick
+
+        Args:
+            vnf_instance (VNF_Instance): The VNF Instance
+        """
+        hold = self.holds.pop(id(vnf_instance), None)
+        if hold is None:
+            return
+
+        _, value, base_tick = hold
+        previous_tick = self.tick - 1
+        if previous_tick > base_tick:
+            value = vnf_instance.vnf.timeout
+
+        self.start(self.VNF_INSTANCE_TIMEOUT, vnf_instance, value, previous_tick)
+
+    def shutdown_vnf_instance(self, vnf_instance):
+        """Start the shutdown of a VNF Instance, the shutdown_remain_time is decreased from the current tick
+
+        Args:
+            vnf_instance (VNF_Instance): The VNF Instance
+        """
+        if vnf_instance.shutdown_remain_time >= 0:
+            self.start(self.VNF_INSTANCE_SHUTDOWN, vnf_instance, vnf_instance.shutdown_remain_time, self.tick - 1)
+
+    def expire(self, tick):
+        """Process the tick, it returns (kind, entity) for each countdown that finishes in the tick
+
+        Args:
+            tick (int): The tick
+        """
+        self.tick = tick
+
+        while self.deadlines and self.deadlines[0][0] <= tick:
+            deadline, kind, _, _, key = heapq.heappop(self.deadlines)
+
+            if self.pending.get(key) != deadline:
+                continue
+            del self.pending[key]
+
+            if key not in self.countdowns:
+                continue
+
+            entity, value, base_tick = self.countdowns[key]
+            end = self.deadline(kind, value, base_tick)
+
+            if end is None:
+                continue
+
+            if end > deadline:
+                self.push(key, end)
+                continue
+
+            del self.countdowns[key]
+
+            if kind == self.SFC_INSTANCE_TIMEOUT:
+                entity.timeout = value - (end - base_tick)
+            else:
+                setattr(entity, self.ATTRS[kind], -1)
+
+            yield kind, entity
+
+    def next_deadline(self):
+        """Return the next tick where some countdown can finish or None"""
+        if self.deadlines:
+            return self.deadlines[0][0]
+
+        return None
+
+    def deadline(self, kind, value, base_tick):
+        """Return the tick where the countdown finishes
+
+        The SFC Instance is destroyed when its timeout became lower or equal to zero, the VNF Instance countdowns
+        only finish when the value reaches zero (a negative value means that it was already finished)
+        """
+        if kind != self.SFC_INSTANCE_TIMEOUT and value < 0:
+            return None
+
+        return base_tick + max(value, 1)
+
+    def push(self, key, deadline):
+        """Push the entry of a countdown in the heap, it is the entry that will handle the countdown
+
+        Args:
+            key (tuple): The key (kind, id of the entity) of the countdown
+            deadline (int): The tick where the entry is popped
+        """
+        kind, entity_id = key
+        self.pending[key] = deadline
+        heapq.heappush(self.deadlines, (deadline, kind, self.order.get(entity_id, 0), next(self.seq), key))
@@ -0,0 +1,135 @@
+"""
+Count the simpy events and Process objects created per packet for the Experiment/Scaling configurations.
+
+Each configuration is executed twice, once with the VNF and link processing inlined in the packet process
+(Simulation.sub_process) and once spawning a new simpy Process for each VNF and link, like the simulation did
+before. The result files of both executions are the same.
+
+Usage:
+    python benchmark_events.py [--specs Experiment/Scaling/bf.json] [--random_seed 1]
+"""
+import argparse
+import contextlib
+import glob
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+
+import simpy
+
+import main
+from Simulation import Simulation
+
+# Counters updated by the patched simpy and Simulation methods
+counters = Counter()
+
+
+def count_schedule(schedule):
+    def wrapper(self, event, *args, **kwargs):
+        counters["events"] += 1
+        return schedule(self, event, *args, **kwargs)
+    return wrapper
+
+
+def count_process(init):
+    def wrapper(self, *args, **kwargs):
+        counters["processes"] += 1
+        return init(self, *args, **kwargs)
+    return wrapper
+
+
+def count_packets(add_packet):
+    def wrapper(self, *args, **kwargs):
+        counters["packets"] += 1
+        return add_packet(self, *args, **kwargs)
+    return wrapper
+
+
+def spawn_process(self, generator):
+    """The previous behavior of Simulation.sub_process, one simpy Process for each VNF and link"""
+    result = yield self.env.process(generator)
+    return result
+
+
+def run(specs, simulation_parameters, random_seed, path_result_files):
+    """Execute main.py for one configuration and return the counters"""
+    counters.clear()
+    sys.argv = [
+        "main.py",
+        "--specs", specs,
+        "--simulation_parameters", simulation_parameters,
+        "--random_seed", str(random_seed),
+        "--path_result_files", path_result_files
+    ]
+
+    start = time.time()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        main.main()
+
+    result = Counter(counters)
+    result["wall_time"] = time.time() - start
+    return result
+
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(prog='Benchmark Events')
+    parser.add_argument('--specs', default="Experiment/Scaling/bf.json", help='The specs file')
+    parser.add_argument('--simulation_parameters', nargs="*", default=None, help='The simulation parameter files, default all the Experiment/Scaling files')
+    parser.add_argument('--packet_flow_file', default="Experiment/Scaling/packets/poisson.csv", help='The packet flow file (PATH_PACKET_FLOW_FILE)')
+    parser.add_argument('--random_seed', default=1, help='The random seed')
+    args = parser.parse_args()
+
+    simulation_parameters = args.simulation_parameters
+    if simulation_parameters is None:
+        simulation_parameters = sorted(aux for aux in glob.glob("Experiment/Scaling/*.json") if aux != args.specs)
+
+    os.environ["PATH_PACKET_FLOW_FILE"] = args.packet_flow_file
+    os.environ["NSS_SAVE_IMAGE_PLACEMENT"] = "0"
+    os.environ["NSS_DEBUG"] = "0"
+
+    simpy.Environment.schedule = count_schedule(simpy.Environment.schedule)
+    simpy.events.Process.__init__ = count_process(simpy.events.Process.__init__)
+    Simulation.add_packet = count_packets(Simulation.add_packet)
+    sub_process = Simulation.sub_process
+
+    # Allocations are the events scheduled plus the Process objects
+    print("{:<14} {:>7} {:>8} {:>11} {:>14} {:>12} {:>9} {:>9}".format(
+        "Config", "Mode", "Packets", "Events/Pkt", "Processes/Pkt", "Allocs/Pkt", "Wall(s)", "Reduction"
+    ))
+
+    with tempfile.TemporaryDirectory() as path:
+        for aux in simulation_parameters:
+            name = os.path.splitext(os.path.basename(aux))[0]
+
+            results = {}
+            for mode, method in [("spawn", spawn_process), ("inline", sub_process)]:
+                Simulation.sub_process = method
+                results[mode] = run(args.specs, aux, args.random_seed, "{}/{}_{}".format(path, name, mode))
+
+            for mode in ["spawn", "inline"]:
+                result = results[mode]
+                packets = max(result["packets"], 1)
+                events = result["events"] + result["processes"]
+                reduction = ""
+                if mode == "inline":
+                    spawn_events = results["spawn"]["events"] + results["spawn"]["processes"]
+                    reduction = "{:.1f}%".format(100 * (1 - events / max(spawn_events, 1)))
+
+                print("{:<14} {:>7} {:>8} {:>11.2f} {:>14.2f} {:>12.2f} {:>9.2f} {:>9}".format(
+                    name,
+                    mode,
+                    result["packets"],
+                    result["events"] / packets,
+                    result["processes"] / packets,
+                    events / packets,
+                    result["wall_time"],
+                    reduction
+                ))
+
+    Simulation.sub_process = sub_process
+
+
+if __name__ == "__main__":
+    main_benchmark()
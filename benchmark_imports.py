@@ -0,0 +1,112 @@
+"""
+Measure the import time of main.py (python -X importtime) on the default path and check it against a budget.
+
+The heavy and optional dependencies are imported only where they are used: matplotlib when the placement
+images are saved (NSS_SAVE_IMAGE_PLACEMENT=1), beautifultable by --list/--show and each placement or scaling
+module when its heuristic is configured. The script fails if the median import time is above the budget or if
+one of these modules is imported by main.py.
+
+Usage:
+    python benchmark_imports.py [--runs 5] [--budget 900]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# Import time budget of main.py in milliseconds (the median of the runs)
+IMPORT_TIME_BUDGET_MS = 900
+
+# Modules that must not be imported by main.py on the default path
+LAZY_MODULES = ["matplotlib", "beautifultable", "dill", "Scaling.RLAgent"]
+
+
+def import_times():
+    """Import main.py in a new interpreter and return a list with (level, self us, cumulative us, module)"""
+    environment = dict(os.environ, NSS_SAVE_IMAGE_PLACEMENT="0")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=environment,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        self_time, cumulative, name = line[len("import time:"):].split("|")
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        times.append((level, int(self_time), int(cumulative), name.strip()))
+
+    return times
+
+
+def main_imports():
+    """The modules imported by main.py on the default path"""
+    script = "import sys, main; print('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=dict(os.environ, NSS_SAVE_IMAGE_PLACEMENT="0"),
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return set(result.stdout.split())
+
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(prog='Import Time Benchmark')
+    parser.add_argument('--runs', default=5, type=int, help='Number of times main.py is imported')
+    parser.add_argument('--budget', default=IMPORT_TIME_BUDGET_MS, type=float, help='The import time budget in ms')
+    args = parser.parse_args()
+
+    totals = []
+    runs = []
+    for _ in range(args.runs):
+        times = import_times()
+        total = [cumulative for level, _, cumulative, name in times if level == 0 and name == "main"][0]
+        totals.append(total)
+        runs.append(times)
+
+    median = statistics.median(totals)
+    times = runs[totals.index(sorted(totals)[len(totals) // 2])]
+
+    # The modules imported directly by main.py, they are the level 1 entries after the previous level 0 entry
+    direct = []
+    for level, self_time, cumulative, name in times:
+        if level == 0:
+            if name == "main":
+                break
+            direct = []
+        elif level == 1:
+            direct.append((cumulative, name))
+
+    print("{:<40} {:>12}".format("Module imported by main.py", "Cumulative"))
+    for cumulative, name in sorted(direct, reverse=True)[:15]:
+        print("{:<40} {:>10.1f}ms".format(name, cumulative / 1000))
+
+    print("\nmain.py import time: {:.1f}ms (median of {} runs), budget {:.1f}ms".format(median / 1000, args.runs, args.budget))
+
+    failed = False
+    if median / 1000 > args.budget:
+        print("Error: the import time is above the budget")
+        failed = True
+
+    modules = main_imports()
+    for module in LAZY_MODULES:
+        if module in modules:
+            print("Error: {} is imported by main.py on the default path".format(module))
+            failed = True
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main_benchmark()
@@ -1,5 +1,4 @@
 # Python Classes
-from Scaling import Scaling
 from Simulation_Entities.SFC_Request import SFC_Request
 from Simulation_Entities.VNF_Instance import VNF_Instance
 from Simulation_Entities.SFC_Instance import SFC_Instance
@@ -11,14 +10,21 @@ from Edge_Entities.User import User
 from Edge_Entities.SFC import SFC
 from Edge_Entities.Link import Link
 from Edge_Entities.Data_Source import Data_Source
+from Edge_Entities.Variate_Buffer import Variate_Buffer
+from Edge_Entities.Random_Streams import Random_Streams
 
 import simpy.rt
 import simpy
 import random
 import json
 import argparse
+import os
 
 import time
+import sys
+import traceback
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 
 # Store info about the edge environment entities
 from Edge_Environment import Edge_Environment
@@ -28,17 +34,224 @@ from Simulation import Simulation
 from Simulation_SDN_Controller import Simulation_SDN_Controller
 from Simulation_Data import Simulation_Data
 from Simulation_Monitor import Simulation_Monitor
+from Simulation_Convergence_Monitor import Simulation_Convergence_Monitor
+from Simulation_Round_Summary import Simulation_Round_Summary
+from Simulation_Replication import Simulation_Replication
+from Simulation_Heartbeat import Simulation_Heartbeat
+import Result_Cache
+import Simulation_Snapshot
+import Simulation_Perf
+import Simulation_Counters
+import Simulation_Profiler
+import Simulation_Memory
+import Simulation_Estimator
+
+# Placement and Scaling heuristics, their modules are imported only when used
+import Heuristic_Registry
+
+
+def seed_random_functions(random_seed):
+    """
+    Seed all the random functions used by the simulation
+
+    Args:
+        random_seed (str|int): The random seed
+    """
+    random.seed(random_seed)
+    np.random.seed(Random_Streams.int_seed(random_seed))
+
+    # Seed of the block sampled variates (NSS_VARIATE_BUFFERS)
+    Variate_Buffer.configure(random_seed)
+
+    # Seed of the independent random streams (NSS_RANDOM_STREAMS)
+    Random_Streams.configure(random_seed)
+
+
+def round_seed(random_seed, i):
+    """
+    The seed used by the round i, it is the simulation seed plus the round number. The seed keeps its type
+    (str from the command line or int from the config file) because random.seed generates different
+    values for "1" and 1. A seed that is not a number gets the round number as a suffix, e.g. "abc_1"
+
+    Args:
+        random_seed (str|int): The simulation random seed
+        i (int): The round number
+    """
+    if i == 0:
+        return random_seed
+
+    if isinstance(random_seed, str):
+        try:
+            return str(int(random_seed) + i)
+        except ValueError:
+            return "{}_{}".format(random_seed, i)
+
+    return int(random_seed) + i
+
+
+def run_round(argv, i):
+    """Execute only the round i of the simulation, used by the workers of the process pool
+
+    Args:
+        argv (list): The command line arguments
+        i (int): The round number
+    """
+    start_time = time.time()
+    main(argv, rounds=[i])
+    return time.time() - start_time
+
+
+def run_rounds_in_pool(argv, rounds, workers):
+    """
+    Execute the rounds in a process pool, a round that fails is reported and the other rounds continue
+
+    Args:
+        argv (list): The command line arguments
+        rounds (list): The rounds numbers
+        workers (int): The number of processes
+    """
+    failed = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(run_round, argv, i): i for i in rounds}
+
+        for future in futures:
+            i = futures[future]
+            try:
+                print("Round {} finished in {:.2f}s".format(i, future.result()))
+            except BaseException as e:
+                failed.append(i)
+                print("Round {} failed: {}".format(i, e), file=sys.stderr)
+                traceback.print_exception(type(e), e, e.__traceback__, file=sys.stderr)
+
+    if failed:
+        print("Rounds failed: {}".format(failed), file=sys.stderr)
+        sys.exit(1)
+
+
+def run_replication_in_pool(argv, replication, workers, path_result_files):
+    """
+    Execute the rounds in batches of the number of workers until the replication finishes, the summary of each
+    round is loaded from its summary.json
+
+    Args:
+        argv (list): The command line arguments
+        replication (Simulation_Replication): The sequential replication control
+        workers (int): The number of processes
+        path_result_files (str): The path where the results are saved
+    """
+    i = 0
+    while not replication.finished():
+        rounds = range(i, min(i + max(workers, replication.min_rounds - i), replication.max_rounds))
+        run_rounds_in_pool(argv, rounds, workers)
+
+        for j in rounds:
+            replication.add_round(j, Simulation_Round_Summary.load("{}/Round_{}".format(path_result_files, j)))
+        i = rounds.stop
+
+
+def finish_round(args, i, start_time, e1, sd, sm, simulation_monitor, path_result_files, log_link_entity):
+    """
+    Run the simulation of the round until the end, and save the results and the entities
+
+    Args:
+        args (Namespace): The command line arguments
+        i (int): The round number
+        start_time (float): The wall time when the round started
+        e1 (Edge_Environment): The edge environment
+        sd (Simulation_Data): The simulation data
+        sm (Simulation): The simulation
+        simulation_monitor (Simulation_Monitor): The master monitor
+        path_result_files (str): The path where the results are saved (the round is saved in Round_i)
+        log_link_entity (bool): Save or not the link entities
+    """
+    exp_path = "{}/Round_{}".format(path_result_files, i)
+    sm.path_result_files = exp_path
+
+    # Run the Simulation (or continue it from the snapshot)
+    if sm.heartbeat:
+        sm.heartbeat.label = path_result_files
+    sm.run()
+
+    if sm.heartbeat:
+        sm.heartbeat.beat(finished=True)
+
+    # Destroy the simulation and generate the final logs
+    sm.finish_simulation()
+
+    # The memory report of the end of the simulation, before the events are saved (NSS_MEMORY_REPORT)
+    Simulation_Memory.save(exp_path)
+
+    simulation_monitor.stop()
+
+    print("fim")
+
+    # Save the entities, each round has its own entities because the instances created in the simulation depend
+    # on the round seed. The entities of the first round are also saved in the experiment folder (the rounds can
+    # run in parallel)
+    e1.save_entities_csv(
+        file_path="{}/Entities".format(exp_path),
+        log_link_entity=log_link_entity
+    )
+
+    if i == 0:
+        e1.save_entities_csv(
+            file_path="{}/Entities".format(path_result_files),
+            log_link_entity=log_link_entity
+        )
+
+    # After the execution of the simulation save the data
+    sd.save_events_csv(
+        edge_environment=e1,
+        sm=sm,
+        file_path=exp_path
+    )
+
+    # Print the entities
+    if args.list:
+        print("**************")
+        print("List Environment Entities")
+        print("**************")
+        User.list(e1.users)
+        VNF.list(e1.vnfs)
+        Node.list(e1.nodes)
+        SFC.list(e1.sfcs)
+        SFC_Request.list(e1.sfc_requests)
+        Data_Source.list(e1.data_sources)
+        # Link.list(e1.links)
+
+        print("**************")
+        print("List Simulation Entities")
+        print("**************")
+        SFC_Request.list(e1.sfc_requests)
+        SFC_Instance.list(e1.sfc_instances)
+        VNF_Instance.list((e1.vnf_instances))
+
+        sm.list_packets()
+
+    # The summary metrics of the round, used by the sequential replication
+    if sm.round_summary:
+        sm.round_summary.save(exp_path)
 
-# Placement and Scaling Classes
-from Placement import *
-from Scaling import *
+    # The samples of the simpy counters (NSS_COUNTERS)
+    Simulation_Counters.save(exp_path)
 
-from Scaling.BasicCPUScaling import BasicCPUScaling
-from Scaling.SmartVerticalScalingUp import SmartVerticalScalingUp
-from Scaling.SmartVerticalScalingDown import SmartVerticalScalingDown
-from Scaling.SmartQueueScaling import SmartQueueScaling
-from Scaling.TCPInspiredVerticalScalingUp import TCPInspiredVerticalScalingUp
-def main():
+    # The truncation points, the estimates and the stopping reason
+    if sm.convergence_monitor:
+        sm.convergence_monitor.save(exp_path)
+
+    # Save the process time for each round
+    file = open('{}/process_time.txt'.format(exp_path), 'w')
+    file.write("{}".format(time.time() - start_time))
+    file.close()
+
+    # The profile files of the round (--profile) and its hot functions in perf.json
+    profile = Simulation_Profiler.stop(exp_path, args.profile_top)
+
+    # The wall time of the phases and the simulation time / wall time ratio (NSS_PERF)
+    Simulation_Perf.save(exp_path, sm.env.now, time.time() - start_time, profile)
+
+
+def main(argv=None, rounds=None):
 
     # Parse parameters
     parser = argparse.ArgumentParser(prog='VNF Simulator')
@@ -53,9 +266,20 @@ def main():
     parser.add_argument('--random_seed', default="", help='The random seed used by Python to generate the same random values among multiples executions')
     parser.add_argument('--only_placement', default="", help='Execute only the placement and stops before starting the simulation')
     parser.add_argument('--user_mobility_file', default="", help='The file with the mobility pattern from the users')
+    parser.add_argument('--workers', default=1, type=int, help='Number of processes used to execute the rounds in parallel --workers 4')
+    parser.add_argument('--snapshot_time', default="", help='The simulation time of the snapshot where the variants are resumed --snapshot_time 5000')
+    parser.add_argument('--profile', default="", choices=[""] + Simulation_Profiler.MODES, help='Profile each round, the profile files are saved in the round folder --profile cprofile')
+    parser.add_argument('--profile_top', default=20, type=int, help='Number of hot functions of the profile saved in perf.json --profile_top 20')
+    parser.add_argument('--heartbeat', default=0, type=float, help='Report the progress of the simulation in the stderr at most every N seconds --heartbeat 10')
+    parser.add_argument('--heartbeat_file', default="", help='JSON lines file where the heartbeats are also appended --heartbeat_file heartbeat.jsonl')
+    parser.add_argument('--estimate', default="", help='Estimate the workload and the cost of the simulation without running it --estimate 1')
+    parser.add_argument('--calibration', default="", help='The calibration file used by the estimate --calibration calibration.json')
+    parser.add_argument('--fork_simulation_parameters', default="", help='The simulation parameter files of the variants resumed from the snapshot --fork_simulation_parameters a.json,b.json')
 
     # args process
-    args = parser.parse_args()
+    if argv is None:
+        argv = sys.argv[1:]
+    args = parser.parse_args(argv)
 
     # Load the specifications from the specs files
     specs = ""
@@ -72,9 +296,6 @@ def main():
     else:
         RANDOM_SEED = simulation_parameters['simulation']['random_seed']
 
-    # Seed used in all the random functions
-    random.seed(RANDOM_SEED)
-
     # How many times the simulation will be executed using the same environment entities
     NUM_ROUNDS_SIMULATION = simulation_parameters['simulation']['num_rounds']
 
@@ -218,6 +439,78 @@ def main():
         }
         pass
 
+    # Configuration Validation, the heuristics and the optional blocks are validated before the simulation starts
+    heuristics = {}
+    config_errors = []
+    for block, kind in [("placement", Heuristic_Registry.PLACEMENT), ("scaling", Heuristic_Registry.SCALING), ("scaling_down", Heuristic_Registry.SCALING)]:
+        if block in simulation_parameters:
+            name, parameters, errors = Heuristic_Registry.validate(kind, simulation_parameters[block])
+            heuristics[block] = (kind, name, parameters)
+            config_errors += errors
+
+    if "placement" not in simulation_parameters:
+        config_errors.append("The placement heuristic is not configured")
+
+    # The convergence monitor stops the simulation before the total time when the KPIs reach the steady state
+    CONVERGENCE = simulation_parameters.get('convergence')
+    if CONVERGENCE is not None:
+        for key in ["interval", "relative_width"]:
+            if key not in CONVERGENCE:
+                config_errors.append("convergence: missing parameter {!r}".format(key))
+
+        for kpi in CONVERGENCE.get("kpis", []):
+            if kpi not in Simulation_Convergence_Monitor.KPIS:
+                config_errors.append("convergence: unknown KPI {!r}, the options are: {}".format(
+                    kpi, ", ".join(Simulation_Convergence_Monitor.KPIS)))
+
+    # The sequential replication executes rounds until the confidence interval of the metrics is narrow enough,
+    # instead of the num_rounds
+    REPLICATION = simulation_parameters.get('replication')
+    if REPLICATION is not None:
+        if "relative_width" not in REPLICATION:
+            config_errors.append("replication: missing parameter 'relative_width'")
+
+        for metric in REPLICATION.get("metrics", []):
+            if metric not in Simulation_Round_Summary.METRICS:
+                config_errors.append("replication: unknown metric {!r}, the options are: {}".format(
+                    metric, ", ".join(Simulation_Round_Summary.METRICS)))
+
+        if args.fork_simulation_parameters:
+            config_errors.append("The replication block can not be used with --fork_simulation_parameters")
+
+    # The variants resumed from the snapshot, they share the warm-up (the simulation and placement blocks) and
+    # each one has its own scaling. The simulation and placement blocks of a variant file are optional, the blocks
+    # of the --simulation_parameters are used in the whole simulation, thus they must be the same when present
+    variants = []
+    if args.fork_simulation_parameters:
+        if args.snapshot_time == "":
+            config_errors.append("The --snapshot_time is required by --fork_simulation_parameters")
+
+        for file_name in args.fork_simulation_parameters.split(","):
+            with open(file_name) as json_file:
+                variant_parameters = json.load(json_file)
+
+            for block in ["simulation", "placement"]:
+                if block in variant_parameters and variant_parameters[block] != simulation_parameters.get(block):
+                    config_errors.append("The {} of {} must be the same of {}".format(block, file_name, args.simulation_parameters))
+
+            variant = {
+                "name": os.path.splitext(os.path.basename(file_name))[0],
+                "heuristics": {}
+            }
+            for block in ["scaling", "scaling_down"]:
+                if block in variant_parameters:
+                    name, parameters, errors = Heuristic_Registry.validate(Heuristic_Registry.SCALING, variant_parameters[block])
+                    variant["heuristics"][block] = (Heuristic_Registry.SCALING, name, parameters)
+                    config_errors += errors
+
+            variants.append(variant)
+
+    if config_errors:
+        for error in config_errors:
+            print("Error: {}".format(error))
+        quit()
+
     # Specs Validation
     if args.load == False:
 
@@ -236,11 +529,79 @@ def main():
             print("Error: The number of VNFs in the Node must be lower than the number of VNFs created")
             quit()
 
+    # Dry-run, the simulation is not executed
+    if args.estimate == "1":
+        estimate = Simulation_Estimator.estimate(
+            specs=specs,
+            sfc_requests_parameters=sfc_requests_parameters,
+            total_time=TOTAL_TIME_SIMULATION,
+            time_window=TIME_WINDOW,
+            time_limit_to_packet_generation=TIME_LIMIT_TO_PACKET_GENERATION,
+            packet_generation=PACKET_GENERATION,
+            packet_flow_file=os.environ.get("PATH_PACKET_FLOW_FILE", ""),
+            rounds=Simulation_Replication.from_parameters(REPLICATION).max_rounds if REPLICATION is not None else NUM_ROUNDS_SIMULATION,
+            workers=args.workers,
+            calibration=Simulation_Estimator.load_calibration(args.calibration) if args.calibration else None
+        )
+        Simulation_Estimator.print_estimate(estimate)
+        return estimate
+
+    # The completion marker is written only by the execution of all the rounds (not by a round of the pool)
+    result_key = None
+    if rounds is None:
+        result_key, result_inputs = Result_Cache.result_key(
+            specs=args.specs,
+            simulation_parameters=args.simulation_parameters,
+            random_seed=RANDOM_SEED,
+            packet_flow_file=os.environ.get("PATH_PACKET_FLOW_FILE", ""),
+            user_mobility_file=USER_MOBILITY_FILE,
+            extra={
+                "snapshot_time": args.snapshot_time,
+                "variants": [Result_Cache.file_digest(file_name) for file_name in args.fork_simulation_parameters.split(",")]
+            } if variants else None
+        )
+
+    replication = None
+    if rounds is None and REPLICATION is not None:
+        replication = Simulation_Replication.from_parameters(REPLICATION)
+        rounds = range(replication.max_rounds)
+
+        # The rounds run in batches in the process pool
+        if args.workers > 1:
+            run_replication_in_pool(argv, replication, args.workers, args.path_result_files)
+            replication.save(args.path_result_files)
+            Result_Cache.mark_complete(args.path_result_files, result_key, result_inputs)
+            return
+
     # Execute the same experiment 'n' times, this will avoid bias
-    for i in range(NUM_ROUNDS_SIMULATION):
+    if rounds is None:
+        rounds = range(NUM_ROUNDS_SIMULATION)
+
+        # Each round runs in its own process
+        if args.workers > 1 and NUM_ROUNDS_SIMULATION > 1:
+            run_rounds_in_pool(argv, rounds, args.workers)
+            Result_Cache.mark_complete(args.path_result_files, result_key, result_inputs)
+            return
+
+    for i in rounds:
 
         start_time = time.time()
 
+        # All the rounds use the same environment entities, generated with the simulation seed
+        seed_random_functions(RANDOM_SEED)
+
+        # Wall time of the phases of the round (NSS_PERF)
+        Simulation_Perf.configure()
+
+        # Counters of the simpy events, processes and queues (NSS_COUNTERS)
+        Simulation_Counters.configure()
+
+        # Profile the whole round (--profile)
+        Simulation_Profiler.start(args.profile)
+
+        # Memory report of the round (NSS_MEMORY_REPORT), it uses the tracemalloc of the profiler if it is running
+        Simulation_Memory.configure()
+
         # Real Time Simulation
         # env = simpy.rt.RealtimeEnvironment(factor=0.001, strict=False)
         env = simpy.Environment()
@@ -253,15 +614,36 @@ def main():
 
         # Generate the random edge environment
         # the name is not used yet, is just a label
-        e1 = Edge_Environment(
-            name="edge1",
-            specs=specs,
-            random_seed=RANDOM_SEED,
-            total_time = TOTAL_TIME_SIMULATION,
-            time_window=TIME_WINDOW,
-            max_replacement_retries=MAX_REPLACEMENT_RETRIES,
-            replacement_backoff_slot_size=REPLACEMENT_BACKOFF_SLOT_SIZE,
-        )
+        # NSS_ENVIRONMENT_CACHE: folder where the generated environments are cached (same specs and seed)
+        environment_start_time = time.perf_counter()
+        if "NSS_ENVIRONMENT_CACHE" in os.environ and os.environ["NSS_ENVIRONMENT_CACHE"]:
+            e1 = Edge_Environment.cached(
+                cache_path=os.environ["NSS_ENVIRONMENT_CACHE"],
+                name="edge1",
+                specs=specs,
+                random_seed=RANDOM_SEED,
+                total_time=TOTAL_TIME_SIMULATION,
+                time_window=TIME_WINDOW,
+                max_replacement_retries=MAX_REPLACEMENT_RETRIES,
+                replacement_backoff_slot_size=REPLACEMENT_BACKOFF_SLOT_SIZE
+            )
+        else:
+            e1 = Edge_Environment(
+                name="edge1",
+                specs=specs,
+                random_seed=RANDOM_SEED,
+                total_time = TOTAL_TIME_SIMULATION,
+                time_window=TIME_WINDOW,
+                max_replacement_retries=MAX_REPLACEMENT_RETRIES,
+                replacement_backoff_slot_size=REPLACEMENT_BACKOFF_SLOT_SIZE,
+            )
+        Simulation_Perf.add("environment", time.perf_counter() - environment_start_time)
+
+        # Each round has its own seed after the environment is generated, thus the packets and the other random
+        # values of a round do not depend on the previous rounds. The round 0 continues with the random state
+        # left by the generation of the environment, as a simulation with one round
+        if i > 0:
+            seed_random_functions(round_seed(RANDOM_SEED, i))
 
         # Create the SDN Controller Like
         ctrl = Simulation_SDN_Controller(e1)
@@ -277,70 +659,27 @@ def main():
 
         # Generate the plan for the VNF instance allocation
         # Load the correct object based on the specification placement_heuristic selected
-        parameters = []
-        if simulation_parameters['simulation']['share_sfc_instance'] == "1" or simulation_parameters['simulation']['share_sfc_instance'] == 1:
-            parameters.append("sfc_instance_sharable=True")
-        else:
-            parameters.append("sfc_instance_sharable=False")
-
-        str_parameter = ""
-        if 'parameters' in simulation_parameters['placement'] and len(simulation_parameters['placement']['parameters']) > 0:
-            aux_parameters = simulation_parameters['placement']['parameters']
-            for p in aux_parameters:
-                key = p
-                value = aux_parameters[key]
-                parameters.append("{}='{}'".format(key, value))
+        sfc_instance_sharable = simulation_parameters['simulation']['share_sfc_instance'] == "1" or simulation_parameters['simulation']['share_sfc_instance'] == 1
 
-        str_parameter = ", ".join(parameters)
-        str_parameter = ", {}".format(str_parameter)
-
-        str_placement = "{0}.{0}(e1 {1})".format(simulation_parameters['placement']['heuristic'], str_parameter)
-        placement = eval(str_placement)
+        kind, name, parameters = heuristics['placement']
+        placement = Heuristic_Registry.create(kind, name, parameters, environment=e1, sfc_instance_sharable=sfc_instance_sharable)
 
         ####### Scaling object
         # Create the scaling
         # only execute if there is a scaling configured
+        # With the snapshot variants, the scaling starts only in the variants after the snapshot
         scaling = False
-        if 'scaling' in simulation_parameters:
-            # Load the correct object based on the specification placement_heuristic selected
-            scaling_parameters = []
-            str_parameter = ""
-            if 'parameters' in simulation_parameters['scaling'] and len(
-                    simulation_parameters['scaling']['parameters']) > 0:
-                aux_parameters = simulation_parameters['scaling']['parameters']
-                for p in aux_parameters:
-                    key = p
-                    value = aux_parameters[key]
-                    scaling_parameters.append("{}=\"{}\"".format(key, value))
-
-                str_parameter = ", ".join(scaling_parameters)
-                str_parameter = "{}".format(str_parameter)
-
-            str_scaling = "{}(env=env, edge_environment = e1, sd = sd, {})".format(simulation_parameters['scaling']['heuristic'], str_parameter)
-            scaling = eval(str_scaling)
+        if 'scaling' in heuristics and not variants:
+            kind, name, parameters = heuristics['scaling']
+            scaling = Heuristic_Registry.create(kind, name, parameters, env=env, edge_environment=e1, sd=sd)
 
         ####### Scaling object
         # Create the scaling
         # only execute if there is a scaling configured
         scaling_down = False
-        if 'scaling_down' in simulation_parameters:
-            # Load the correct object based on the specification placement_heuristic selected
-            scaling_parameters = []
-            str_parameter = ""
-            if 'parameters' in simulation_parameters['scaling'] and len(
-                    simulation_parameters['scaling_down']['parameters']) > 0:
-                aux_parameters = simulation_parameters['scaling_down']['parameters']
-                for p in aux_parameters:
-                    key = p
-                    value = aux_parameters[key]
-                    scaling_parameters.append("{}=\"{}\"".format(key, value))
-
-                str_parameter = ", ".join(scaling_parameters)
-                str_parameter = "{}".format(str_parameter)
-
-            str_scaling = "{}(env=env, edge_environment = e1, sd = sd, {})".format(simulation_parameters['scaling_down']['heuristic'], str_parameter)
-
-            scaling_down = eval(str_scaling)
+        if 'scaling_down' in heuristics and not variants:
+            kind, name, parameters = heuristics['scaling_down']
+            scaling_down = Heuristic_Registry.create(kind, name, parameters, env=env, edge_environment=e1, sd=sd)
 
         # Show the first of each generated entity
         if args.show:
@@ -406,55 +745,83 @@ def main():
         # Run the Master Monitor
         simulation_monitor.run()
 
-        # Run the Simulation
-        sm.run()
-
-        # Destroy the simulation and generate the final logs
-        sm.finish_simulation()
-
-        simulation_monitor.stop()
-
-        print("fim")
+        # Count the events processed by the environment (NSS_COUNTERS)
+        Simulation_Counters.start(env, sm)
+
+        # Take the memory reports in the simulation times (NSS_MEMORY_REPORT_TIMES)
+        Simulation_Memory.start(env, sm)
+
+        # Report the progress of the simulation
+        if args.heartbeat > 0:
+            sm.heartbeat = Simulation_Heartbeat(
+                env=env,
+                simulation=sm,
+                total_time=TOTAL_TIME_SIMULATION,
+                wall_interval=args.heartbeat,
+                file_path=args.heartbeat_file,
+                label=args.path_result_files,
+                round=i
+            )
+            sm.heartbeat.start()
+
+        if CONVERGENCE is not None:
+            sm.convergence_monitor = Simulation_Convergence_Monitor(
+                env=env,
+                edge_environment=e1,
+                interval=CONVERGENCE['interval'],
+                relative_width=CONVERGENCE['relative_width'],
+                confidence=CONVERGENCE.get('confidence', 0.95),
+                batches=CONVERGENCE.get('batches', 20),
+                min_time=CONVERGENCE.get('min_time', 0),
+                kpis=CONVERGENCE.get('kpis')
+            )
+            sm.packet_observers.append(sm.convergence_monitor)
+            env.process(sm.convergence_monitor.run())
+
+        if REPLICATION is not None:
+            sm.round_summary = Simulation_Round_Summary()
+            sm.packet_observers.append(sm.round_summary)
+
+        if variants:
+            # Run the warm-up shared by the variants until the snapshot, then resume each variant from the
+            # snapshot in its own process, with its scaling and its result folder
+            sm.run(until=int(args.snapshot_time))
+
+            def run_variant(variant):
+                heuristics = variant["heuristics"]
+                scaling = False
+                if 'scaling' in heuristics:
+                    kind, name, parameters = heuristics['scaling']
+                    scaling = Heuristic_Registry.create(kind, name, parameters, env=env, edge_environment=e1, sd=sd)
+
+                scaling_down = False
+                if 'scaling_down' in heuristics:
+                    kind, name, parameters = heuristics['scaling_down']
+                    scaling_down = Heuristic_Registry.create(kind, name, parameters, env=env, edge_environment=e1, sd=sd)
+
+                simulation_monitor.start_scaling(scaling, scaling_down)
+
+                finish_round(args, i, start_time, e1, sd, sm, simulation_monitor, "{}/{}".format(args.path_result_files, variant["name"]), LOG_LINK_ENTITY)
+
+            failed = Simulation_Snapshot.fork(variants, run_variant, args.workers)
+            if failed:
+                print("Variants failed: {}".format([variant["name"] for variant in failed]), file=sys.stderr)
+                sys.exit(1)
+        else:
+            finish_round(args, i, start_time, e1, sd, sm, simulation_monitor, args.path_result_files, LOG_LINK_ENTITY)
 
-        # Save the entities
-        e1.save_entities_csv(
-            file_path="{}/Entities".format(args.path_result_files),
-            log_link_entity=LOG_LINK_ENTITY
-        )
+            # Stop when the confidence interval of the metrics is narrow enough
+            if replication:
+                replication.add_round(i, sm.round_summary.summary())
+                if replication.finished():
+                    break
 
-        # After the execution of the simulation save the data
-        sd.save_events_csv(
-            edge_environment=e1,
-            sm=sm,
-            file_path=exp_path
-        )
+    if replication:
+        replication.save(args.path_result_files)
 
-        # Print the entities
-        if args.list:
-            print("**************")
-            print("List Environment Entities")
-            print("**************")
-            User.list(e1.users)
-            VNF.list(e1.vnfs)
-            Node.list(e1.nodes)
-            SFC.list(e1.sfcs)
-            SFC_Request.list(e1.sfc_requests)
-            Data_Source.list(e1.data_sources)
-            # Link.list(e1.links)
-
-            print("**************")
-            print("List Simulation Entities")
-            print("**************")
-            SFC_Request.list(e1.sfc_requests)
-            SFC_Instance.list(e1.sfc_instances)
-            VNF_Instance.list((e1.vnf_instances))
-
-            Packet.list(sm.packets)
-
-        # Save the process time for each round
-        file = open('{}/process_time.txt'.format(exp_path), 'w')
-        file.write("{}".format(time.time() - start_time))
-        file.close()
+    # All the rounds finished, the results are complete
+    if result_key is not None:
+        Result_Cache.mark_complete(args.path_result_files, result_key, result_inputs)
 
 if __name__ == "__main__":
     main()
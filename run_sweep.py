@@ -0,0 +1,301 @@
+"""
+Execute the experiments of Experiment/experiments.json (also used by run_experiment.sh) without starting a new
+python interpreter for each simulation.
+
+The cells of the experiment (repetition x environment x algorithm) are executed by a pool of processes that
+import the simulator (pandas, numpy, simpy, ...) only once. The provenance files are saved in the
+experiment folder and the wall time of each cell is reported in Provenance/cells.csv.
+
+Each cell is keyed by the hash of its inputs (see Result_Cache), a cell whose results are complete for its key
+is skipped (status CACHED) unless --force is used, and the partial results of a cell that crashed are removed
+and the cell is executed again.
+
+Usage:
+    python run_sweep.py -e Q1 -r 9 -w 16
+"""
+import argparse
+import contextlib
+import csv
+import datetime
+import io
+import itertools
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Imported here, thus each process of the pool imports the simulator modules only once
+import main
+import Result_Cache
+
+# The experiments, shared with run_experiment.sh. "envs" are the specs files and "algs" the simulation parameter
+# files in Experiment/<name>/, "environment" are the environment variables used by the experiment (the paths are
+# relative to the program path) and the top level "environment" is used by all the experiments
+EXPERIMENTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Experiment", "experiments.json")
+
+
+def load_experiments(file_name=EXPERIMENTS_FILE):
+    """
+    Load the experiment definitions
+
+    Args:
+        file_name (str, optional): The JSON file with the experiments. Defaults to Experiment/experiments.json.
+    Returns:
+        tuple: (experiments, environment used by all the experiments)
+    """
+    with open(file_name) as json_file:
+        definitions = json.load(json_file)
+
+    return definitions["experiments"], definitions.get("environment", {})
+
+
+EXPERIMENTS, DEFAULT_ENVIRONMENT = load_experiments()
+
+
+def run_cell(argv, log_file):
+    """
+    Execute the simulation of one cell inside a process of the pool
+
+    Args:
+        argv (list): The arguments of main.py
+        log_file (str): The file where the output of the simulation is saved
+    Returns:
+        tuple: (wall time, error), the error is None if the simulation finished
+    """
+    start_time = time.time()
+    error = None
+
+    os.makedirs(os.path.dirname(log_file), exist_ok=True)
+    with open(log_file, "w") as log, contextlib.redirect_stdout(log):
+        try:
+            main.main(argv)
+        except BaseException:
+            error = traceback.format_exc()
+            log.write(error)
+
+    return time.time() - start_time, error
+
+
+def estimate_sweep(cells, args):
+    """
+    Print the estimate of each cell (main.py --estimate) and of the whole sweep, without executing the cells
+
+    Args:
+        cells (list): The cells of the sweep
+        args (Namespace): The arguments of the sweep
+    """
+    print("{:<40} {:>12} {:>12} {:>12} {:>12}".format("Cell", "SFC Requests", "Packets", "Peak MB", "Wall Time"))
+
+    estimates = []
+    for cell in cells:
+        argv = cell["argv"] + ["--estimate", "1"]
+        if args.calibration:
+            argv += ["--calibration", args.calibration]
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            estimate = main.main(argv)
+        estimates.append(estimate)
+
+        print("{:<40} {:>12.0f} {:>12.0f} {:>12} {:>12}".format(
+            cell["name"], estimate["sfc_requests"], estimate["packets"],
+            "{:.0f}".format(estimate["peak_rss_mb"]) if estimate["peak_rss_mb"] is not None else "-",
+            "{:.1f}s".format(estimate["total_wall_time"]) if estimate["total_wall_time"] is not None else "-"))
+
+    print("Total: {:.0f} packets".format(sum(estimate["packets"] for estimate in estimates)))
+
+    if args.calibration:
+        # The cells run in parallel, the slowest cells first is the best case
+        wall_time = sum(estimate["total_wall_time"] for estimate in estimates)
+        peak = sorted((estimate["peak_rss_mb"] or 0 for estimate in estimates), reverse=True)[:args.workers]
+        print("Wall time: {:.1f}s in total, about {:.1f}s with {} workers, up to {:.0f} MB of memory".format(
+            wall_time, max(wall_time / args.workers, max(estimate["total_wall_time"] for estimate in estimates)),
+            args.workers, sum(peak)))
+
+
+def git_commit(path_program):
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=path_program,
+            capture_output=True,
+            text=True
+        ).stdout.strip()
+    except OSError:
+        return ""
+
+
+def save_provenance(experiment, exp_name, exp_path_result, path_program, user_mobility_file, args, cells):
+    """Copy the files used by the experiment and save the sweep definition in the Provenance folder"""
+    config_path = os.path.join(exp_path_result, "Provenance")
+    os.makedirs(config_path, exist_ok=True)
+    os.makedirs(os.path.join(exp_path_result, "Images"), exist_ok=True)
+
+    with open(os.path.join(config_path, "description.txt"), "w") as file:
+        file.write(experiment["description"] + "\n")
+
+    if os.path.isfile(user_mobility_file):
+        shutil.copy(user_mobility_file, os.path.join(config_path, "mobility_file_pattern.txt"))
+
+    packet_flow_file = os.environ.get("PATH_PACKET_FLOW_FILE", "")
+    if packet_flow_file and os.path.isfile(packet_flow_file):
+        shutil.copy(packet_flow_file, os.path.join(config_path, "packets.csv"))
+
+    for envir in experiment["envs"]:
+        shutil.copy(
+            os.path.join(path_program, "Experiment", exp_name, "{}.json".format(envir)),
+            os.path.join(config_path, "environment_{}.json".format(envir))
+        )
+
+    for alg in experiment["algs"]:
+        shutil.copy(
+            os.path.join(path_program, "Experiment", exp_name, "{}.json".format(alg)),
+            os.path.join(config_path, "simulation_{}.json".format(alg))
+        )
+
+    sweep = {
+        "experiment": exp_name,
+        "description": experiment["description"],
+        "command": sys.argv,
+        "started_at": datetime.datetime.now().isoformat(),
+        "git_commit": git_commit(path_program),
+        "python": platform.python_version(),
+        "workers": args.workers,
+        "environment": {key: os.environ[key] for key in sorted(os.environ) if key.startswith("NSS_") or key in ["PATH_PACKET_FLOW_FILE", "COMPUTE_LINK_BW_LIMIT"]},
+        "cells": [cell["name"] for cell in cells]
+    }
+    with open(os.path.join(config_path, "sweep.json"), "w") as file:
+        json.dump(sweep, file, indent=2)
+
+
+def main_sweep():
+    parser = argparse.ArgumentParser(prog='Sweep')
+    parser.add_argument('-e', '--experiment', required=True, choices=list(EXPERIMENTS), help='The experiment id')
+    parser.add_argument('-r', '--repetitions', default=0, type=int, help='The number of the last repetition (Env_0 ... Env_r)')
+    parser.add_argument('-w', '--workers', default=max(1, (os.cpu_count() or 2) // 2), type=int, help='Number of processes, default half of the CPUs')
+    parser.add_argument('--random_seed', default="", help='The random seed used in all the repetitions, default the repetition number')
+    parser.add_argument('--path_program', default=os.getcwd(), help='The path of the simulator')
+    parser.add_argument('--path_results', default="", help='Where the results are saved, default <path_program>/Experiment/Results')
+    parser.add_argument('--user_mobility_file', default="Mobility/user_mobility.csv", help='The user mobility file saved in the provenance')
+    parser.add_argument('--force', action='store_true', help='Execute the cells again even if their results are complete')
+    parser.add_argument('--estimate', action='store_true', help='Print the estimated workload and cost of each cell without executing the sweep')
+    parser.add_argument('--calibration', default="", help='The calibration file used by --estimate (see Simulation_Estimator.py)')
+    parser.add_argument('--heartbeat', default=0, type=float, help='Report the progress of each cell at most every N seconds, also saved in Provenance/heartbeat.jsonl')
+    args = parser.parse_args()
+
+    exp_name = args.experiment
+    experiment = EXPERIMENTS[exp_name]
+    path_program = os.path.abspath(args.path_program)
+
+    for key, value in dict(DEFAULT_ENVIRONMENT, **experiment.get("environment", {})).items():
+        if key in ["NSS_ERROR_PATH", "PATH_PACKET_FLOW_FILE"]:
+            value = os.path.join(path_program, value)
+        os.environ[key] = value
+
+    path_results = args.path_results or os.path.join(path_program, "Experiment", "Results")
+    exp_path_result = os.path.join(os.path.abspath(path_results), exp_name)
+
+    # The cartesian product repetition x environment x algorithm
+    cells = []
+    for z, envir, alg in itertools.product(range(args.repetitions + 1), experiment["envs"], experiment["algs"]):
+        seed = args.random_seed if args.random_seed != "" else str(z)
+        path_result_files = os.path.join(exp_path_result, "Env_{}".format(z), envir, alg)
+        simulation_parameters = os.path.join(path_program, "Experiment", exp_name, "{}.json".format(alg))
+        specs = os.path.join(path_program, "Experiment", exp_name, "{}.json".format(envir))
+        cells.append({
+            "name": "Env_{}/{}/{}".format(z, envir, alg),
+            "env": z,
+            "environment": envir,
+            "algorithm": alg,
+            "seed": seed,
+            "specs": specs,
+            "simulation_parameters": simulation_parameters,
+            "path_result_files": path_result_files,
+            "argv": [
+                "--simulation_parameters", simulation_parameters,
+                "--specs", specs,
+                "--path_result_files", path_result_files,
+                "--random_seed", seed
+            ]
+        })
+
+        # The heartbeats of all the cells are appended to the same file, labeled by the path of the cell
+        if args.heartbeat > 0:
+            cells[-1]["argv"] += [
+                "--heartbeat", str(args.heartbeat),
+                "--heartbeat_file", os.path.join(exp_path_result, "Provenance", "heartbeat.jsonl")
+            ]
+
+    # Dry-run, nothing is saved
+    if args.estimate:
+        estimate_sweep(cells, args)
+        return
+
+    save_provenance(experiment, exp_name, exp_path_result, path_program, args.user_mobility_file, args, cells)
+
+    # Skip the cells with complete results and remove the partial results of the cells that crashed
+    rows = []
+    pending = []
+    for cell in cells:
+        key, _ = Result_Cache.result_key(
+            specs=cell["specs"],
+            simulation_parameters=cell["simulation_parameters"],
+            random_seed=cell["seed"],
+            packet_flow_file=os.environ.get("PATH_PACKET_FLOW_FILE", "")
+        )
+
+        if not args.force and Result_Cache.is_complete(cell["path_result_files"], key):
+            rows.append([cell["env"], cell["environment"], cell["algorithm"], cell["seed"], "CACHED", "", cell["path_result_files"]])
+            continue
+
+        if Result_Cache.has_partial_results(cell["path_result_files"], key):
+            print("Removing partial results: {}".format(cell["name"]))
+            Result_Cache.remove_results(cell["path_result_files"])
+        elif args.force:
+            Result_Cache.remove_results(cell["path_result_files"])
+
+        pending.append(cell)
+
+    print("Executing Experiment: {} ({} cells, {} cached, {} workers)".format(exp_name, len(cells), len(rows), args.workers))
+
+    start_time = time.time()
+    failed = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = {
+            executor.submit(run_cell, cell["argv"], os.path.join(cell["path_result_files"], "output.txt")): cell
+            for cell in pending
+        }
+
+        for future in as_completed(futures):
+            cell = futures[future]
+            try:
+                wall_time, error = future.result()
+            except BaseException:
+                # The process of the pool died
+                wall_time, error = 0, traceback.format_exc()
+
+            status = "OK" if error is None else "FAILED"
+            if error is not None:
+                failed += 1
+                print(error, file=sys.stderr)
+
+            print("[{}/{}] {} {} {:.2f}s".format(len(rows) + 1, len(cells), cell["name"], status, wall_time))
+            rows.append([cell["env"], cell["environment"], cell["algorithm"], cell["seed"], status, "{:.3f}".format(wall_time), cell["path_result_files"]])
+
+    with open(os.path.join(exp_path_result, "Provenance", "cells.csv"), "w", newline="") as file:
+        writer = csv.writer(file, delimiter=";")
+        writer.writerow(["Env", "Environment", "Algorithm", "Random_Seed", "Status", "Wall_Time", "Path"])
+        writer.writerows(sorted(rows, key=lambda row: (row[0], row[1], row[2])))
+
+    print("Experiment {} finished in {:.2f}s, {} cells failed".format(exp_name, time.time() - start_time, failed))
+
+    if failed > 0:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main_sweep()
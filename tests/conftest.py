@@ -0,0 +1,30 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The simulator modules are imported from the root of the repository
+sys.path.insert(0, ROOT)
+
+
+@pytest.fixture(scope="session")
+def run_main():
+    """Run main.py with the arguments, the specs and the simulation parameters are files of tests/data if they are
+    not absolute paths"""
+    def run(path_result_files, specs="specs.json", simulation_parameters="simulation_parameters.json", random_seed="3",
+            extra_args=(), extra_env=None):
+        env = dict(os.environ, NSS_DEBUG="0", NSS_LOG_TOTAL_RESOURCES="0", NSS_SAVE_IMAGE_PLACEMENT="0")
+        env.update(extra_env or {})
+        subprocess.run(
+            [sys.executable, "-W", "ignore", "main.py",
+             "--specs", os.path.join(ROOT, "tests", "data", specs),
+             "--simulation_parameters", os.path.join(ROOT, "tests", "data", simulation_parameters),
+             "--path_result_files", str(path_result_files),
+             "--random_seed", random_seed] + list(extra_args),
+            cwd=ROOT, env=env, check=True, stdout=subprocess.DEVNULL, timeout=600
+        )
+
+    return run
@@ -0,0 +1,51 @@
+import json
+import os
+import random
+
+import numpy as np
+
+from Edge_Environment import Edge_Environment
+
+SPECS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "specs.json")
+
+
+def parameters(random_seed):
+    with open(SPECS) as file:
+        specs = json.load(file)
+
+    return dict(name="edge1", specs=specs, random_seed=random_seed, total_time=1000, time_window=500,
+                max_replacement_retries=0, replacement_backoff_slot_size=0)
+
+
+def build(random_seed, cache_path=None):
+    """The environment, its entities saved in CSV and the next random value after the generation"""
+    random.seed(random_seed)
+    np.random.seed(0)
+    if cache_path:
+        edge_environment = Edge_Environment.cached(cache_path, **parameters(random_seed))
+    else:
+        edge_environment = Edge_Environment(**parameters(random_seed))
+    return edge_environment, random.random(), np.random.random()
+
+
+def entities(edge_environment, path):
+    edge_environment.save_entities_csv(str(path))
+    return {name: (path / name).read_text() for name in sorted(os.listdir(str(path)))}
+
+
+def test_cache_hit_is_equal_to_a_fresh_build(tmp_path):
+    cache_path = str(tmp_path / "cache")
+
+    # The int seed of the config file is cached first, the str seed of the command line is another environment
+    build(200, cache_path)
+    cached, cached_random, cached_np_random = build("200", cache_path)
+    fresh, fresh_random, fresh_np_random = build("200")
+
+    assert len(os.listdir(cache_path)) == 2
+    assert entities(cached, tmp_path / "cached") == entities(fresh, tmp_path / "fresh")
+    assert (cached_random, cached_np_random) == (fresh_random, fresh_np_random)
+
+    # The hit of the cache
+    cached, cached_random, cached_np_random = build("200", cache_path)
+    assert entities(cached, tmp_path / "hit") == entities(fresh, tmp_path / "fresh")
+    assert (cached_random, cached_np_random) == (fresh_random, fresh_np_random)
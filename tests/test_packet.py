@@ -0,0 +1,31 @@
+from types import SimpleNamespace
+
+from Simulation_Entities.Packet import Packet
+from Simulation_Entities.Packet_Archive import Packet_Archive
+from Simulation_Entities.Packet_Table import Packet_Table
+
+SFC_REQUEST = SimpleNamespace(name="r_0", user=SimpleNamespace(name="u_0"))
+
+
+def test_list_of_the_packet_table_counts_the_packets_removed(capsys):
+    table = Packet_Table(capacity=2)
+    for packet_id in range(3):
+        table[(SFC_REQUEST.name, packet_id)] = table.create(packet_id, packet_id, SFC_REQUEST, 10, 1, 100)
+
+    # Only one packet is still in the simulation
+    del table[(SFC_REQUEST.name, 0)]
+    del table[(SFC_REQUEST.name, 1)]
+
+    Packet.list({}, table)
+
+    assert capsys.readouterr().out.splitlines()[0] == "Packets (3)"
+
+
+def test_list_counts_the_packets_and_the_archive(capsys):
+    archive = Packet_Archive()
+    archive.append(Packet(0, 0, SFC_REQUEST, 10, 1, 100))
+    packets = {(SFC_REQUEST.name, 1): Packet(1, 1, SFC_REQUEST, 10, 1, 100)}
+
+    Packet.list(packets, archive)
+
+    assert capsys.readouterr().out.splitlines()[0] == "Packets (2)"
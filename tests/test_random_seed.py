@@ -0,0 +1,38 @@
+import json
+import os
+import zlib
+
+from Edge_Entities.Random_Streams import Random_Streams
+from main import round_seed
+
+
+def test_int_seed():
+    assert Random_Streams.int_seed(12) == 12
+    assert Random_Streams.int_seed("12") == 12
+    assert Random_Streams.int_seed("abc") == zlib.crc32(b"abc")
+
+
+def test_round_seed():
+    assert round_seed("abc", 0) == "abc"
+    assert round_seed("abc", 2) == "abc_2"
+    assert round_seed("12", 2) == "14"
+    assert round_seed(12, 2) == 14
+
+
+def test_rounds_use_the_same_environment(tmp_path, run_main):
+    simulation_parameters = tmp_path / "simulation_parameters.json"
+    with open(os.path.join(os.path.dirname(__file__), "data", "simulation_parameters.json")) as file:
+        parameters = json.load(file)
+    del parameters["replication"]
+    parameters["simulation"]["num_rounds"] = 2
+    parameters["simulation"]["total_time"] = 1000
+    simulation_parameters.write_text(json.dumps(parameters))
+
+    run_main(tmp_path / "result", simulation_parameters=str(simulation_parameters))
+
+    rounds = [tmp_path / "result" / "Round_{}".format(i) for i in range(2)]
+    for entity in ["nodes.csv", "links.csv", "users.csv", "sfc_requests.csv", "data_source.csv"]:
+        assert (rounds[0] / "Entities" / entity).read_text() == (rounds[1] / "Entities" / entity).read_text()
+
+    # The packets of each round are generated with the round seed
+    assert (rounds[0] / "packets_entities.csv").read_text() != (rounds[1] / "packets_entities.csv").read_text()
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from Edge_Entities.Data_Source import Data_Source
+from Edge_Entities.Random_Streams import Random_Streams
+from Edge_Entities.Variate_Buffer import Variate_Buffer
+
+
+@pytest.fixture
+def streams(monkeypatch):
+    monkeypatch.setenv("NSS_RANDOM_STREAMS", "1")
+    monkeypatch.delenv("NSS_VARIATE_BUFFERS", raising=False)
+    Variate_Buffer.configure(3)
+    Random_Streams.configure(3)
+    yield
+    monkeypatch.delenv("NSS_RANDOM_STREAMS")
+    Random_Streams.configure(3)
+
+
+def data_source():
+    return Data_Source("ds_1", packet_size=300, packet_interval=5, packets_burst_interval=20, packets_burst_size=3)
+
+
+def test_flow_does_not_depend_on_the_other_flows_of_the_data_source(streams):
+    alone = data_source()
+    expected = [alone.get_packet_interval("sfc_request_1") for i in range(10)]
+
+    Random_Streams.configure(3)
+    shared = data_source()
+    values = []
+    for i in range(10):
+        shared.get_packet_interval("sfc_request_2")
+        values.append(shared.get_packet_interval("sfc_request_1"))
+
+    assert values == expected
+
+
+def test_closed_flow_releases_its_buffers(streams):
+    src = data_source()
+    src.get_packet_size("sfc_request_1")
+    src.get_packet_interval("sfc_request_2")
+
+    src.close_flow("sfc_request_1")
+
+    assert list(src.variate_buffers) == [("sfc_request_2", "packet_interval")]
+
+
+def test_keyed_draws_only_depend_on_the_key(streams):
+    key = ("sfc_request_1", 10, "vnf_1", "remote_data_access")
+    value = Random_Streams.keyed_random(Random_Streams.REMOTE_DATA, key)
+
+    for i in range(5):
+        Random_Streams.keyed_random(Random_Streams.REMOTE_DATA, ("sfc_request_1", i, "vnf_1", "remote_data_access"))
+    assert Random_Streams.keyed_random(Random_Streams.REMOTE_DATA, key) == value
+    assert 0 <= value < 1
+
+    assert Random_Streams.keyed_random(Random_Streams.ARRIVALS, key) != value
+    assert Random_Streams.keyed_random(Random_Streams.REMOTE_DATA, ("sfc_request_1", 11, "vnf_1", "remote_data_access")) != value
+
+
+def test_keyed_poisson_has_the_poisson_mean(streams):
+    for lam in [0.3, 4, 50]:
+        values = [Random_Streams.keyed_poisson(Random_Streams.REMOTE_DATA, lam, ("sfc_request_1", i)) for i in range(4000)]
+        assert np.mean(values) == pytest.approx(lam, rel=0.1)
+        assert np.var(values) == pytest.approx(lam, rel=0.15)
@@ -0,0 +1,43 @@
+import Result_Cache
+
+
+def key(tmp_path, random_seed=1):
+    specs = tmp_path / "specs.json"
+    specs.write_text("{}")
+    return Result_Cache.result_key(str(specs), str(specs), random_seed)[0]
+
+
+def test_seed_type_is_part_of_the_key(tmp_path):
+    assert key(tmp_path, 200) != key(tmp_path, "200")
+    assert key(tmp_path, "200") == key(tmp_path, "200")
+
+
+def test_instrumentation_does_not_change_the_key(tmp_path, monkeypatch):
+    base = key(tmp_path)
+
+    for name in ["NSS_PERF", "NSS_COUNTERS", "NSS_COUNTERS_INTERVAL", "NSS_MEMORY_REPORT", "NSS_MEMORY_REPORT_TIMES"]:
+        monkeypatch.setenv(name, "1")
+    assert key(tmp_path) == base
+
+    monkeypatch.setenv("NSS_RANDOM_STREAMS", "1")
+    assert key(tmp_path) != base
+
+
+def test_code_version_ignores_the_files_not_used_by_the_simulation(tmp_path, monkeypatch):
+    (tmp_path / "tests").mkdir()
+    for name in ["main.py", "run_sweep.py", "Simulation_Estimator.py", "benchmark_events.py", "tests/test_main.py"]:
+        (tmp_path / name).write_text("pass")
+
+    def code_version():
+        monkeypatch.setattr(Result_Cache, "code_digest", None)
+        return Result_Cache.code_version()
+
+    monkeypatch.setattr(Result_Cache, "__file__", str(tmp_path / "Result_Cache.py"))
+    version = code_version()
+
+    for name in ["run_sweep.py", "Simulation_Estimator.py", "benchmark_events.py", "tests/test_main.py"]:
+        (tmp_path / name).write_text("changed")
+        assert code_version() == version
+
+    (tmp_path / "main.py").write_text("changed")
+    assert code_version() != version
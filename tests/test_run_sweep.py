@@ -0,0 +1,25 @@
+import os
+
+import run_sweep
+
+
+def test_experiments_are_loaded_from_the_json_file():
+    experiments, environment = run_sweep.load_experiments()
+
+    assert experiments is not run_sweep.EXPERIMENTS
+    assert experiments == run_sweep.EXPERIMENTS
+    assert environment == run_sweep.DEFAULT_ENVIRONMENT
+    assert environment["NSS_DEBUG"] == "0"
+
+    for experiment in experiments.values():
+        assert experiment["envs"] and experiment["algs"]
+
+
+def test_files_of_the_scaling_experiment_exist():
+    experiment = run_sweep.EXPERIMENTS["Scaling"]
+    path_program = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    for name in experiment["envs"] + experiment["algs"]:
+        assert os.path.isfile(os.path.join(path_program, "Experiment", "Scaling", "{}.json".format(name)))
+
+    assert os.path.isfile(os.path.join(path_program, experiment["environment"]["PATH_PACKET_FLOW_FILE"]))
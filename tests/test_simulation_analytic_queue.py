@@ -0,0 +1,91 @@
+import random
+
+import simpy
+
+from Simulation_Analytic_Queue import Simulation_Analytic_Queue
+
+# Arrivals with packets arriving at the same time and while the server is busy
+ARRIVALS = [0, 0, 1, 3, 3, 3, 10, 25, 26, 26, 40, 41, 41, 60]
+
+
+def run(analytic):
+    """
+    Packets served by a single server, the service time is drawn when the service starts and it depends on the
+    CPU, that is scaled during the simulation. Another process draws from the same random generator at the same
+    times, thus a different order of the events changes the service times
+    """
+    env = simpy.Environment()
+    rng = random.Random(7)
+    state = {"cpu": 2.0}
+    log = []
+
+    resource = simpy.Resource(env, capacity=1)
+    queue = Simulation_Analytic_Queue(env)
+
+    def service(packet):
+        log.append(("start", packet, env.now))
+        yield env.timeout(int(rng.randint(1, 10) * 4 / state["cpu"]))
+
+    def packet_process(packet, arrival):
+        yield env.timeout(arrival)
+
+        if analytic:
+            turn = queue.request()
+            if turn is not None:
+                yield turn
+            yield from service(packet)
+            queue.release()
+        else:
+            with resource.request() as request:
+                yield request
+                yield from service(packet)
+
+        log.append(("departure", packet, env.now))
+
+    def noise():
+        # Draws in the same instants of the departures, before and after the turns of the next packet
+        for _ in range(80):
+            rng.random()
+            yield env.timeout(0)
+            rng.random()
+            yield env.timeout(1)
+
+    def scaling():
+        yield env.timeout(20)
+        state["cpu"] = 4.0
+
+    for packet, arrival in enumerate(ARRIVALS):
+        env.process(packet_process(packet, arrival))
+    env.process(noise())
+    env.process(scaling())
+    env.run()
+
+    return log
+
+
+def test_same_departures_of_the_resource():
+    resource_log = run(analytic=False)
+    analytic_log = run(analytic=True)
+
+    assert len([entry for entry in resource_log if entry[0] == "departure"]) == len(ARRIVALS)
+    assert analytic_log == resource_log
+
+
+def test_request_and_release():
+    env = simpy.Environment()
+    queue = Simulation_Analytic_Queue(env)
+
+    # The server is free and there is no other event now, the service starts without an event
+    assert queue.request() is None
+    assert queue.busy
+
+    turn = queue.request()
+    assert turn is not None and not turn.triggered
+    assert len(queue) == 1
+
+    # The next packet gets the server when the release event is processed
+    queue.release()
+    assert not queue.busy and not turn.triggered
+    env.run()
+    assert turn.processed
+    assert queue.busy and len(queue) == 0
@@ -0,0 +1,61 @@
+import simpy
+
+from Simulation_Arrival_Scheduler import Simulation_Arrival_Scheduler
+
+# The delays between the steps of each flow generator, with steps due at the same time of other flows
+FLOWS = [[0, 2, 2, 5], [1, 1, 0, 3], [2, 3, 1], [0, 0, 4]]
+
+
+def flow(name, delays, log, env):
+    for delay in delays:
+        log.append((name, env.now))
+        yield delay
+    log.append((name, env.now))
+
+
+def run(scheduler):
+    """Run the flows with the scheduler or as one simpy Process each, with other processes at the same times"""
+    env = simpy.Environment()
+    log = []
+
+    def other(name, delays):
+        for delay in delays:
+            log.append((name, env.now))
+            yield env.timeout(delay)
+
+    env.process(other("other_0", [1, 1, 2, 3]))
+
+    finished = []
+    arrival_scheduler = Simulation_Arrival_Scheduler(env, on_finish=lambda: finished.append(env.now))
+    for i, delays in enumerate(FLOWS):
+        generator = flow("flow_{}".format(i), delays, log, env)
+        if scheduler:
+            arrival_scheduler.add(generator)
+        else:
+            env.process(process(env, generator, finished))
+
+    env.process(other("other_1", [0, 2, 3, 1]))
+    env.run()
+
+    return log, finished
+
+
+def process(env, generator, finished):
+    """The simpy Process of a flow generator, as the flow generators were run before the scheduler"""
+    for delay in generator:
+        yield env.timeout(delay)
+    finished.append(env.now)
+
+
+def test_same_order_of_the_simpy_processes():
+    assert run(scheduler=True) == run(scheduler=False)
+
+
+def test_len():
+    env = simpy.Environment()
+    arrival_scheduler = Simulation_Arrival_Scheduler(env)
+    arrival_scheduler.add(flow("flow", [1, 1], [], env))
+    assert len(arrival_scheduler) == 1
+
+    env.run()
+    assert len(arrival_scheduler) == 0
@@ -0,0 +1,69 @@
+import json
+import os
+from types import SimpleNamespace
+
+import simpy
+
+from Simulation_Convergence_Monitor import Simulation_Convergence_Monitor
+
+
+def packet(packet_id, sla_violated=False, processed=False, active=False, delay=0):
+    return SimpleNamespace(packet_id=packet_id, sfc_request=SimpleNamespace(name="sfc_request_0"),
+                           sla_violated=sla_violated, processed=processed, active=active, delay=delay)
+
+
+def monitor(env):
+    edge_environment = SimpleNamespace(calc_resources_usage=lambda: {'cpu_allocated': 0})
+    return Simulation_Convergence_Monitor(env, edge_environment, interval=10, relative_width=0.05)
+
+
+def observations(monitor, kpi):
+    return [value for _, value in monitor.observations[kpi]]
+
+
+def test_slow_packets_are_observed_in_the_interval_of_the_deadline():
+    env = simpy.Environment()
+    m = monitor(env)
+    env.process(m.run())
+
+    slow = packet(1)
+
+    def packets():
+        m.observe_packet(packet(0, processed=True, delay=2))
+
+        yield env.timeout(5)
+        slow.sla_violated = True
+        m.observe_deadline(slow)
+
+        # The slow packet leaves the simulation in the next interval, its SLA violation is not counted again
+        yield env.timeout(10)
+        slow.processed = True
+        slow.delay = 15
+        m.observe_packet(slow)
+        m.observe_packet(packet(2, processed=True, delay=3))
+
+    env.process(packets())
+    env.run(until=21)
+
+    assert observations(m, "sla_violation_rate") == [0.5, 0.0]
+    assert observations(m, "delay_mean") == [2.0, 9.0]
+    assert m.packets_expired == set()
+
+
+def test_packets_in_the_simulation_at_the_end_are_in_the_last_observation(tmp_path):
+    env = simpy.Environment()
+    m = monitor(env)
+    env.process(m.run())
+    env.run(until=25)
+
+    # As Simulation.finish_simulation(), the packet still active has the delay until the end of the simulation
+    m.observe_deadline(packet(0, sla_violated=True, active=True))
+    m.observe_packet(packet(0, sla_violated=True, active=True, delay=24))
+    m.observe_packet(packet(1, active=True, delay=4))
+    m.save(str(tmp_path))
+
+    assert m.observations["sla_violation_rate"] == [(25, 0.5)]
+    assert m.observations["delay_mean"] == [(25, 14.0)]
+
+    with open(os.path.join(str(tmp_path), "convergence.json")) as file:
+        assert json.load(file)["stop_time"] == 25
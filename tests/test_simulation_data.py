@@ -0,0 +1,21 @@
+from Simulation_Data import Simulation_Data
+from Simulation_Event_Buffer import Simulation_Event_Buffer
+
+
+def test_events_to_csv_writes_the_last_events_first(tmp_path):
+    events = Simulation_Event_Buffer(["Event", "Time"])
+    for i, time in enumerate([1, 2.5, 12.0, 12.125]):
+        events.append(["EVENT_{}".format(i), time])
+    events.flush()
+
+    file_name = str(tmp_path / "events.csv")
+    Simulation_Data.events_to_csv(events.frame(), file_name)
+
+    with open(file_name) as file:
+        assert file.read().splitlines() == [
+            "Event;Time",
+            "EVENT_3;12.12",
+            "EVENT_2;12.00",
+            "EVENT_1;2.50",
+            "EVENT_0;1.00"
+        ]
@@ -0,0 +1,80 @@
+import numpy as np
+
+from Simulation_Event_Buffer import Simulation_Event_Buffer
+
+COLUMNS = ["Event", "Time", "Packet_ID"]
+
+
+def buffer(times, capacity=2):
+    events = Simulation_Event_Buffer(COLUMNS, capacity=capacity)
+    for i, time in enumerate(times):
+        events.append(["EVENT_{}".format(i), time, i])
+    events.flush()
+    return events
+
+
+def test_grow_keeps_the_rows():
+    events = buffer([0.5 * i for i in range(9)], capacity=2)
+
+    assert events.capacity == 16
+    assert len(events.data[events.time]) == 16
+
+    frame = events.frame()
+    assert list(frame["Time"]) == [0.5 * i for i in range(9)]
+    assert list(frame["Packet_ID"]) == list(range(9))
+    assert list(frame["Event"]) == ["EVENT_{}".format(i) for i in range(9)]
+    assert frame["Time"].dtype == np.float64
+    assert frame["Packet_ID"].dtype == np.int64
+
+
+def test_frame_has_only_the_rows_flushed():
+    events = buffer([1, 2])
+    events.append(["EVENT_2", 3, 2])
+
+    assert len(events) == 1
+    assert list(events.frame()["Time"]) == [1, 2]
+
+    events.flush()
+    assert len(events) == 0
+    assert list(events.frame()["Time"]) == [1, 2, 3]
+
+
+def test_time_window_bounds():
+    events = buffer([1, 2, 2, 3, 4, 4, 5])
+
+    assert list(events.time_window(2, 4)["Time"]) == [2, 2, 3]
+    assert list(events.time_window(2, 4, include_end=True)["Time"]) == [2, 2, 3, 4, 4]
+
+    # The rows keep their index in the buffer, as a mask of the DataFrame
+    assert list(events.time_window(2, 4).index) == [1, 2, 3]
+
+    assert len(events.time_window(0, 1)) == 0
+    assert len(events.time_window(6, 9, include_end=True)) == 0
+    assert len(events.time_window(4, 2)) == 0
+    assert list(events.time_window(0, 9)["Time"]) == [1, 2, 2, 3, 4, 4, 5]
+
+
+def test_time_window_of_events_not_in_time_order():
+    events = buffer([3, 1, 2, 2, 5])
+
+    assert not events.ordered
+    assert list(events.time_window(2, 3)["Time"]) == [2, 2]
+    assert list(events.time_window(2, 3, include_end=True)["Time"]) == [3, 2, 2]
+
+
+def test_clear():
+    events = buffer([1, 2, 0])
+    events.frame()
+
+    events.clear()
+
+    assert len(events) == 0
+    assert events.ordered
+    assert len(events.frame()) == 0
+    assert list(events.frame().columns) == COLUMNS
+
+    events.append(["EVENT_0", 7, 0])
+    events.flush()
+    frame = events.frame()
+    assert list(frame["Time"]) == [7]
+    assert list(frame["Event"]) == ["EVENT_0"]
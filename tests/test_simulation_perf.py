@@ -0,0 +1,62 @@
+import json
+import time
+
+import pytest
+
+import Simulation_Perf
+
+
+class Process:
+
+    def hop(self):
+        time.sleep(0.02)
+        yield 1
+        time.sleep(0.02)
+
+    def packet(self):
+        time.sleep(0.01)
+        yield from self.hop()
+        self.log()
+        yield 2
+
+    def log(self):
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def perf(monkeypatch):
+    monkeypatch.setenv("NSS_PERF", "1")
+    Simulation_Perf.configure()
+    yield
+    monkeypatch.delenv("NSS_PERF")
+    Simulation_Perf.configure()
+
+
+def test_phases_are_self_time(perf):
+    process = Process()
+    Simulation_Perf.instrument(process, "hop", "packet.hop")
+    Simulation_Perf.instrument(process, "packet", "packet.process")
+    Simulation_Perf.instrument(process, "log", "packet.log")
+
+    start = time.perf_counter()
+    for event in process.packet():
+        pass
+    wall_time = time.perf_counter() - start
+
+    phases = Simulation_Perf.phases
+    assert phases["packet.hop"][1] == pytest.approx(0.04, abs=0.01)
+    assert phases["packet.log"][1] == pytest.approx(0.01, abs=0.01)
+    assert phases["packet.process"][1] == pytest.approx(0.01, abs=0.01)
+    assert sum(seconds for calls, seconds in phases.values()) <= wall_time
+    assert Simulation_Perf.running == []
+
+
+def test_perf_json_sum_of_phases(run_main, tmp_path):
+    run_main(tmp_path / "result", extra_env={"NSS_PERF": "1"})
+
+    with open(tmp_path / "result" / "Round_0" / "perf.json") as file:
+        perf_json = json.load(file)
+
+    assert perf_json["phases_time"] == "self"
+    assert perf_json["phases_seconds"] == pytest.approx(sum(phase["seconds"] for phase in perf_json["phases"].values()))
+    assert perf_json["phases_seconds"] <= perf_json["wall_time"]
@@ -0,0 +1,143 @@
+import inspect
+import math
+
+import numpy as np
+import pytest
+
+import main
+from Simulation_Convergence_Monitor import t_quantile
+from Simulation_Replication import Simulation_Replication
+
+
+def test_from_parameters_uses_the_defaults_of_init():
+    defaults = inspect.signature(Simulation_Replication.__init__).parameters
+
+    replication = Simulation_Replication.from_parameters({"relative_width": 0.1})
+
+    assert replication.relative_width == 0.1
+    assert replication.min_rounds == defaults["min_rounds"].default
+    assert replication.max_rounds == defaults["max_rounds"].default
+    assert replication.confidence == defaults["confidence"].default
+
+
+def test_from_parameters_reads_the_block():
+    replication = Simulation_Replication.from_parameters({
+        "relative_width": 0.05, "min_rounds": 3, "max_rounds": 7, "confidence": 0.9, "metrics": ["drop_rate"]
+    })
+
+    assert (replication.min_rounds, replication.max_rounds, replication.confidence) == (3, 7, 0.9)
+    assert replication.metrics == ["drop_rate"]
+
+
+def replication(**parameters):
+    return Simulation_Replication.from_parameters(dict({"relative_width": 0.1, "metrics": ["delay_mean"]}, **parameters))
+
+
+def run(replication, values):
+    """Add the rounds with the values of delay_mean until the replication finishes, return the rounds executed"""
+    for i, value in enumerate(values):
+        if replication.finished():
+            break
+        replication.add_round(i, {"delay_mean": value})
+    else:
+        replication.finished()
+    return len(replication.rounds)
+
+
+def test_add_round_updates_the_mean_and_the_variance():
+    values = [10.0, 12.5, 9.0, 14.0, 11.5]
+    r = replication()
+    for i, value in enumerate(values):
+        r.add_round(i, {"delay_mean": value})
+
+    # The metrics without a value in a round (e.g. no packet processed) are not counted
+    r.add_round(5, {"delay_mean": None})
+
+    count, mean, m2 = r.statistics["delay_mean"]
+    assert count == 5
+    assert mean == pytest.approx(np.mean(values))
+    assert m2 / (count - 1) == pytest.approx(np.var(values, ddof=1))
+
+
+@pytest.mark.parametrize("confidence, df, quantile", [
+    (0.95, 1, 12.706), (0.95, 2, 4.303), (0.95, 4, 2.776), (0.95, 9, 2.262), (0.95, 29, 2.045), (0.9, 4, 2.132)
+])
+def test_t_quantile(confidence, df, quantile):
+    assert t_quantile((1 + confidence) / 2, df) == pytest.approx(quantile, rel=5e-3)
+
+
+def test_estimate_is_the_t_confidence_interval():
+    values = [10.0, 12.5, 9.0, 14.0, 11.5]
+    r = replication()
+    for i, value in enumerate(values):
+        r.add_round(i, {"delay_mean": value})
+
+    estimate = r.estimate("delay_mean")
+    half_width = t_quantile(0.975, 4) * np.std(values, ddof=1) / math.sqrt(5)
+    assert estimate["rounds"] == 5
+    assert estimate["half_width"] == pytest.approx(half_width)
+    assert estimate["relative_width"] == pytest.approx(half_width / np.mean(values))
+
+    # With one round the interval is not defined
+    r = replication()
+    r.add_round(0, {"delay_mean": 10.0})
+    assert r.estimate("delay_mean")["half_width"] == math.inf
+    assert r.estimate("delay_mean")["relative_width"] == math.inf
+
+
+def test_finished_stops_when_the_interval_is_narrow():
+    # The relative widths after the rounds 2, 3 and 4 are 0.37, 0.14 and 0.07
+    values = [10.0, 10.6, 9.5, 10.2, 10.1, 9.9]
+    r = replication()
+    assert run(r, values) == 4
+    assert r.stop_reason == "converged"
+    assert r.estimate("delay_mean")["relative_width"] <= 0.1
+
+
+def test_finished_respects_min_and_max_rounds():
+    # Identical rounds converge at once, but not before min_rounds
+    r = replication(min_rounds=4)
+    assert run(r, [10.0] * 10) == 4
+    assert r.stop_reason == "converged"
+
+    # min_rounds is at least 2, a variance needs 2 rounds
+    r = replication(min_rounds=1)
+    assert run(r, [10.0] * 10) == 2
+
+    # The values never converge
+    r = replication(max_rounds=5)
+    assert run(r, [1.0, 100.0] * 10) == 5
+    assert r.stop_reason == "max_rounds"
+
+
+def test_finished_with_zero_mean():
+    # A metric always 0 (e.g. no SLA violation) has no width, it converges
+    r = replication()
+    assert run(r, [0.0] * 10) == 2
+    assert r.stop_reason == "converged"
+
+    # A zero mean with some width never converges
+    r = replication(max_rounds=6)
+    assert run(r, [1.0, -1.0] * 10) == 6
+    assert r.stop_reason == "max_rounds"
+
+
+@pytest.mark.parametrize("workers, min_rounds, values, batches", [
+    # The first batch has min_rounds rounds, the next ones the number of workers, until max_rounds
+    (3, 2, [1.0, 100.0] * 10, [[0, 1, 2], [3, 4, 5], [6]]),
+    (1, 4, [1.0, 100.0] * 10, [[0, 1, 2, 3], [4], [5], [6]]),
+    # It converged after the first batch
+    (4, 2, [10.0] * 10, [[0, 1, 2, 3]]),
+])
+def test_run_replication_in_pool_runs_the_rounds_in_batches(monkeypatch, workers, min_rounds, values, batches):
+    executed = []
+    monkeypatch.setattr(main, "run_rounds_in_pool", lambda argv, rounds, workers: executed.append(list(rounds)))
+    monkeypatch.setattr(main.Simulation_Round_Summary, "load",
+                        lambda path: {"delay_mean": values[int(path.rsplit("_", 1)[1])]})
+
+    r = replication(min_rounds=min_rounds, max_rounds=7)
+    main.run_replication_in_pool([], r, workers, "results")
+
+    assert executed == batches
+    assert [i for i, _ in r.rounds] == [i for batch in batches for i in batch]
+    assert r.stop_reason == ("converged" if len(set(values)) == 1 else "max_rounds")
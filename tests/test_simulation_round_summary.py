@@ -0,0 +1,31 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture(scope="module")
+def round_path(tmp_path_factory, run_main):
+    path = tmp_path_factory.mktemp("round_summary")
+    run_main(path)
+    return os.path.join(str(path), "Round_0")
+
+
+def test_summary_has_the_packets_of_the_csv(round_path):
+    with open(os.path.join(round_path, "summary.json")) as file:
+        summary = json.load(file)
+
+    packets = pd.read_csv(os.path.join(round_path, "packets_entities.csv"), sep=";")
+
+    # The round must finish with packets in the simulation, they are the packets the summary could miss
+    assert packets["Active"].any()
+
+    delays = packets.loc[packets["Processed"] | packets["Active"], "Delay"]
+
+    assert summary["packets"] == len(packets)
+    assert summary["sla_violation_rate"] == pytest.approx(packets["SLA_Violated"].mean())
+    assert summary["drop_rate"] == pytest.approx(packets["Dropped"].mean())
+    assert summary["delay_mean"] == pytest.approx(delays.mean())
+    assert summary["delay_p95"] == pytest.approx(np.percentile(delays, 95))
@@ -0,0 +1,47 @@
+import simpy
+from simpy.events import NORMAL, URGENT
+
+import Simulation_SimPy
+from Simulation_SimPy import next_key, queue_entries, queue_length, reserve_eid, triggered_event, triggered_event_at
+
+
+def test_supported_version():
+    assert Simulation_SimPy.simpy_version() in Simulation_SimPy.SUPPORTED_VERSIONS
+
+
+def test_queue_layout():
+    env = simpy.Environment()
+    assert next_key(env) is None
+    assert queue_length(env) == 0
+
+    timeout = env.timeout(3)
+    event = triggered_event(env, URGENT, 3)
+
+    # The entries are (time, priority, eid, event), the URGENT event is the first of the time 3
+    assert queue_length(env) == 2
+    assert next_key(env)[:2] == (3, URGENT)
+    assert {entry[3] for entry in queue_entries(env)} == {timeout, event}
+    assert all(len(entry) == 4 for entry in queue_entries(env))
+
+
+def test_reserved_eid_keeps_the_order():
+    env = simpy.Environment()
+    order = []
+
+    eid = reserve_eid(env)
+    env.timeout(1).callbacks.append(lambda event: order.append("timeout"))
+
+    # Scheduled after the timeout, but with the eid reserved before it
+    triggered_event_at(env, (1, NORMAL, eid)).callbacks.append(lambda event: order.append("reserved"))
+    env.run()
+
+    assert order == ["reserved", "timeout"]
+
+
+def test_triggered_event_value():
+    env = simpy.Environment()
+    event = triggered_event(env, NORMAL, 2)
+    assert event.triggered
+    env.run()
+    assert event.ok and event.value is None
+    assert env.now == 2
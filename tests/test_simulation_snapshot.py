@@ -0,0 +1,33 @@
+import os
+import time
+
+import pytest
+
+import Simulation_Snapshot
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="os.fork is not available")
+
+
+def test_fork_bounds_the_children(tmp_path):
+    def run_variant(variant):
+        with open(os.path.join(str(tmp_path), variant), "w") as file:
+            file.write("{} ".format(time.time()))
+            time.sleep(0.2)
+            file.write("{}".format(time.time()))
+
+        if variant == "v_fail":
+            raise ValueError("variant failed")
+
+    variants = ["v_0", "v_1", "v_fail", "v_3", "v_4"]
+    failed = Simulation_Snapshot.fork(variants, run_variant, workers=2)
+
+    assert failed == ["v_fail"]
+
+    intervals = []
+    for variant in variants:
+        with open(os.path.join(str(tmp_path), variant)) as file:
+            intervals.append([float(value) for value in file.read().split()])
+
+    # The number of variants running at the start of each variant
+    for start, _ in intervals:
+        assert sum(1 for other_start, other_end in intervals if other_start <= start < other_end) <= 2
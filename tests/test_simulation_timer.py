@@ -0,0 +1,168 @@
+from types import SimpleNamespace
+
+import simpy
+
+from Simulation_Timer import LATE, Simulation_Timer, late_timeout, yield_turn
+
+
+def sfc_instance(timeout, active=True):
+    return SimpleNamespace(active=active, timeout=timeout)
+
+
+def vnf_instance(timeout=-1, startup=-1, shutdown=-1, active=True, sfc_instances=None, vnf_timeout=10):
+    return SimpleNamespace(active=active, timeout=timeout, startup_remain_time=startup, shutdown_remain_time=shutdown,
+                           accept_sfc_instances=shutdown < 0, sfc_instances=sfc_instances or [],
+                           vnf=SimpleNamespace(timeout=vnf_timeout))
+
+
+def timer(sfc_instances=(), vnf_instances=(), tick=0):
+    edge_environment = SimpleNamespace(sfc_instances=list(sfc_instances), vnf_instances=list(vnf_instances))
+    timer = Simulation_Timer(edge_environment)
+    timer.track(tick)
+    return timer
+
+
+def test_track_and_next_deadline():
+    assert timer().next_deadline() is None
+
+    t = timer([sfc_instance(5), sfc_instance(2, active=False)], [vnf_instance(startup=3), vnf_instance(timeout=-1)])
+
+    # The inactive SFC Instance and the finished VNF Instance timeout are not tracked
+    assert t.next_deadline() == 3
+    assert len(t.countdowns) == 2
+
+
+def test_track_from_a_later_tick():
+    t = timer([sfc_instance(5)], tick=10)
+    assert t.next_deadline() == 15
+
+
+def test_expire_returns_the_countdowns_of_the_tick():
+    sfc = sfc_instance(5)
+    vnf = vnf_instance(startup=3)
+    t = timer([sfc], [vnf])
+
+    assert list(t.expire(2)) == []
+    assert list(t.expire(3)) == [(Simulation_Timer.VNF_INSTANCE_STARTUP, vnf)]
+    assert vnf.startup_remain_time == -1
+
+    assert list(t.expire(5)) == [(Simulation_Timer.SFC_INSTANCE_TIMEOUT, sfc)]
+    assert sfc.timeout == 0
+    assert t.next_deadline() is None
+
+
+def test_expire_order_of_the_same_tick():
+    sfc_1, sfc_2 = sfc_instance(4), sfc_instance(4)
+    vnf = vnf_instance(timeout=4)
+    t = timer([sfc_1, sfc_2], [vnf])
+
+    # Kind first and then the position in the edge environment lists, as the per millisecond loop
+    assert list(t.expire(4)) == [
+        (Simulation_Timer.SFC_INSTANCE_TIMEOUT, sfc_1),
+        (Simulation_Timer.SFC_INSTANCE_TIMEOUT, sfc_2),
+        (Simulation_Timer.VNF_INSTANCE_TIMEOUT, vnf)
+    ]
+
+
+def test_expire_skips_the_ticks_without_deadline():
+    sfc = sfc_instance(3)
+    t = timer([sfc])
+
+    assert [entity for _, entity in t.expire(100)] == [sfc]
+    # The timeout of the SFC Instance is the value in the tick of the deadline
+    assert sfc.timeout == 0
+
+
+def test_sfc_instance_timeout_zero_expires_in_the_next_tick():
+    sfc = sfc_instance(0)
+    t = timer([sfc])
+
+    assert t.next_deadline() == 1
+    assert list(t.expire(1)) == [(Simulation_Timer.SFC_INSTANCE_TIMEOUT, sfc)]
+
+
+def test_reset_postpones_the_deadline():
+    sfc = sfc_instance(5)
+    t = timer([sfc])
+
+    list(t.expire(3))
+    sfc.timeout = 5
+    t.reset(Simulation_Timer.SFC_INSTANCE_TIMEOUT, sfc)
+
+    # The old entry does not expire the countdown, it is pushed again with the new deadline
+    assert list(t.expire(5)) == []
+    assert t.next_deadline() == 8
+    assert len(t.deadlines) == 1
+    assert list(t.expire(8)) == [(Simulation_Timer.SFC_INSTANCE_TIMEOUT, sfc)]
+
+
+def test_remain_time():
+    sfc = sfc_instance(5)
+    untracked = sfc_instance(7, active=False)
+    t = timer([sfc, untracked])
+
+    assert t.remain_time(Simulation_Timer.SFC_INSTANCE_TIMEOUT, sfc) == 5
+    list(t.expire(2))
+    assert t.remain_time(Simulation_Timer.SFC_INSTANCE_TIMEOUT, sfc) == 3
+
+    # The countdowns that are not tracked are read from the entity
+    assert t.remain_time(Simulation_Timer.SFC_INSTANCE_TIMEOUT, untracked) == 7
+
+
+def test_sync_writes_the_attributes():
+    sfc = sfc_instance(5)
+    vnf = vnf_instance(shutdown=6)
+    t = timer([sfc], [vnf])
+
+    list(t.expire(2))
+    t.sync(2)
+
+    assert sfc.timeout == 3
+    assert vnf.shutdown_remain_time == 4
+
+
+def test_vnf_instance_with_sfc_instances_holds_the_timeout():
+    vnf = vnf_instance(timeout=4, sfc_instances=["si_0"], vnf_timeout=10)
+    t = timer([], [vnf])
+
+    assert t.next_deadline() is None
+
+    # The timeout is restarted every tick while the VNF Instance has SFC Instances
+    t.sync(0)
+    assert vnf.timeout == 4
+    t.sync(5)
+    assert vnf.timeout == 10
+
+    # It starts from the VNF timeout in the previous tick when the last SFC Instance is removed
+    list(t.expire(5))
+    t.release_vnf_instance(vnf)
+    assert t.next_deadline() == 14
+    assert list(t.expire(14)) == [(Simulation_Timer.VNF_INSTANCE_TIMEOUT, vnf)]
+    assert vnf.timeout == -1
+
+
+def test_late_timeout_runs_after_the_events_of_the_same_time():
+    env = simpy.Environment()
+    order = []
+
+    def process(name, event):
+        yield event
+        order.append(name)
+
+    env.process(process("late", late_timeout(env, 1)))
+    env.process(process("normal", env.timeout(1)))
+    env.run()
+
+    assert order == ["normal", "late"]
+    assert LATE > simpy.events.NORMAL
+
+
+def test_yield_turn():
+    env = simpy.Environment()
+    # No event in the current time
+    assert yield_turn(env, simpy.events.NORMAL) is None
+
+    env.timeout(0)
+    assert yield_turn(env, simpy.events.NORMAL) is not None
+    # The event waiting has a lower priority (higher value) than URGENT
+    assert yield_turn(env, simpy.events.URGENT) is None